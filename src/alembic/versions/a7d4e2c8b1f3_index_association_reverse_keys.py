@@ -0,0 +1,46 @@
+"""index reverse keys of association tables
+
+Revision ID: a7d4e2c8b1f3
+Revises: f3a9c1d2e4b5
+Create Date: 2026-10-15 23:50:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d4e2c8b1f3'
+down_revision: Union[str, Sequence[str], None] = 'f3a9c1d2e4b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Составные первичные ключи покрывают только поиск по первой колонке
+    op.create_index(
+        op.f('ix_cafemanager_user_id'),
+        'cafemanager',
+        ['user_id'],
+        unique=False,
+    )
+    op.create_index(
+        op.f('ix_dishcafe_cafe_id'),
+        'dishcafe',
+        ['cafe_id'],
+        unique=False,
+    )
+    op.create_index(
+        op.f('ix_actioncafe_cafe_id'),
+        'actioncafe',
+        ['cafe_id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_actioncafe_cafe_id'), table_name='actioncafe')
+    op.drop_index(op.f('ix_dishcafe_cafe_id'), table_name='dishcafe')
+    op.drop_index(op.f('ix_cafemanager_user_id'), table_name='cafemanager')
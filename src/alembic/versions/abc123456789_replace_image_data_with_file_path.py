@@ -9,7 +9,6 @@ from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
-from sqlalchemy.dialects import postgresql
 
 # revision identifiers, used by Alembic.
 revision: str = 'abc123456789'
@@ -17,6 +16,10 @@ down_revision: Union[str, Sequence[str], None] = '5daf9214ee91'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Размер пачки при переносе данных: короткие транзакции вместо одной
+# на всю таблицу
+BACKFILL_BATCH_SIZE = 10000
+
 
 def upgrade() -> None:
     """Upgrade schema."""
@@ -26,29 +29,52 @@ def upgrade() -> None:
     )
 
     # Update existing records with a default path (if any exist)
-    # This is a placeholder - in production you'd migrate data properly
+    # This is a placeholder - in production you'd migrate data properly.
+    # Rows are migrated in bounded batches, each committed separately,
+    # so that locks are short-lived and WAL does not spike.
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        bind.execute(
+            sa.text(
+                'CREATE INDEX CONCURRENTLY IF NOT EXISTS '
+                'ix_media_file_path_null ON media (id) '
+                'WHERE file_path IS NULL'
+            )
+        )
+        backfill = sa.text(
+            "UPDATE media SET file_path = 'media/migrated_' || id::text "
+            "|| '.jpg' "
+            'WHERE id IN ('
+            'SELECT id FROM media '
+            'WHERE file_path IS NULL AND image_data IS NOT NULL '
+            'LIMIT :batch_size'
+            ')'
+        )
+        while True:
+            result = bind.execute(
+                backfill,
+                {'batch_size': BACKFILL_BATCH_SIZE},
+            )
+            if result.rowcount == 0:
+                break
+        bind.execute(
+            sa.text('DROP INDEX CONCURRENTLY IF EXISTS ix_media_file_path_null')
+        )
+
+    # Make the column NOT NULL and remove the image_data column
+    # in a single ALTER TABLE statement
     op.execute(
-        "UPDATE media SET file_path = 'media/migrated_' || id::text || '.jpg' "
-        "WHERE file_path IS NULL"
+        'ALTER TABLE media '
+        'ALTER COLUMN file_path SET NOT NULL, '
+        'DROP COLUMN image_data'
     )
 
-    # Now make the column NOT NULL
-    op.alter_column('media', 'file_path', nullable=False)
-
-    # Finally, remove the image_data column
-    op.drop_column('media', 'image_data')
-
 
 def downgrade() -> None:
     """Downgrade schema."""
     # Add back image_data column and remove file_path column
-    op.drop_column('media', 'file_path')
-    op.add_column(
-        'media',
-        sa.Column(
-            'image_data',
-            postgresql.BYTEA(),
-            autoincrement=False,
-            nullable=False,
-        ),
+    op.execute(
+        'ALTER TABLE media '
+        'DROP COLUMN file_path, '
+        'ADD COLUMN image_data BYTEA NOT NULL'
     )
@@ -0,0 +1,33 @@
+"""partial index on active bookings
+
+Revision ID: c5d8e2f4a6b1
+Revises: a7d4e2c8b1f3
+Create Date: 2026-10-16 01:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5d8e2f4a6b1'
+down_revision: Union[str, Sequence[str], None] = 'a7d4e2c8b1f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_booking_active_cafe_date',
+        'booking',
+        ['cafe_id', 'booking_date'],
+        unique=False,
+        postgresql_where=sa.text('is_active'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_booking_active_cafe_date', table_name='booking')
@@ -0,0 +1,38 @@
+"""add content_sha256 to media table
+
+Revision ID: f3a9c1d2e4b5
+Revises: abc123456789
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a9c1d2e4b5'
+down_revision: Union[str, Sequence[str], None] = 'abc123456789'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing rows keep NULL: they are never matched as duplicates
+    op.add_column(
+        'media',
+        sa.Column('content_sha256', sa.LargeBinary(length=32), nullable=True),
+    )
+    op.create_index(
+        'ix_media_content_sha256',
+        'media',
+        ['content_sha256'],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_media_content_sha256', table_name='media')
+    op.drop_column('media', 'content_sha256')
@@ -1,33 +1,30 @@
-from .action import router as action_router
-from .auth import router as auth_router
-from .booking import router as booking_router
-from .cafe import router as cafe_router
-from .dish import router as dish_router
-from .media import router as media_router
-from .slot import router as slot_router
-from .table import router as table_router
-from .user import router as user_router
+from importlib import import_module
+from typing import Any
 
-__all__ = [
-    'auth_router',
-    'user_router',
-    'cafe_router',
-    'table_router',
-    'slot_router',
-    'booking_router',
-    'action_router',
-    'dish_router',
-    'media_router',
-]
+# Имя роутера -> модуль эндпоинтов, в порядке подключения к приложению
+_ROUTER_MODULES = {
+    'auth_router': 'auth',
+    'user_router': 'user',
+    'cafe_router': 'cafe',
+    'table_router': 'table',
+    'slot_router': 'slot',
+    'booking_router': 'booking',
+    'action_router': 'action',
+    'dish_router': 'dish',
+    'media_router': 'media',
+}
 
-routers = [
-    auth_router,
-    user_router,
-    cafe_router,
-    table_router,
-    slot_router,
-    booking_router,
-    action_router,
-    dish_router,
-    media_router,
-]
+__all__ = list(_ROUTER_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    """Лениво импортирует модуль эндпоинтов при обращении к роутеру."""
+    if name == 'routers':
+        value = [__getattr__(router_name) for router_name in _ROUTER_MODULES]
+    elif name in _ROUTER_MODULES:
+        module = import_module(f'.{_ROUTER_MODULES[name]}', __name__)
+        value = module.router
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    globals()[name] = value
+    return value
@@ -1,23 +1,38 @@
 from typing import Annotated, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import (
+    APIRouter,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
 from loguru import logger
+from pydantic import TypeAdapter
 
-from app.core.auth import role_checker
 from app.core.db import DbSession
-from app.core.dependencies import CacheServiceDep
+from app.core.dependencies import AnyUserDep, CacheServiceDep, StaffDep
+from app.core.exceptions import DomainValidationError, NotFoundError
 from app.models.user import User
 from app.repositories.action import action_repository
 from app.schemas.action import ActionCreate, ActionInfo, ActionUpdate
 from app.schemas.common import ErrorResponse
+from app.services.cache_service import ACTIONS_CACHE_TAG
 from app.services.cache_service import CacheService as CacheServiceType
-from app.utils.enums import UserRole
-from app.utils.http import build_error
+from app.utils.http import (
+    build_error,
+    json_response_with_etag,
+    orm_json_response,
+)
 from app.utils.logging_decorator import event_logger
 
 router = APIRouter(prefix='/actions', tags=['Акции'])
 
+_ACTION_ADAPTER = TypeAdapter(ActionInfo)
+_ACTIONS_ADAPTER = TypeAdapter(list[ActionInfo])
+
 
 def _get_actions_cache_key(show_all: bool, cafe_id: Optional[UUID]) -> str:
     """Генерация ключа кеша для списка акций."""
@@ -40,38 +55,40 @@ def _get_action_cache_key(action_id: UUID) -> str:
     },
 )
 async def get_all_actions(
+    request: Request,
     session: DbSession,
-    current_user: Annotated[
-        User,
-        Depends(
-            role_checker([UserRole.MANAGER, UserRole.ADMIN, UserRole.USER]),
-        ),
-    ],
+    current_user: Annotated[User, AnyUserDep],
     cache: CacheServiceType = CacheServiceDep,
     show_all: bool = Query(False, description='Показывать все акции?'),
     cafe_id: UUID = Query(None, description='ID кафе'),
-) -> list[ActionInfo]:
-    """Получает список всех акций с кешированием."""
+) -> Response:
+    """Получает список всех акций с кешированием.
+
+    В кеше хранится готовый JSON, поэтому при попадании ответ отдаётся
+    без повторной валидации и сериализации. Если ETag совпадает с
+    If-None-Match, возвращается 304 без тела.
+    """
     try:
         cache_key = _get_actions_cache_key(show_all, cafe_id)
-        cached_actions_data = await cache.get(cache_key)
-        if cached_actions_data is not None:
-            logger.debug(f'Кеш попадание для акций: {cache_key}')
-            return [
-                ActionInfo.model_validate(action_data)
-                for action_data in cached_actions_data
-            ]
-        logger.debug(f'Кеш промах для акций: {cache_key}')
+        cached_actions = await cache.get_raw(cache_key)
+        if cached_actions is not None:
+            logger.debug('Кеш попадание для акций: {}', cache_key)
+            return json_response_with_etag(request, cached_actions)
+        logger.debug('Кеш промах для акций: {}', cache_key)
         db_actions = await action_repository.get_multi_with_cafes(
             session,
             show_all=show_all,
             cafe_id=cafe_id,
         )
-        actions = [ActionInfo.model_validate(action) for action in db_actions]
-        await cache.set(cache_key, [action.model_dump() for action in actions])
-        return actions
+        actions = _ACTIONS_ADAPTER.validate_python(
+            db_actions,
+            from_attributes=True,
+        )
+        raw_actions = _ACTIONS_ADAPTER.dump_json(actions)
+        await cache.set_raw(cache_key, raw_actions, tag=ACTIONS_CACHE_TAG)
+        return json_response_with_etag(request, raw_actions)
     except Exception as e:
-        logger.error(f'Ошибка при получении списка акций: {str(e)}')
+        logger.error('Ошибка при получении списка акций: {}', e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=build_error(
@@ -95,35 +112,37 @@ async def get_all_actions(
 async def create_action(
     action_data: ActionCreate,
     session: DbSession,
-    current_user: Annotated[
-        User,
-        Depends(role_checker([UserRole.MANAGER, UserRole.ADMIN])),
-    ],
+    current_user: Annotated[User, StaffDep],
     cache: CacheServiceType = CacheServiceDep,
-) -> ActionInfo:
+) -> Response:
     """Создает новую акцию и инвалидирует кеш."""
     try:
         db_action = await action_repository.create_with_cafes(
             session,
             action_data,
         )
-        action = ActionInfo.model_validate(db_action)
+        response = orm_json_response(
+            _ACTION_ADAPTER,
+            db_action,
+            status.HTTP_201_CREATED,
+        )
         await cache.clear_actions_cache()
         logger.info('Кеш акций инвалидирован после создания новой акции')
-        return action
-    except ValueError as e:
-        logger.error(f'Ошибка создания акции: {str(e)}')
-        error_code = (
-            status.HTTP_404_NOT_FOUND
-            if 'не найд' in str(e).lower()
-            else status.HTTP_400_BAD_REQUEST
+        return response
+    except NotFoundError as e:
+        logger.error('Ошибка создания акции: {}', e)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=build_error(str(e), status.HTTP_404_NOT_FOUND),
         )
+    except DomainValidationError as e:
+        logger.error('Ошибка создания акции: {}', e)
         raise HTTPException(
-            status_code=error_code,
-            detail=build_error(str(e), error_code),
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=build_error(str(e), status.HTTP_400_BAD_REQUEST),
         )
     except Exception as e:
-        logger.error(f'Неожиданная ошибка при создании акции: {str(e)}')
+        logger.error('Неожиданная ошибка при создании акции: {}', e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=build_error(
@@ -142,27 +161,30 @@ async def create_action(
     },
 )
 async def get_action_by_id(
+    request: Request,
     action_id: UUID,
     session: DbSession,
-    current_user: Annotated[
-        User,
-        Depends(
-            role_checker([UserRole.MANAGER, UserRole.ADMIN, UserRole.USER]),
-        ),
-    ],
+    current_user: Annotated[User, AnyUserDep],
     cache: CacheServiceType = CacheServiceDep,
-) -> ActionInfo:
-    """Получает информацию об акции по её идентификатору с кешированием."""
+) -> Response:
+    """Получает информацию об акции по её идентификатору с кешированием.
+
+    Сначала проверяется локальный кеш воркера, затем Redis и база.
+    """
+    local_action = cache.local_actions.get(action_id)
+    if local_action is not None:
+        return json_response_with_etag(request, local_action)
     try:
         cache_key = _get_action_cache_key(action_id)
-        cached_action_data = await cache.get(cache_key)
-        if cached_action_data is not None:
-            logger.debug(f'Кеш попадание для акции: {cache_key}')
-            return ActionInfo.model_validate(cached_action_data)
-        logger.debug(f'Кеш промах для акции: {cache_key}')
+        cached_action = await cache.get_raw(cache_key)
+        if cached_action is not None:
+            logger.debug('Кеш попадание для акции: {}', cache_key)
+            cache.local_actions.set(action_id, cached_action)
+            return json_response_with_etag(request, cached_action)
+        logger.debug('Кеш промах для акции: {}', cache_key)
         db_action = await action_repository.get_with_cafes(session, action_id)
         if not db_action:
-            logger.warning(f'Акция {action_id} не найдена')
+            logger.warning('Акция {} не найдена', action_id)
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=build_error(
@@ -170,13 +192,16 @@ async def get_action_by_id(
                     status.HTTP_404_NOT_FOUND,
                 ),
             )
-        action = ActionInfo.model_validate(db_action)
-        await cache.set(cache_key, action.model_dump())
-        return action
+        raw_action = _ACTION_ADAPTER.dump_json(
+            _ACTION_ADAPTER.validate_python(db_action, from_attributes=True),
+        )
+        await cache.set_raw(cache_key, raw_action, tag=ACTIONS_CACHE_TAG)
+        cache.local_actions.set(action_id, raw_action)
+        return json_response_with_etag(request, raw_action)
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f'Ошибка при получении акции {action_id}: {str(e)}')
+        logger.error('Ошибка при получении акции {}: {}', action_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=build_error(
@@ -200,17 +225,14 @@ async def update_action(
     action_id: UUID,
     update_data: ActionUpdate,
     session: DbSession,
-    current_user: Annotated[
-        User,
-        Depends(role_checker([UserRole.MANAGER, UserRole.ADMIN])),
-    ],
+    current_user: Annotated[User, StaffDep],
     cache: CacheServiceType = CacheServiceDep,
-) -> ActionInfo:
+) -> Response:
     """Обновляет информацию об акции и инвалидирует кеш."""
     try:
         db_action = await action_repository.get_with_cafes(session, action_id)
         if not db_action:
-            logger.warning(f'Акция {action_id} не найдена для обновления')
+            logger.warning('Акция {} не найдена для обновления', action_id)
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=build_error(
@@ -223,29 +245,32 @@ async def update_action(
             db_action,
             update_data,
         )
-        action = ActionInfo.model_validate(updated_db_action)
-        await cache.delete(_get_action_cache_key(action_id))
+        response = orm_json_response(_ACTION_ADAPTER, updated_db_action)
         await cache.clear_actions_cache()
         logger.info(
-            f'Кеш акций инвалидирован после обновления акции {action_id}',
+            'Кеш акций инвалидирован после обновления акции {}',
+            action_id,
         )
-        return action
-    except ValueError as e:
-        logger.error(f'Ошибка обновления акции {action_id}: {str(e)}')
-        error_code = (
-            status.HTTP_404_NOT_FOUND
-            if 'не найд' in str(e).lower()
-            else status.HTTP_400_BAD_REQUEST
+        return response
+    except NotFoundError as e:
+        logger.error('Ошибка обновления акции {}: {}', action_id, e)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=build_error(str(e), status.HTTP_404_NOT_FOUND),
         )
+    except DomainValidationError as e:
+        logger.error('Ошибка обновления акции {}: {}', action_id, e)
         raise HTTPException(
-            status_code=error_code,
-            detail=build_error(str(e), error_code),
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=build_error(str(e), status.HTTP_400_BAD_REQUEST),
         )
     except HTTPException:
         raise
     except Exception as e:
         logger.error(
-            f'Неожиданная ошибка при обновлении акции {action_id}: {str(e)}',
+            'Неожиданная ошибка при обновлении акции {}: {}',
+            action_id,
+            e,
         )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1,6 +1,10 @@
 from fastapi import APIRouter, HTTPException, status
 
-from app.core.auth import create_access_token, verify_password
+from app.core.auth import (
+    DUMMY_PASSWORD_HASH,
+    create_access_token,
+    verify_password_async,
+)
 from app.core.db import DbSession
 from app.repositories.user import user_repository
 from app.schemas.auth import AuthData, AuthToken
@@ -15,14 +19,17 @@ async def login(
 ) -> AuthToken:
     """Аутентификация пользователя и получение JWT токена."""
     user = await user_repository.get_by_login(session, login_data.login)
+    is_valid_user = user is not None and user.is_active
+    hashed_password = (
+        user.hashed_password if is_valid_user else DUMMY_PASSWORD_HASH
+    )
+    # bcrypt занимает CPU надолго, проверяем пароль вне event loop
+    password_ok = await verify_password_async(
+        login_data.password,
+        hashed_password,
+    )
 
-    if not user or not user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail='Неверный логин или пароль',
-        )
-
-    if not verify_password(login_data.password, user.hashed_password):
+    if not is_valid_user or not password_ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail='Неверный логин или пароль',
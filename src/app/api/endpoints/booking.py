@@ -1,12 +1,20 @@
-from typing import Annotated
+from typing import Annotated, Any, Awaitable, Callable, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    HTTPException,
+    Query,
+    Response,
+    status,
+)
 from loguru import logger
-from sqlalchemy import select
+from pydantic import TypeAdapter
 
-from app.core.auth import role_checker
 from app.core.db import DbSession
+from app.core.dependencies import AnyUserDep, CacheServiceDep
+from app.core.exceptions import DomainValidationError
 from app.models import User
 from app.repositories.booking import booking_repository
 from app.schemas.booking import (
@@ -16,13 +24,41 @@ from app.schemas.booking import (
     BookingUpdate,
 )
 from app.schemas.common import ErrorResponse
+from app.services.cache_service import BOOKINGS_CACHE_TAG
+from app.services.cache_service import CacheService as CacheServiceType
 from app.services.send_email_service import NotificationService
-from app.utils.enums import UserRole
 from app.utils.http import build_error
 from app.utils.logging_decorator import event_logger
 
 router = APIRouter(prefix='/booking', tags=['Бронирования'])
 
+_BOOKINGS_ADAPTER = TypeAdapter(list[BookingShortInfo])
+
+
+def _get_bookings_cache_key(
+    show_all: bool,
+    cafe_id: Optional[UUID],
+    user_id: Optional[UUID],
+) -> str:
+    """Генерация ключа кеша для списка бронирований."""
+    base_key = f'bookings:list:show_all={show_all}'
+    if cafe_id:
+        base_key = f'{base_key}:cafe_id={cafe_id}'
+    if user_id:
+        base_key = f'{base_key}:user_id={user_id}'
+    return base_key
+
+
+async def _send_notification_safely(
+    notify: Callable[..., Awaitable[None]],
+    *args: Any,
+) -> None:
+    """Отправляет уведомление в фоне, не пробрасывая ошибки наружу."""
+    try:
+        await notify(*args)
+    except Exception as e:
+        logger.error('Ошибка отправки уведомления: {}', e)
+
 
 @router.get(
     '/',
@@ -33,39 +69,53 @@ router = APIRouter(prefix='/booking', tags=['Бронирования'])
 )
 async def get_all_booking(
     session: DbSession,
-    current_user: Annotated[
-        User,
-        Depends(
-            role_checker([UserRole.MANAGER, UserRole.ADMIN, UserRole.USER]),
-        ),
-    ],
+    current_user: Annotated[User, AnyUserDep],
+    cache: CacheServiceType = CacheServiceDep,
     show_all: bool = Query(False, description='Показывать все бронирования?'),
     cafe_id: UUID = Query(None, description='ID кафе'),
     user_id: UUID = Query(None, description='ID пользователя'),
-) -> list[BookingInfo]:
+) -> Response:
     """Получает список бронирований с возможностью фильтрации.
 
     Args:
         session: Асинхронная сессия базы данных
+        cache: Сервис кеширования
         show_all: Флаг показа всех бронирований (включая неактивные)
         cafe_id: Фильтр по идентификатору кафе
         user_id: Фильтр по идентификатору пользователя
         current_user: Информация о текущем пользователе
     Returns:
-        list[BookingInfo]: Список бронирований с полной информацией
+        Response: Список бронирований в формате JSON
     Raises:
         SQLAlchemyException: При ошибках работы с базой данных
 
     """
     try:
-        return await booking_repository.get_multi_with_relations(
+        cache_key = _get_bookings_cache_key(show_all, cafe_id, user_id)
+        cached_bookings = await cache.get_raw(cache_key)
+        if cached_bookings is not None:
+            logger.debug('Кеш попадание для бронирований: {}', cache_key)
+            return Response(
+                content=cached_bookings,
+                media_type='application/json',
+            )
+        logger.debug('Кеш промах для бронирований: {}', cache_key)
+        db_bookings = await booking_repository.get_multi_with_relations(
             session,
             show_all=show_all,
             cafe_id=cafe_id,
             user_id=user_id,
         )
+        raw_bookings = _BOOKINGS_ADAPTER.dump_json(
+            _BOOKINGS_ADAPTER.validate_python(
+                db_bookings,
+                from_attributes=True,
+            ),
+        )
+        await cache.set_raw(cache_key, raw_bookings, tag=BOOKINGS_CACHE_TAG)
+        return Response(content=raw_bookings, media_type='application/json')
     except Exception as e:
-        logger.error(f'Ошибка при получении списка бронирований: {str(e)}')
+        logger.error('Ошибка при получении списка бронирований: {}', e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=build_error(
@@ -89,19 +139,18 @@ async def get_all_booking(
 async def create_booking(
     booking_data: BookingCreate,
     session: DbSession,
-    current_user: Annotated[
-        User,
-        Depends(
-            role_checker([UserRole.MANAGER, UserRole.ADMIN, UserRole.USER]),
-        ),
-    ],
+    background_tasks: BackgroundTasks,
+    current_user: Annotated[User, AnyUserDep],
+    cache: CacheServiceType = CacheServiceDep,
 ) -> BookingInfo:
     """Создает новое бронирование с полной валидацией бизнес-правил.
 
     Args:
         booking_data: Данные для создания бронирования
         session: Асинхронная сессия базы данных
+        background_tasks: Фоновые задачи для отправки уведомлений
         current_user: Информация о текущем пользователе
+        cache: Сервис кеширования
     Returns:
         BookingInfo: Созданный объект бронирования с полной информацией
     Raises:
@@ -128,20 +177,16 @@ async def create_booking(
             booking_data,
             current_user.id,
         )
-        try:
-            await NotificationService.send_booking_created_notification(
-                session,
-                booking.id,
-                current_user.id,
-            )
-            logger.info(
-                f'Уведомление о создании бронирования {booking.id} отправлено',
-            )
-        except Exception as e:
-            logger.error(f'Ошибка отправки уведомления: {str(e)}')
+        await cache.clear_bookings_cache()
+        background_tasks.add_task(
+            _send_notification_safely,
+            NotificationService.send_booking_created_notification,
+            booking,
+            current_user,
+        )
         return booking
-    except ValueError as e:
-        logger.error(f'Ошибка валидации при создании бронирования: {str(e)}')
+    except DomainValidationError as e:
+        logger.error('Ошибка валидации при создании бронирования: {}', e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=build_error(str(e), status.HTTP_400_BAD_REQUEST),
@@ -149,7 +194,7 @@ async def create_booking(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f'Неожиданная ошибка при создании бронирования: {str(e)}')
+        logger.error('Неожиданная ошибка при создании бронирования: {}', e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=build_error(
@@ -170,12 +215,7 @@ async def create_booking(
 async def get_booking_by_id(
     booking_id: UUID,
     session: DbSession,
-    current_user: Annotated[
-        User,
-        Depends(
-            role_checker([UserRole.MANAGER, UserRole.ADMIN, UserRole.USER]),
-        ),
-    ],
+    current_user: Annotated[User, AnyUserDep],
 ) -> BookingInfo:
     """Получает информацию о бронировании по его идентификатору.
 
@@ -196,7 +236,7 @@ async def get_booking_by_id(
             booking_id,
         )
         if not booking:
-            logger.warning(f'Бронирование {booking_id} не найдено')
+            logger.warning('Бронирование {} не найдено', booking_id)
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=build_error(
@@ -209,7 +249,9 @@ async def get_booking_by_id(
         raise
     except Exception as e:
         logger.error(
-            f'Ошибка при получении бронирования {booking_id}: {str(e)}',
+            'Ошибка при получении бронирования {}: {}',
+            booking_id,
+            e,
         )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -234,12 +276,9 @@ async def update_booking(
     booking_id: UUID,
     update_data: BookingUpdate,
     session: DbSession,
-    current_user: Annotated[
-        User,
-        Depends(
-            role_checker([UserRole.MANAGER, UserRole.ADMIN, UserRole.USER]),
-        ),
-    ],
+    background_tasks: BackgroundTasks,
+    current_user: Annotated[User, AnyUserDep],
+    cache: CacheServiceType = CacheServiceDep,
 ) -> BookingInfo:
     """Обновляет информацию о бронировании с валидацией данных.
 
@@ -247,7 +286,9 @@ async def update_booking(
         booking_id: UUID идентификатор бронирования
         update_data: Данные для обновления
         session: Асинхронная сессия базы данных
+        background_tasks: Фоновые задачи для отправки уведомлений
         current_user: Информация о текущем пользователе
+        cache: Сервис кеширования
     Returns:
         BookingInfo: Обновленный объект бронирования
     Raises:
@@ -259,6 +300,7 @@ async def update_booking(
     """
     booking = await booking_repository.get_with_relations(session, booking_id)
     if not booking:
+        logger.warning('Бронирование {} не найдено для обновления', booking_id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=build_error(
@@ -267,55 +309,21 @@ async def update_booking(
             ),
         )
     try:
-        user_stmt = select(User).limit(1)
-        user_result = await session.execute(user_stmt)
-        user = user_result.scalar_one_or_none()
-        if not user:
-            logger.warning(
-                'Пользователь не найден при обновлении бронирования',
-            )
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=build_error(
-                    'Пользователь не найден',
-                    status.HTTP_400_BAD_REQUEST,
-                ),
-            )
-        booking = await booking_repository.get_with_relations(
-            session,
-            booking_id,
-        )
-        if not booking:
-            logger.warning(
-                f'Бронирование {booking_id} не найдено для обновления',
-            )
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=build_error(
-                    'Бронирование не найдено',
-                    status.HTTP_404_NOT_FOUND,
-                ),
-            )
         updated_booking = await booking_repository.update_with_validation(
             session,
             booking,
             update_data,
         )
-        try:
-            await NotificationService.send_booking_updated_notification(
-                session,
-                booking_id,
-                user.id,
-            )
-            logger.info(
-                f'Уведомление об изменении бронирования {booking_id} '
-                'отправлено',
-            )
-        except Exception as e:
-            logger.error(f'Ошибка отправки уведомления: {str(e)}')
+        await cache.clear_bookings_cache()
+        background_tasks.add_task(
+            _send_notification_safely,
+            NotificationService.send_booking_updated_notification,
+            updated_booking,
+            current_user,
+        )
         return updated_booking
-    except ValueError as e:
-        logger.error(f'Ошибка валидации при обновлении бронирования: {str(e)}')
+    except DomainValidationError as e:
+        logger.error('Ошибка валидации при обновлении бронирования: {}', e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=build_error(str(e), status.HTTP_400_BAD_REQUEST),
@@ -324,7 +332,8 @@ async def update_booking(
         raise
     except Exception as e:
         logger.error(
-            f'Неожиданная ошибка при обновлении бронирования: {str(e)}',
+            'Неожиданная ошибка при обновлении бронирования: {}',
+            e,
         )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -360,7 +369,8 @@ async def schedule_booking_reminder(
         )
         if not booking:
             logger.warning(
-                f'Бронирование {booking_id} не найдено для напоминания',
+                'Бронирование {} не найдено для напоминания',
+                booking_id,
             )
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -371,7 +381,8 @@ async def schedule_booking_reminder(
             )
         if not booking.user.email:
             logger.warning(
-                f'У пользователя {booking.user.id} нет email для напоминания',
+                'У пользователя {} нет email для напоминания',
+                booking.user.id,
             )
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -381,8 +392,7 @@ async def schedule_booking_reminder(
                 ),
             )
         await NotificationService.send_booking_reminder(
-            session,
-            booking_id,
+            booking,
             reminder_minutes,
         )
         return {
@@ -392,9 +402,10 @@ async def schedule_booking_reminder(
                 'минут до бронирования'
             ),
         }
-    except ValueError as e:
+    except DomainValidationError as e:
         logger.error(
-            f'Ошибка валидации при планировании напоминания: {str(e)}',
+            'Ошибка валидации при планировании напоминания: {}',
+            e,
         )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -403,7 +414,7 @@ async def schedule_booking_reminder(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f'Ошибка планирования напоминания: {str(e)}')
+        logger.error('Ошибка планирования напоминания: {}', e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=build_error(
@@ -425,6 +436,7 @@ async def schedule_booking_reminder(
 async def test_booking_notification(
     booking_id: UUID,
     session: DbSession,
+    current_user: Annotated[User, AnyUserDep],
     notification_type: str = Query(
         'created',
         description='Тип уведомления: created/updated/reminder',
@@ -438,7 +450,8 @@ async def test_booking_notification(
         )
         if not booking:
             logger.warning(
-                f'Бронирование {booking_id} не найдено для теста уведомления',
+                'Бронирование {} не найдено для теста уведомления',
+                booking_id,
             )
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -447,26 +460,18 @@ async def test_booking_notification(
                     status.HTTP_404_NOT_FOUND,
                 ),
             )
-        user_stmt = select(User).limit(1)
-        user_result = await session.execute(user_stmt)
-        user = user_result.scalar_one_or_none()
         if notification_type == 'created':
             await NotificationService.send_booking_created_notification(
-                session,
-                booking_id,
-                user.id if user else None,
+                booking,
+                current_user,
             )
         elif notification_type == 'updated':
             await NotificationService.send_booking_updated_notification(
-                session,
-                booking_id,
-                user.id if user else None,
+                booking,
+                current_user,
             )
         elif notification_type == 'reminder':
-            await NotificationService.send_booking_reminder(
-                session,
-                booking_id,
-            )
+            await NotificationService.send_booking_reminder(booking)
         else:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -476,8 +481,8 @@ async def test_booking_notification(
                 ),
             )
         return {'status': 'success', 'message': 'Уведомление отправлено'}
-    except ValueError as e:
-        logger.error(f'Ошибка валидации при тесте уведомления: {str(e)}')
+    except DomainValidationError as e:
+        logger.error('Ошибка валидации при тесте уведомления: {}', e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=build_error(str(e), status.HTTP_400_BAD_REQUEST),
@@ -485,7 +490,7 @@ async def test_booking_notification(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f'Ошибка тестирования уведомления: {str(e)}')
+        logger.error('Ошибка тестирования уведомления: {}', e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=build_error(
@@ -1,21 +1,30 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, HTTPException, Query, Response, status
 from loguru import logger
+from pydantic import TypeAdapter
 
-from app.core.auth import role_checker
 from app.core.db import DbSession
+from app.core.dependencies import (
+    AdminDep,
+    AnyUserDep,
+    CacheServiceDep,
+    StaffDep,
+)
 from app.models.user import User
 from app.repositories.cafe import cafe_repository
 from app.schemas.cafe import CafeCreate, CafeInfo, CafeUpdate
 from app.schemas.common import ErrorResponse
-from app.utils.enums import UserRole
-from app.utils.http import build_error
+from app.services.cache_service import CacheService as CacheServiceType
+from app.utils.http import build_error, orm_json_response
 from app.utils.logging_decorator import event_logger
 
 router = APIRouter(prefix='/cafes', tags=['Кафе'])
 
+_CAFE_ADAPTER = TypeAdapter(CafeInfo)
+_CAFE_LIST_ADAPTER = TypeAdapter(list[CafeInfo])
+
 
 @router.get(
     '/',
@@ -26,40 +35,32 @@ router = APIRouter(prefix='/cafes', tags=['Кафе'])
 )
 async def get_all_cafes(
     session: DbSession,
-    current_user: Annotated[
-        User,
-        Depends(
-            role_checker([UserRole.MANAGER, UserRole.ADMIN, UserRole.USER]),
-        ),
-    ],
+    current_user: Annotated[User, AnyUserDep],
     show_all: bool = Query(False, description='Показывать все кафе?'),
-) -> list[CafeInfo]:
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=200),
+) -> Response:
     """Получает список всех кафе с возможностью фильтрации по активности.
 
     Args:
         session: Асинхронная сессия базы данных
         show_all: Флаг показа всех кафе (включая неактивные)
+        skip: Количество пропускаемых записей
+        limit: Максимальное количество записей в ответе
         current_user: Информация о текущем пользователе
     Returns:
-        list[CafeInfo]: Список объектов кафе с информацией о менеджерах
+        Response: Список кафе с информацией о менеджерах в формате JSON
     Raises:
         SQLAlchemyException: При ошибках работы с базой данных
 
     """
-    try:
-        return await cafe_repository.get_multi_with_managers(
-            session,
-            show_all=show_all,
-        )
-    except Exception as e:
-        logger.error(f'Ошибка при получении списка кафе: {str(e)}')
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=build_error(
-                'Внутренняя ошибка сервера',
-                status.HTTP_500_INTERNAL_SERVER_ERROR,
-            ),
-        )
+    db_cafes = await cafe_repository.get_multi_with_managers(
+        session,
+        show_all=show_all,
+        skip=skip,
+        limit=limit,
+    )
+    return orm_json_response(_CAFE_LIST_ADAPTER, db_cafes)
 
 
 @router.post(
@@ -75,8 +76,8 @@ async def get_all_cafes(
 async def create_cafe(
     cafe_data: CafeCreate,
     session: DbSession,
-    current_user: Annotated[User, Depends(role_checker([UserRole.ADMIN]))],
-) -> CafeInfo:
+    current_user: Annotated[User, AdminDep],
+) -> Response:
     """Создает новое кафе с указанными менеджерами.
 
     Args:
@@ -84,32 +85,14 @@ async def create_cafe(
         session: Асинхронная сессия базы данных
         current_user: Информация о текущем пользователе
     Returns:
-        CafeInfo: Созданный объект кафе с информацией о менеджерах
+        Response: Созданное кафе с информацией о менеджерах в формате JSON
     Raises:
         HTTPException: 400 если некоторые менеджеры не найдены
         SQLAlchemyException: При ошибках работы с базой данных
 
     """
-    try:
-        return await cafe_repository.create_with_managers(session, cafe_data)
-    except ValueError as e:
-        logger.error(f'Ошибка валидации при создании кафе: {str(e)}')
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=build_error(
-                str(e),
-                status.HTTP_400_BAD_REQUEST,
-            ),
-        )
-    except Exception as e:
-        logger.error(f'Неожиданная ошибка при создании кафе: {str(e)}')
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=build_error(
-                'Внутренняя ошибка сервера при создании кафе',
-                status.HTTP_500_INTERNAL_SERVER_ERROR,
-            ),
-        )
+    cafe = await cafe_repository.create_with_managers(session, cafe_data)
+    return orm_json_response(_CAFE_ADAPTER, cafe, status.HTTP_201_CREATED)
 
 
 @router.get(
@@ -123,13 +106,8 @@ async def create_cafe(
 async def get_cafe_by_id(
     cafe_id: UUID,
     session: DbSession,
-    current_user: Annotated[
-        User,
-        Depends(
-            role_checker([UserRole.MANAGER, UserRole.ADMIN, UserRole.USER]),
-        ),
-    ],
-) -> CafeInfo:
+    current_user: Annotated[User, AnyUserDep],
+) -> Response:
     """Получает информацию о кафе по его идентификатору.
 
     Args:
@@ -137,35 +115,23 @@ async def get_cafe_by_id(
         session: Асинхронная сессия базы данных
         current_user: Информация о текущем пользователе
     Returns:
-        CafeInfo: Объект кафе с полной информацией
+        Response: Кафе с полной информацией в формате JSON
     Raises:
         HTTPException: 404 если кафе не найдено
         SQLAlchemyException: При ошибках работы с базой данных
 
     """
-    try:
-        cafe = await cafe_repository.get_with_managers(session, cafe_id)
-        if not cafe:
-            logger.warning(f'Кафе {cafe_id} не найдено')
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=build_error(
-                    'Кафе не найдено',
-                    status.HTTP_404_NOT_FOUND,
-                ),
-            )
-        return cafe
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f'Ошибка при получении кафе {cafe_id}: {str(e)}')
+    cafe = await cafe_repository.get_with_managers(session, cafe_id)
+    if not cafe:
+        logger.warning('Кафе {} не найдено', cafe_id)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=status.HTTP_404_NOT_FOUND,
             detail=build_error(
-                'Внутренняя ошибка сервера',
-                status.HTTP_500_INTERNAL_SERVER_ERROR,
+                'Кафе не найдено',
+                status.HTTP_404_NOT_FOUND,
             ),
         )
+    return orm_json_response(_CAFE_ADAPTER, cafe)
 
 
 @router.patch(
@@ -182,27 +148,32 @@ async def update_cafe(
     cafe_id: UUID,
     update_data: CafeUpdate,
     session: DbSession,
-    current_user: Annotated[
-        User,
-        Depends(role_checker([UserRole.MANAGER, UserRole.ADMIN])),
-    ],
-) -> CafeInfo:
+    current_user: Annotated[User, StaffDep],
+    cache: CacheServiceType = CacheServiceDep,
+) -> Response:
     """Обновляет информацию о кафе по его идентификатору.
 
+    Сбрасывает кеши, в ответы которых встроены данные кафе.
+
     Args:
         cafe_id: UUID идентификатор кафе
         update_data: Данные для обновления
         session: Асинхронная сессия базы данных
         current_user: Информация о текущем пользователе
+        cache: Сервис кеширования
     Returns:
-        CafeInfo: Обновленный объект кафе
+        Response: Обновленное кафе в формате JSON
     Raises:
         HTTPException: 404 если кафе не найдено
         HTTPException: 400 если некоторые менеджеры не найдены
         SQLAlchemyException: При ошибках работы с базой данных
 
     """
-    cafe = await cafe_repository.get_with_managers(session, cafe_id)
+    cafe = await cafe_repository.update_returning(
+        session,
+        cafe_id,
+        update_data,
+    )
     if not cafe:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -211,29 +182,7 @@ async def update_cafe(
                 status.HTTP_404_NOT_FOUND,
             ),
         )
-    try:
-        return await cafe_repository.update_with_managers(
-            session,
-            cafe,
-            update_data,
-        )
-    except ValueError as e:
-        logger.error(f'Ошибка валидации при обновлении кафе: {str(e)}')
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=build_error(
-                str(e),
-                status.HTTP_400_BAD_REQUEST,
-            ),
-        )
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f'Неожиданная ошибка при обновлении кафе: {str(e)}')
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=build_error(
-                'Внутренняя ошибка сервера при обновлении кафе',
-                status.HTTP_500_INTERNAL_SERVER_ERROR,
-            ),
-        )
+    await cache.clear_actions_cache()
+    await cache.clear_bookings_cache()
+    await cache.clear_dishes_cache()
+    return orm_json_response(_CAFE_ADAPTER, cafe)
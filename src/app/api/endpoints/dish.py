@@ -1,35 +1,50 @@
+from base64 import urlsafe_b64encode
 from typing import Annotated, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, HTTPException, Query, Response, status
 from loguru import logger
+from pydantic import TypeAdapter
 
-from app.core.auth import role_checker
 from app.core.db import DbSession
-from app.core.dependencies import CacheServiceDep
+from app.core.dependencies import AnyUserDep, CacheServiceDep, StaffDep
 from app.models.user import User
 from app.repositories.dish import dish_repository
 from app.schemas.common import ErrorResponse
 from app.schemas.dish import DishCreate, DishInfo, DishUpdate
 from app.services.cache_service import CacheService as CacheServiceType
-from app.utils.enums import UserRole
-from app.utils.http import build_error
+from app.services.cache_service import RequestCoalescer
+from app.utils.http import build_error, orm_json_response
 from app.utils.logging_decorator import event_logger
 
 router = APIRouter(prefix='/dishes', tags=['Блюда'])
 
+_DISH_ADAPTER = TypeAdapter(DishInfo)
+_DISH_LIST_ADAPTER = TypeAdapter(list[DishInfo])
+_DISH_LOADS = RequestCoalescer()
 
-def _get_dishes_cache_key(show_all: bool, cafe_id: Optional[UUID]) -> str:
-    """Генерация ключа кеша для списка блюд."""
-    base_key = f'dishes:list:show_all={show_all}'
+
+def _compact_uuid(value: UUID) -> str:
+    """Кодирует 16 байт UUID в 22 символа base64url для ключа кеша."""
+    return urlsafe_b64encode(value.bytes).rstrip(b'=').decode('ascii')
+
+
+def _get_dishes_cache_key(
+    show_all: bool,
+    cafe_id: Optional[UUID],
+    skip: int,
+    limit: int,
+) -> str:
+    """Генерация ключа кеша для страницы списка блюд."""
+    base_key = f'dishes:l:{int(show_all)}:{skip}:{limit}'
     if cafe_id:
-        return f'{base_key}:cafe_id={cafe_id}'
+        return f'{base_key}:{_compact_uuid(cafe_id)}'
     return base_key
 
 
 def _get_dish_cache_key(dish_id: UUID) -> str:
     """Генерация ключа кеша для конкретного блюда."""
-    return f'dishes:item:{dish_id}'
+    return f'dishes:i:{_compact_uuid(dish_id)}'
 
 
 @router.get(
@@ -41,44 +56,44 @@ def _get_dish_cache_key(dish_id: UUID) -> str:
 )
 async def get_all_dishes(
     session: DbSession,
-    current_user: Annotated[
-        User,
-        Depends(
-            role_checker([UserRole.MANAGER, UserRole.ADMIN, UserRole.USER]),
-        ),
-    ],
+    current_user: Annotated[User, AnyUserDep],
     cache: CacheServiceType = CacheServiceDep,
     show_all: bool = Query(False, description='Показывать все блюда?'),
     cafe_id: UUID = Query(None, description='ID кафе'),
-) -> list[DishInfo]:
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=200),
+) -> Response:
     """Получает список всех блюд с кешированием."""
-    try:
-        cache_key = _get_dishes_cache_key(show_all, cafe_id)
-        cached_dishes = await cache.get(cache_key)
-        if cached_dishes is not None:
-            logger.debug(f'Кеш попадание для блюд: {cache_key}')
-            return [
-                DishInfo.model_validate(dish_data)
-                for dish_data in cached_dishes
-            ]
-        logger.debug(f'Кеш промах для блюд: {cache_key}')
-        db_dishes = await dish_repository.get_multi_with_cafes(
-            session,
-            show_all=show_all,
-            cafe_id=cafe_id,
-        )
-        dishes = [DishInfo.model_validate(dish) for dish in db_dishes]
-        await cache.set(cache_key, [dish.model_dump() for dish in dishes])
-        return dishes
-    except Exception as e:
-        logger.error(f'Ошибка при получении списка блюд: {str(e)}')
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=build_error(
-                'Внутренняя ошибка сервера',
-                status.HTTP_500_INTERNAL_SERVER_ERROR,
-            ),
+    cache_key = _get_dishes_cache_key(show_all, cafe_id, skip, limit)
+    cached_dishes = await cache.get_raw(cache_key)
+    if cached_dishes is not None:
+        logger.debug('Кеш попадание для блюд: {}', cache_key)
+        return Response(
+            content=cached_dishes,
+            media_type='application/json',
         )
+    logger.debug('Кеш промах для блюд: {}', cache_key)
+    db_dishes = await dish_repository.get_multi_with_cafes(
+        session,
+        show_all=show_all,
+        cafe_id=cafe_id,
+        skip=skip,
+        limit=limit,
+    )
+    dishes = _DISH_LIST_ADAPTER.validate_python(
+        db_dishes,
+        from_attributes=True,
+    )
+    # Список и карточки блюд пишутся одним пайплайном, чтобы
+    # последующие запросы /dishes/{id} попадали в кеш
+    cache_items = {
+        _get_dish_cache_key(dish.id): _DISH_ADAPTER.dump_json(dish)
+        for dish in dishes
+    }
+    raw_dishes = _DISH_LIST_ADAPTER.dump_json(dishes)
+    cache_items[cache_key] = raw_dishes
+    await cache.pipeline_set(cache_items)
+    return Response(content=raw_dishes, media_type='application/json')
 
 
 @router.post(
@@ -95,39 +110,19 @@ async def get_all_dishes(
 async def create_dish(
     dish_data: DishCreate,
     session: DbSession,
-    current_user: Annotated[
-        User,
-        Depends(role_checker([UserRole.MANAGER, UserRole.ADMIN])),
-    ],
+    current_user: Annotated[User, StaffDep],
     cache: CacheServiceType = CacheServiceDep,
-) -> DishInfo:
+) -> Response:
     """Создает новое блюдо и инвалидирует кеш."""
-    try:
-        db_dish = await dish_repository.create_with_cafes(session, dish_data)
-        dish = DishInfo.model_validate(db_dish)
-        await cache.clear_dishes_cache()
-        logger.info('Кеш блюд инвалидирован после создания нового блюда')
-        return dish
-    except ValueError as e:
-        logger.error(f'Ошибка валидации при создании блюда: {str(e)}')
-        error_code = (
-            status.HTTP_404_NOT_FOUND
-            if 'не найд' in str(e).lower()
-            else status.HTTP_400_BAD_REQUEST
-        )
-        raise HTTPException(
-            status_code=error_code,
-            detail=build_error(str(e), error_code),
-        )
-    except Exception as e:
-        logger.error(f'Неожиданная ошибка при создании блюда: {str(e)}')
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=build_error(
-                'Внутренняя ошибка сервера при создании блюда',
-                status.HTTP_500_INTERNAL_SERVER_ERROR,
-            ),
-        )
+    db_dish = await dish_repository.create_with_cafes(session, dish_data)
+    response = orm_json_response(
+        _DISH_ADAPTER,
+        db_dish,
+        status.HTTP_201_CREATED,
+    )
+    await cache.clear_dishes_cache()
+    logger.info('Кеш блюд инвалидирован после создания нового блюда')
+    return response
 
 
 @router.get(
@@ -141,25 +136,25 @@ async def create_dish(
 async def get_dish_by_id(
     dish_id: UUID,
     session: DbSession,
-    current_user: Annotated[
-        User,
-        Depends(
-            role_checker([UserRole.MANAGER, UserRole.ADMIN, UserRole.USER]),
-        ),
-    ],
+    current_user: Annotated[User, AnyUserDep],
     cache: CacheServiceType = CacheServiceDep,
-) -> DishInfo:
-    """Получает информацию о блюде по его идентификатору с кешированием."""
-    try:
+) -> Response:
+    """Получает информацию о блюде по его идентификатору с кешированием.
+
+    Одновременные запросы одного блюда разделяют одно обращение к кешу
+    и БД.
+    """
+
+    async def load() -> str | bytes:
         cache_key = _get_dish_cache_key(dish_id)
-        cached_dish_data = await cache.get(cache_key)
-        if cached_dish_data is not None:
-            logger.debug(f'Кеш попадание для блюда: {cache_key}')
-            return DishInfo.model_validate(cached_dish_data)
-        logger.debug(f'Кеш промах для блюда: {cache_key}')
+        cached_dish = await cache.get_raw(cache_key)
+        if cached_dish is not None:
+            logger.debug('Кеш попадание для блюда: {}', cache_key)
+            return cached_dish
+        logger.debug('Кеш промах для блюда: {}', cache_key)
         db_dish = await dish_repository.get_with_cafes(session, dish_id)
         if not db_dish:
-            logger.warning(f'Блюдо {dish_id} не найдено')
+            logger.warning('Блюдо {} не найдено', dish_id)
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=build_error(
@@ -167,20 +162,14 @@ async def get_dish_by_id(
                     status.HTTP_404_NOT_FOUND,
                 ),
             )
-        dish = DishInfo.model_validate(db_dish)
-        await cache.set(cache_key, dish.model_dump())
-        return dish
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f'Ошибка при получении блюда {dish_id}: {str(e)}')
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=build_error(
-                'Внутренняя ошибка сервера',
-                status.HTTP_500_INTERNAL_SERVER_ERROR,
-            ),
+        raw_dish = _DISH_ADAPTER.dump_json(
+            _DISH_ADAPTER.validate_python(db_dish, from_attributes=True),
         )
+        await cache.set_raw(cache_key, raw_dish)
+        return raw_dish
+
+    raw_dish = await _DISH_LOADS.run(dish_id, load)
+    return Response(content=raw_dish, media_type='application/json')
 
 
 @router.patch(
@@ -197,53 +186,28 @@ async def update_dish(
     dish_id: UUID,
     update_data: DishUpdate,
     session: DbSession,
-    current_user: Annotated[
-        User,
-        Depends(role_checker([UserRole.MANAGER, UserRole.ADMIN])),
-    ],
+    current_user: Annotated[User, StaffDep],
     cache: CacheServiceType = CacheServiceDep,
-) -> DishInfo:
+) -> Response:
     """Обновляет информацию о блюде и инвалидирует кеш."""
-    try:
-        db_dish = await dish_repository.get_with_cafes(session, dish_id)
-        if not db_dish:
-            logger.warning(f'Блюдо {dish_id} не найдено для обновления')
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=build_error(
-                    'Блюдо не найдено',
-                    status.HTTP_404_NOT_FOUND,
-                ),
-            )
-        updated_db_dish = await dish_repository.update_with_cafes(
-            session,
-            db_dish,
-            update_data,
-        )
-        dish = DishInfo.model_validate(updated_db_dish)
-        await cache.delete(_get_dish_cache_key(dish_id))
-        await cache.clear_dishes_cache()
-        logger.info(f'Кеш блюд инвалидирован после обновления блюда {dish_id}')
-        return dish
-    except ValueError as e:
-        logger.error(f'Ошибка валидации при обновлении блюда: {str(e)}')
-        error_code = (
-            status.HTTP_404_NOT_FOUND
-            if 'не найд' in str(e).lower()
-            else status.HTTP_400_BAD_REQUEST
-        )
-        raise HTTPException(
-            status_code=error_code,
-            detail=build_error(str(e), error_code),
-        )
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f'Неожиданная ошибка при обновлении блюда: {str(e)}')
+    updated_db_dish = await dish_repository.update_returning(
+        session,
+        dish_id,
+        update_data,
+    )
+    if not updated_db_dish:
+        logger.warning('Блюдо {} не найдено для обновления', dish_id)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=status.HTTP_404_NOT_FOUND,
             detail=build_error(
-                'Внутренняя ошибка сервера при обновлении блюда',
-                status.HTTP_500_INTERNAL_SERVER_ERROR,
+                'Блюдо не найдено',
+                status.HTTP_404_NOT_FOUND,
             ),
         )
+    response = orm_json_response(_DISH_ADAPTER, updated_db_dish)
+    await cache.clear_dishes_cache()
+    logger.info(
+        'Кеш блюд инвалидирован после обновления блюда {}',
+        dish_id,
+    )
+    return response
@@ -1,28 +1,67 @@
-from typing import Any, Dict, Optional
+import asyncio
+import random
+from collections import defaultdict
+from typing import Annotated, Any, Awaitable, Callable, Dict, Optional
 
 from fastapi import APIRouter, Depends
 from loguru import logger
 from sqlalchemy import text
 
+from app.core.constants import HEALTHCHECK_CACHE_TTL
 from app.core.db import DbSession
-from app.core.dependencies import get_cache_service
+from app.core.dependencies import AdminDep, get_cache_service
+from app.models.user import User
 from app.services.cache_service import CacheService
 from app.services.notification import send_notification_task
 
 router = APIRouter(prefix='/healthcheck', tags=['Healthcheck'])
 
+# Последний успешный результат проверки: (момент устаревания, ответ)
+_PROBE_RESULTS: dict[str, tuple[float, Dict[str, str]]] = {}
+_PROBE_LOCKS: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+
+async def _cached_probe(
+    name: str,
+    probe: Callable[[], Awaitable[Dict[str, str]]],
+) -> Dict[str, str]:
+    """Выполняет проверку не чаще раза в HEALTHCHECK_CACHE_TTL секунд.
+
+    Одновременные запросы ждут одну проверку под блокировкой, а срок
+    жизни результата слегка случайный, чтобы воркеры не ходили в
+    зависимые сервисы синхронно. Кешируется только успешный ответ:
+    после сбоя следующий вызов снова проверяет сервис.
+    """
+    loop = asyncio.get_running_loop()
+    cached = _PROBE_RESULTS.get(name)
+    if cached and cached[0] > loop.time():
+        return cached[1]
+    async with _PROBE_LOCKS[name]:
+        cached = _PROBE_RESULTS.get(name)
+        if cached and cached[0] > loop.time():
+            return cached[1]
+        result = await probe()
+        if result['status'] == 'ok':
+            ttl = HEALTHCHECK_CACHE_TTL * random.uniform(0.8, 1.2)
+            _PROBE_RESULTS[name] = (loop.time() + ttl, result)
+        return result
+
 
 @router.get('/db')
 async def test(session: DbSession) -> Dict[str, str]:
     """Тестовая ручка на проверку состояния БД."""
-    try:
-        result = await session.execute(text('SELECT 1'))
-        _ = result.scalar()
-        logger.debug('Проверка БД: успешно')
-        return {'status': 'ok'}
-    except Exception as e:
-        logger.error(f'Ошибка проверки БД: {str(e)}')
-        return {'status': 'error', 'details': str(e)}
+
+    async def probe() -> Dict[str, str]:
+        try:
+            result = await session.execute(text('SELECT 1'))
+            _ = result.scalar()
+            logger.debug('Проверка БД: успешно')
+            return {'status': 'ok'}
+        except Exception as e:
+            logger.error('Ошибка проверки БД: {}', e)
+            return {'status': 'error', 'details': str(e)}
+
+    return await _cached_probe('db', probe)
 
 
 @router.get('/redis')
@@ -30,23 +69,28 @@ async def redis_health(
     cache: CacheService = Depends(get_cache_service),
 ) -> Dict[str, str]:
     """Проверка состояния Redis."""
-    try:
-        if cache.redis:
-            await cache.redis.ping()
-            logger.debug('Проверка Redis: успешно')
-            return {'status': 'ok'}
-        logger.error('Redis не подключен')
-        return {'status': 'error', 'details': 'Redis не подключен'}
-    except Exception as e:
-        logger.error(f'Ошибка проверки Redis: {str(e)}')
-        return {'status': 'error', 'details': str(e)}
+
+    async def probe() -> Dict[str, str]:
+        try:
+            if cache.redis:
+                await cache.redis.ping()
+                logger.debug('Проверка Redis: успешно')
+                return {'status': 'ok'}
+            logger.error('Redis не подключен')
+            return {'status': 'error', 'details': 'Redis не подключен'}
+        except Exception as e:
+            logger.error('Ошибка проверки Redis: {}', e)
+            return {'status': 'error', 'details': str(e)}
+
+    return await _cached_probe('redis', probe)
 
 
-@router.get('/cache')
+@router.get('/internal/cache-selftest')
 async def test_cache(
+    current_user: Annotated[User, AdminDep],
     cache: CacheService = Depends(get_cache_service),
 ) -> Dict[str, Any]:
-    """Тестовый эндпоинт для проверки работы кеширования."""
+    """Проверка записи и чтения кеша (только для администраторов)."""
     try:
         test_key: str = 'test:cache:demo'
         test_data: Dict[str, Any] = {
@@ -66,7 +110,9 @@ async def test_cache(
         )
         data_matches: bool = retrieved_data == test_data
         logger.debug(
-            f'Тест кеша: сохранение={save_result}, совпадение={data_matches}',
+            'Тест кеша: сохранение={}, совпадение={}',
+            save_result,
+            data_matches,
         )
         return {
             'cache_available': cache.redis is not None,
@@ -77,7 +123,7 @@ async def test_cache(
             'retrieved_data': retrieved_data,
         }
     except Exception as e:
-        logger.error(f'Ошибка тестирования кеша: {str(e)}')
+        logger.error('Ошибка тестирования кеша: {}', e)
         return {
             'cache_available': False,
             'save_successful': False,
@@ -92,8 +138,8 @@ async def send_email_notification(email: str, text: str) -> dict[str, bool]:
     """Тестовая ручка для отправки уведомления."""
     try:
         send_notification_task([email], text)
-        logger.info(f'Тестовое уведомление отправлено на {email}')
+        logger.info('Тестовое уведомление отправлено на {}', email)
         return {'ok': True}
     except Exception as e:
-        logger.error(f'Ошибка отправки тестового уведомления: {str(e)}')
+        logger.error('Ошибка отправки тестового уведомления: {}', e)
         return {'ok': False, 'error': str(e)}
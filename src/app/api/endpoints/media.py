@@ -1,21 +1,27 @@
+import hashlib
 import io
 import os
+import shutil
+import tempfile
 import uuid
-from typing import Annotated
+from typing import Annotated, BinaryIO, Optional
 
 import aiofiles
 import anyio
-from PIL import Image
+from PIL import Image, UnidentifiedImageError
 from fastapi import (
     APIRouter,
-    Depends,
     File,
     HTTPException,
+    Response,
     UploadFile,
 )
 from fastapi.responses import FileResponse
+from loguru import logger
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 
-from app.core.auth import role_checker
+from app.core.config import settings
 from app.core.constants import (
     ALLOWED_IMAGE_EXTENSIONS,
     JPEG_QUALITY,
@@ -23,76 +29,108 @@ from app.core.constants import (
     MEDIA_DIR,
 )
 from app.core.db import DbSession
+from app.core.dependencies import StaffDep
 from app.models.media import Media
 from app.models.user import User
 from app.schemas.media import CustomError, MediaInfo
-from app.utils.enums import UserRole
+from app.services.image_pool import image_pool
+from app.utils.ids import uuid7
 
 router = APIRouter(prefix='/media', tags=['Медиа'])
 
 
+# Ошибки разбора присланного файла; прочие сбои пула отдаются как 500
+_IMAGE_DECODE_ERRORS = (
+    UnidentifiedImageError,
+    Image.DecompressionBombError,
+    OSError,
+    ValueError,
+)
+
+# Ответы об ошибках валидации не зависят от запроса и строятся один раз
+_ERROR_NO_FILENAME = CustomError(
+    code=400,
+    message='Имя файла не указано',
+).dict()
+_ERROR_BAD_EXTENSION = CustomError(
+    code=400,
+    message=(
+        'Неподдерживаемый формат файла. '
+        f'Разрешены: {", ".join(sorted(ALLOWED_IMAGE_EXTENSIONS))}'
+    ),
+).dict()
+_ERROR_FILE_TOO_LARGE = CustomError(
+    code=400,
+    message='Размер файла превышает максимально допустимый (5MB)',
+).dict()
+
+
 def validate_image_file(file: UploadFile) -> None:
     """Validate uploaded image file."""
     # Check file extension
     if not file.filename:
-        raise HTTPException(
-            status_code=400,
-            detail=CustomError(
-                code=400,
-                message='Имя файла не указано',
-            ).dict(),
-        )
+        raise HTTPException(status_code=400, detail=_ERROR_NO_FILENAME)
 
-    file_ext = file.filename.split('.')[-1].lower()
+    file_ext = file.filename.rpartition('.')[2].lower()
     if file_ext not in ALLOWED_IMAGE_EXTENSIONS:
-        raise HTTPException(
-            status_code=400,
-            detail=CustomError(
-                code=400,
-                message=(
-                    f'Неподдерживаемый формат файла. '
-                    f'Разрешены: {", ".join(ALLOWED_IMAGE_EXTENSIONS)}'
-                ),
-            ).dict(),
-        )
+        raise HTTPException(status_code=400, detail=_ERROR_BAD_EXTENSION)
 
     # Check file size
     if file.size and file.size > MAX_IMAGE_FILE_SIZE:
-        raise HTTPException(
-            status_code=400,
-            detail=CustomError(
-                code=400,
-                message='Размер файла превышает максимально допустимый (5MB)',
-            ).dict(),
-        )
+        raise HTTPException(status_code=400, detail=_ERROR_FILE_TOO_LARGE)
 
 
-def convert_to_jpg(image_data: bytes) -> bytes:
-    """Convert image to JPG format."""
-    try:
-        image = Image.open(io.BytesIO(image_data))
+def hash_image_file(image_file: BinaryIO) -> bytes:
+    """Return SHA-256 digest of the uploaded file content."""
+    image_file.seek(0)
+    digest = hashlib.file_digest(image_file, 'sha256').digest()
+    image_file.seek(0)
+    return digest
+
+
+async def get_media_id_by_digest(
+    session: DbSession,
+    digest: bytes,
+) -> Optional[uuid.UUID]:
+    """Find already stored image with the same content."""
+    return await session.scalar(
+        select(Media.id).where(Media.content_sha256 == digest).limit(1),
+    )
 
+
+def spool_to_disk(image_file: BinaryIO) -> str:
+    """Copy the upload to a named temp file in chunks and return its path.
+
+    The pool worker opens the image by path, so the raw upload is never
+    read into one bytes object or pickled into the worker process.
+    """
+    image_file.seek(0)
+    with tempfile.NamedTemporaryFile(prefix='upload-', delete=False) as tmp:
+        shutil.copyfileobj(image_file, tmp)
+    return tmp.name
+
+
+def convert_to_jpg(path: str) -> bytes:
+    """Convert image to JPG format.
+
+    Runs in a pool worker process, so it raises plain exceptions that
+    can be pickled back to the caller.
+    """
+    with Image.open(path) as image:
         # Convert to RGB if necessary (for PNG with transparency)
         if image.mode in ('RGBA', 'LA', 'P'):
             background = Image.new('RGB', image.size, (255, 255, 255))
-            if image.mode == 'P':
-                image = image.convert('RGBA')
-            mask = image.split()[-1] if image.mode == 'RGBA' else None
-            background.paste(image, mask=mask)
-            image = background
+            source = image.convert('RGBA') if image.mode == 'P' else image
+            # Only the alpha band is extracted, not a copy of every band
+            background.paste(source, mask=source.getchannel('A'))
+            result = background
+        else:
+            result = image
 
         # Save as JPG
         output = io.BytesIO()
-        image.save(output, format='JPEG', quality=JPEG_QUALITY)
-        return output.getvalue()
-    except Exception as e:
-        raise HTTPException(
-            status_code=422,
-            detail=CustomError(
-                code=422,
-                message=f'Ошибка обработки изображения: {str(e)}',
-            ).dict(),
-        )
+        result.save(output, format='JPEG', quality=JPEG_QUALITY)
+    return output.getvalue()
 
 
 @router.post(
@@ -109,6 +147,7 @@ def convert_to_jpg(image_data: bytes) -> bytes:
         },
         403: {'model': CustomError, 'description': 'Доступ запрещен'},
         422: {'model': CustomError, 'description': 'Ошибка сохранения файла'},
+        500: {'model': CustomError, 'description': 'Внутренняя ошибка'},
     },
     summary='Загрузка изображения',
     description=(
@@ -118,10 +157,7 @@ def convert_to_jpg(image_data: bytes) -> bytes:
 )
 async def upload_media(
     session: DbSession,
-    current_user: Annotated[
-        User,
-        Depends(role_checker([UserRole.MANAGER, UserRole.ADMIN])),
-    ],
+    current_user: Annotated[User, StaffDep],
     file: UploadFile = File(...),
 ) -> MediaInfo:
     """Upload image file (admin and manager only)."""
@@ -129,17 +165,40 @@ async def upload_media(
     validate_image_file(file)
 
     try:
-        # Read file content
-        file_content = await file.read()
-
-        # Convert to JPG
-        jpg_content = convert_to_jpg(file_content)
+        # Identical re-upload returns the existing image without decoding
+        digest = await anyio.to_thread.run_sync(hash_image_file, file.file)
+        existing_id = await get_media_id_by_digest(session, digest)
+        if existing_id:
+            return MediaInfo(media_id=existing_id)
 
-        # Generate UUID4 for the image
-        media_id = uuid.uuid4()
+        # Convert to JPG in the process pool so encoding is not bound by GIL;
+        # the worker gets only a path to the spooled copy of the upload
+        upload_path = await anyio.to_thread.run_sync(spool_to_disk, file.file)
+        try:
+            jpg_content = await image_pool.run(convert_to_jpg, upload_path)
+        except _IMAGE_DECODE_ERRORS as e:
+            raise HTTPException(
+                status_code=422,
+                detail=CustomError(
+                    code=422,
+                    message=f'Ошибка обработки изображения: {str(e)}',
+                ).dict(),
+            )
+        except Exception as e:
+            # Сбой пула процессов — не ошибка клиента
+            logger.exception('Ошибка пула обработки изображений: {}', e)
+            raise HTTPException(
+                status_code=500,
+                detail=CustomError(
+                    code=500,
+                    message='Внутренняя ошибка сервера',
+                ).dict(),
+            )
+        finally:
+            await anyio.Path(upload_path).unlink(missing_ok=True)
 
-        # Create media directory if it doesn't exist
-        os.makedirs(MEDIA_DIR, exist_ok=True)
+        # Generate time-ordered UUIDv7 for the image
+        media_id = uuid7()
 
         # Create file path with UUID as filename
         file_path = os.path.join(MEDIA_DIR, f'{media_id}.jpg')
@@ -155,11 +214,20 @@ async def upload_media(
             content_type='image/jpeg',
             file_size=len(jpg_content),
             file_path=file_path,
+            content_sha256=digest,
         )
 
         session.add(media_record)
-        await session.commit()
-        await session.refresh(media_record)
+        try:
+            await session.commit()
+        except IntegrityError:
+            # Same image was stored by a concurrent request
+            await session.rollback()
+            await anyio.Path(file_path).unlink(missing_ok=True)
+            existing_id = await get_media_id_by_digest(session, digest)
+            if not existing_id:
+                raise
+            return MediaInfo(media_id=existing_id)
 
         return MediaInfo(media_id=media_record.id)
 
@@ -189,36 +257,38 @@ async def upload_media(
     },
     summary='Возвращает изображение в бинарном формате',
 )
-async def get_media(
-    media_id: uuid.UUID,
-    session: DbSession,
-) -> FileResponse:
-    """Get image by ID (available to all users)."""
-    # Find media record in database
-    media_record = await session.get(Media, media_id)
+async def get_media(media_id: uuid.UUID) -> Response:
+    """Get image by ID (available to all users).
 
-    if not media_record:
-        raise HTTPException(
-            status_code=404,
-            detail=CustomError(
-                code=404,
-                message='Изображение не найдено',
-            ).dict(),
+    Files are stored as MEDIA_DIR/{media_id}.jpg, so the path is built
+    from the ID and the database is not queried.
+    """
+    file_name = f'{media_id}.jpg'
+
+    # Let nginx send the file with sendfile(2) when it is configured
+    if settings.MEDIA_ACCEL_REDIRECT_PREFIX:
+        prefix = settings.MEDIA_ACCEL_REDIRECT_PREFIX.rstrip('/')
+        return Response(
+            media_type='image/jpeg',
+            headers={
+                'X-Accel-Redirect': f'{prefix}/{file_name}',
+                'Content-Disposition': f'attachment; filename="{file_name}"',
+            },
         )
 
-    # Check if file exists on disk
-    if not await anyio.Path(media_record.file_path).exists():
+    file_path = os.path.join(MEDIA_DIR, file_name)
+    if not await anyio.Path(file_path).is_file():
         raise HTTPException(
             status_code=404,
             detail=CustomError(
                 code=404,
-                message='Файл изображения не найден на диске',
+                message='Изображение не найдено',
             ).dict(),
         )
 
     # Return file as response
     return FileResponse(
-        path=media_record.file_path,
-        media_type=media_record.content_type,
-        filename=f'{media_id}.jpg',
+        path=file_path,
+        media_type='image/jpeg',
+        filename=file_name,
     )
@@ -1,17 +1,21 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, HTTPException, Query, Response, status
 from loguru import logger
+from pydantic import TypeAdapter
 
-from app.core.auth import role_checker
+from app.core.constants import SLOTS_CACHE_TTL
 from app.core.db import DbSession
+from app.core.dependencies import AnyUserDep, CacheServiceDep, StaffDep
+from app.core.exceptions import DomainValidationError, NotFoundError
 from app.models.user import User
 from app.repositories.slot import slot_repository
 from app.schemas.common import ErrorResponse
 from app.schemas.slot import SlotCreate, SlotInfo, SlotShortInfo, SlotUpdate
-from app.utils.enums import UserRole
-from app.utils.http import build_error
+from app.services.cache_service import SLOTS_CACHE_TAG
+from app.services.cache_service import CacheService as CacheServiceType
+from app.utils.http import build_error, orm_json_response
 from app.utils.logging_decorator import event_logger
 
 router = APIRouter(
@@ -19,6 +23,39 @@ router = APIRouter(
     tags=['Временные слоты'],
 )
 
+_SLOT_ADAPTER = TypeAdapter(SlotInfo)
+_SLOT_LIST_ADAPTER = TypeAdapter(list[SlotShortInfo])
+
+_ERROR_INTERNAL = build_error(
+    'Внутренняя ошибка сервера',
+    status.HTTP_500_INTERNAL_SERVER_ERROR,
+)
+_ERROR_CREATE_FAILED = build_error(
+    'Внутренняя ошибка сервера при создании слота',
+    status.HTTP_500_INTERNAL_SERVER_ERROR,
+)
+_ERROR_NOT_FOUND = build_error(
+    'Временной слот не найден',
+    status.HTTP_404_NOT_FOUND,
+)
+_ERROR_UPDATE_FAILED = build_error(
+    'Внутренняя ошибка сервера при обновлении слота',
+    status.HTTP_500_INTERNAL_SERVER_ERROR,
+)
+
+
+def _get_slots_cache_key(
+    cafe_id: UUID,
+    show_all: bool,
+    skip: int,
+    limit: int,
+) -> str:
+    """Генерация ключа кеша для списка слотов кафе."""
+    return (
+        f'slots:list:cafe_id={cafe_id}:show_all={show_all}'
+        f':skip={skip}:limit={limit}'
+    )
+
 
 @router.get(
     '/',
@@ -30,44 +67,70 @@ router = APIRouter(
 async def get_all_time_slots(
     cafe_id: UUID,
     session: DbSession,
-    current_user: Annotated[
-        User,
-        Depends(
-            role_checker([UserRole.MANAGER, UserRole.ADMIN, UserRole.USER]),
-        ),
-    ],
+    current_user: Annotated[User, AnyUserDep],
+    cache: CacheServiceType = CacheServiceDep,
     show_all: bool = Query(False, description='Показывать все слоты?'),
-) -> list[SlotInfo]:
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=200),
+) -> Response:
     """Получает список всех временных слотов в указанном кафе.
 
     Args:
         cafe_id: UUID идентификатор кафе
         session: Асинхронная сессия базы данных
+        cache: Сервис кеширования
         show_all: Флаг показа всех слотов (включая неактивные)
+        skip: Количество пропускаемых записей
+        limit: Максимальное количество записей в ответе
         current_user: Информация о текущем пользователе
     Returns:
-        list[SlotInfo]: Список временных слотов кафе
+        Response: Список временных слотов кафе в формате JSON
     Raises:
         HTTPException: 404 если кафе не найдено
         SQLAlchemyException: При ошибках работы с базой данных
 
     """
     try:
-        return await slot_repository.get_multi_by_cafe(
+        cache_key = _get_slots_cache_key(
+            cafe_id,
+            show_all,
+            skip,
+            limit,
+        )
+        cached_slots = await cache.get_raw(cache_key)
+        if cached_slots is not None:
+            logger.debug('Кеш попадание для слотов: {}', cache_key)
+            return Response(
+                content=cached_slots,
+                media_type='application/json',
+            )
+        logger.debug('Кеш промах для слотов: {}', cache_key)
+        db_slots = await slot_repository.get_multi_by_cafe(
             session,
             cafe_id,
             show_all=show_all,
+            skip=skip,
+            limit=limit,
         )
+        raw_slots = _SLOT_LIST_ADAPTER.dump_json(
+            _SLOT_LIST_ADAPTER.validate_python(db_slots, from_attributes=True),
+        )
+        await cache.set_raw(
+            cache_key,
+            raw_slots,
+            tag=f'{SLOTS_CACHE_TAG}:{cafe_id}',
+            ttl=SLOTS_CACHE_TTL,
+        )
+        return Response(content=raw_slots, media_type='application/json')
     except Exception as e:
         logger.error(
-            f'Ошибка при получении слотов для кафе {cafe_id}: {str(e)}',
+            'Ошибка при получении слотов для кафе {}: {}',
+            cafe_id,
+            e,
         )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=build_error(
-                'Внутренняя ошибка сервера',
-                status.HTTP_500_INTERNAL_SERVER_ERROR,
-            ),
+            detail=_ERROR_INTERNAL,
         )
 
 
@@ -86,20 +149,19 @@ async def create_time_slot(
     cafe_id: UUID,
     slot_data: SlotCreate,
     session: DbSession,
-    current_user: Annotated[
-        User,
-        Depends(role_checker([UserRole.MANAGER, UserRole.ADMIN])),
-    ],
-) -> SlotInfo:
+    current_user: Annotated[User, StaffDep],
+    cache: CacheServiceType = CacheServiceDep,
+) -> Response:
     """Создает новый временной слот в указанном кафе.
 
     Args:
         cafe_id: UUID идентификатор кафе
         slot_data: Данные для создания временного слота
         session: Асинхронная сессия базы данных
+        cache: Сервис кеширования
         current_user: Информация о текущем пользователе
     Returns:
-        SlotInfo: Созданный объект временного слота
+        Response: Созданный временной слот в формате JSON
     Raises:
         HTTPException: 404 если кафе не найдено
         HTTPException: 400 если время начала >= времени окончания
@@ -108,30 +170,34 @@ async def create_time_slot(
 
     """
     try:
-        return await slot_repository.create_for_cafe(
+        slot = await slot_repository.create_for_cafe(
             session,
             cafe_id,
             slot_data,
         )
-    except ValueError as e:
-        logger.error(f'Ошибка валидации при создании слота: {str(e)}')
-        status_code = (
-            status.HTTP_404_NOT_FOUND
-            if 'не найден' in str(e).lower()
-            else status.HTTP_400_BAD_REQUEST
+        await cache.clear_slots_cache(cafe_id)
+        return orm_json_response(
+            _SLOT_ADAPTER,
+            slot,
+            status.HTTP_201_CREATED,
         )
+    except NotFoundError as e:
+        logger.error('Ошибка валидации при создании слота: {}', e)
         raise HTTPException(
-            status_code=status_code,
-            detail=build_error(str(e), status_code),
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=build_error(str(e), status.HTTP_404_NOT_FOUND),
+        )
+    except DomainValidationError as e:
+        logger.error('Ошибка валидации при создании слота: {}', e)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=build_error(str(e), status.HTTP_400_BAD_REQUEST),
         )
     except Exception as e:
-        logger.error(f'Неожиданная ошибка при создании слота: {str(e)}')
+        logger.error('Неожиданная ошибка при создании слота: {}', e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=build_error(
-                'Внутренняя ошибка сервера при создании слота',
-                status.HTTP_500_INTERNAL_SERVER_ERROR,
-            ),
+            detail=_ERROR_CREATE_FAILED,
         )
 
 
@@ -147,13 +213,8 @@ async def get_time_slot_by_id(
     cafe_id: UUID,
     slot_id: UUID,
     session: DbSession,
-    current_user: Annotated[
-        User,
-        Depends(
-            role_checker([UserRole.MANAGER, UserRole.ADMIN, UserRole.USER]),
-        ),
-    ],
-) -> SlotInfo:
+    current_user: Annotated[User, AnyUserDep],
+) -> Response:
     """Получает информацию о временном слоте по его ID в указанном кафе.
 
     Args:
@@ -162,34 +223,32 @@ async def get_time_slot_by_id(
         session: Асинхронная сессия базы данных
         current_user: Информация о текущем пользователе
     Returns:
-        SlotInfo: Объект временного слота с полной информацией
+        Response: Временной слот с полной информацией в формате JSON
     Raises:
         HTTPException: 404 если временной слот не найден
         SQLAlchemyException: При ошибках работы с базой данных
 
     """
     try:
-        slot = await slot_repository.get_with_cafe(session, slot_id)
-        if not slot or slot.cafe_id != cafe_id:
-            logger.warning(f'Слот {slot_id} не найден в кафе {cafe_id}')
+        slot = await slot_repository.get_in_cafe(
+            session,
+            slot_id,
+            cafe_id,
+        )
+        if not slot:
+            logger.warning('Слот {} не найден в кафе {}', slot_id, cafe_id)
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
-                detail=build_error(
-                    'Временной слот не найден',
-                    status.HTTP_404_NOT_FOUND,
-                ),
+                detail=_ERROR_NOT_FOUND,
             )
-        return slot
+        return orm_json_response(_SLOT_ADAPTER, slot)
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f'Ошибка при получении слота {slot_id}: {str(e)}')
+        logger.error('Ошибка при получении слота {}: {}', slot_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=build_error(
-                'Внутренняя ошибка сервера',
-                status.HTTP_500_INTERNAL_SERVER_ERROR,
-            ),
+            detail=_ERROR_INTERNAL,
         )
 
 
@@ -208,11 +267,9 @@ async def update_time_slot(
     slot_id: UUID,
     update_data: SlotUpdate,
     session: DbSession,
-    current_user: Annotated[
-        User,
-        Depends(role_checker([UserRole.MANAGER, UserRole.ADMIN])),
-    ],
-) -> SlotInfo:
+    current_user: Annotated[User, StaffDep],
+    cache: CacheServiceType = CacheServiceDep,
+) -> Response:
     """Обновляет информацию о временном слоте по его идентификатору.
 
     Args:
@@ -220,9 +277,10 @@ async def update_time_slot(
         slot_id: UUID идентификатор временного слота
         update_data: Данные для обновления
         session: Асинхронная сессия базы данных
+        cache: Сервис кеширования
         current_user: Информация о текущем пользователе
     Returns:
-        SlotInfo: Обновленный объект временного слота
+        Response: Обновленный временной слот в формате JSON
     Raises:
         HTTPException: 404 если временной слот не найден
         HTTPException: 404 если новое кафе не найдено
@@ -232,41 +290,38 @@ async def update_time_slot(
 
     """
     try:
-        slot = await slot_repository.get_with_cafe(session, slot_id)
-        if not slot or slot.cafe_id != cafe_id:
-            logger.warning(f'Слот {slot_id} не найден для обновления')
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=build_error(
-                    'Временной слот не найден',
-                    status.HTTP_404_NOT_FOUND,
-                ),
-            )
-        return await slot_repository.update_with_cafe_validation(
+        slot = await slot_repository.update_returning(
             session,
-            slot,
-            update_data,
+            slot_id,
             cafe_id,
+            update_data,
         )
-    except ValueError as e:
-        logger.error(f'Ошибка валидации при обновлении слота: {str(e)}')
-        status_code = (
-            status.HTTP_404_NOT_FOUND
-            if 'не найден' in str(e).lower()
-            else status.HTTP_400_BAD_REQUEST
+        if slot is None:
+            logger.warning('Слот {} не найден для обновления', slot_id)
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=_ERROR_NOT_FOUND,
+            )
+        # При переносе в другое кафе устаревают оба списка
+        await cache.clear_slots_cache(cafe_id, slot.cafe_id)
+        return orm_json_response(_SLOT_ADAPTER, slot)
+    except NotFoundError as e:
+        logger.error('Ошибка валидации при обновлении слота: {}', e)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=build_error(str(e), status.HTTP_404_NOT_FOUND),
         )
+    except DomainValidationError as e:
+        logger.error('Ошибка валидации при обновлении слота: {}', e)
         raise HTTPException(
-            status_code=status_code,
-            detail=build_error(str(e), status_code),
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=build_error(str(e), status.HTTP_400_BAD_REQUEST),
         )
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f'Неожиданная ошибка при обновлении слота: {str(e)}')
+        logger.error('Неожиданная ошибка при обновлении слота: {}', e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=build_error(
-                'Внутренняя ошибка сервера при обновлении слота',
-                status.HTTP_500_INTERNAL_SERVER_ERROR,
-            ),
+            detail=_ERROR_UPDATE_FAILED,
         )
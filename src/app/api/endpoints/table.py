@@ -1,11 +1,13 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, HTTPException, Query, Response, status
 from loguru import logger
+from pydantic import TypeAdapter
 
-from app.core.auth import role_checker
 from app.core.db import DbSession
+from app.core.dependencies import AnyUserDep, CacheServiceDep, StaffDep
+from app.core.exceptions import DomainValidationError, NotFoundError
 from app.models.user import User
 from app.repositories.table import table_repository
 from app.schemas.common import ErrorResponse
@@ -15,12 +17,46 @@ from app.schemas.table import (
     TableShortInfo,
     TableUpdate,
 )
-from app.utils.enums import UserRole
-from app.utils.http import build_error
+from app.services.cache_service import TABLES_CACHE_TAG
+from app.services.cache_service import CacheService as CacheServiceType
+from app.utils.http import build_error, orm_json_response
 from app.utils.logging_decorator import event_logger
 
 router = APIRouter(prefix='/cafe/{cafe_id}/tables', tags=['Столы'])
 
+_TABLE_ADAPTER = TypeAdapter(TableInfo)
+_TABLE_LIST_ADAPTER = TypeAdapter(list[TableShortInfo])
+
+_ERROR_INTERNAL = build_error(
+    'Внутренняя ошибка сервера',
+    status.HTTP_500_INTERNAL_SERVER_ERROR,
+)
+_ERROR_CREATE_FAILED = build_error(
+    'Внутренняя ошибка сервера при создании стола',
+    status.HTTP_500_INTERNAL_SERVER_ERROR,
+)
+_ERROR_NOT_FOUND = build_error(
+    'Стол не найден',
+    status.HTTP_404_NOT_FOUND,
+)
+_ERROR_UPDATE_FAILED = build_error(
+    'Внутренняя ошибка сервера при обновлении стола',
+    status.HTTP_500_INTERNAL_SERVER_ERROR,
+)
+
+
+def _get_tables_cache_key(
+    cafe_id: UUID,
+    show_all: bool,
+    skip: int,
+    limit: int,
+) -> str:
+    """Генерация ключа кеша для списка столов кафе."""
+    return (
+        f'tables:list:cafe_id={cafe_id}:show_all={show_all}'
+        f':skip={skip}:limit={limit}'
+    )
+
 
 @router.get(
     '/',
@@ -32,45 +68,73 @@ router = APIRouter(prefix='/cafe/{cafe_id}/tables', tags=['Столы'])
 async def get_all_tables(
     cafe_id: UUID,
     session: DbSession,
-    current_user: Annotated[
-        User,
-        Depends(
-            role_checker([UserRole.MANAGER, UserRole.ADMIN, UserRole.USER]),
-        ),
-    ],
+    current_user: Annotated[User, AnyUserDep],
+    cache: CacheServiceType = CacheServiceDep,
     show_all: bool = Query(False, description='Показывать все столы?'),
-) -> list[TableInfo]:
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=200),
+) -> Response:
     """Получает список всех столов в указанном кафе.
 
     Args:
         cafe_id: UUID идентификатор кафе
         session: Асинхронная сессия базы данных
+        cache: Сервис кеширования
         show_all: Флаг показа всех столов (включая неактивные)
+        skip: Количество пропускаемых записей
+        limit: Максимальное количество записей в ответе
         current_user: Информация о текущем пользователе
 
     Returns:
-        list[TableInfo]: Список столов кафе с информацией о кафе
+        Response: Список столов кафе в формате JSON
     Raises:
         HTTPException: 404 если кафе не найдено
         SQLAlchemyException: При ошибках работы с базой данных
 
     """
     try:
-        return await table_repository.get_multi_by_cafe(
+        cache_key = _get_tables_cache_key(
+            cafe_id,
+            show_all,
+            skip,
+            limit,
+        )
+        cached_tables = await cache.get_raw(cache_key)
+        if cached_tables is not None:
+            logger.debug('Кеш попадание для столов: {}', cache_key)
+            return Response(
+                content=cached_tables,
+                media_type='application/json',
+            )
+        logger.debug('Кеш промах для столов: {}', cache_key)
+        db_tables = await table_repository.get_multi_by_cafe(
             session,
             cafe_id,
             show_all=show_all,
+            skip=skip,
+            limit=limit,
+        )
+        raw_tables = _TABLE_LIST_ADAPTER.dump_json(
+            _TABLE_LIST_ADAPTER.validate_python(
+                db_tables,
+                from_attributes=True,
+            ),
         )
+        await cache.set_raw(
+            cache_key,
+            raw_tables,
+            tag=f'{TABLES_CACHE_TAG}:{cafe_id}',
+        )
+        return Response(content=raw_tables, media_type='application/json')
     except Exception as e:
         logger.error(
-            f'Ошибка при получении столов для кафе {cafe_id}: {str(e)}',
+            'Ошибка при получении столов для кафе {}: {}',
+            cafe_id,
+            e,
         )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=build_error(
-                'Внутренняя ошибка сервера',
-                status.HTTP_500_INTERNAL_SERVER_ERROR,
-            ),
+            detail=_ERROR_INTERNAL,
         )
 
 
@@ -89,20 +153,19 @@ async def create_table(
     cafe_id: UUID,
     table_data: TableCreate,
     session: DbSession,
-    current_user: Annotated[
-        User,
-        Depends(role_checker([UserRole.MANAGER, UserRole.ADMIN])),
-    ],
-) -> TableInfo:
+    current_user: Annotated[User, StaffDep],
+    cache: CacheServiceType = CacheServiceDep,
+) -> Response:
     """Создает новый стол в указанном кафе.
 
     Args:
         cafe_id: UUID идентификатор кафе
         table_data: Данные для создания стола
         session: Асинхронная сессия базы данных
+        cache: Сервис кеширования
         current_user: Информация о текущем пользователе
     Returns:
-        TableInfo: Созданный объект стола с информацией о кафе
+        Response: Созданный стол с информацией о кафе в формате JSON
     Raises:
         HTTPException: 404 если кафе не найдено
         HTTPException: 400 если стол с таким количеством мест уже существует
@@ -110,30 +173,34 @@ async def create_table(
 
     """
     try:
-        return await table_repository.create_for_cafe(
+        table = await table_repository.create_for_cafe(
             session,
             cafe_id,
             table_data,
         )
-    except ValueError as e:
-        logger.error(f'Ошибка валидации при создании стола: {str(e)}')
-        status_code = (
-            status.HTTP_404_NOT_FOUND
-            if 'не найден' in str(e).lower()
-            else status.HTTP_400_BAD_REQUEST
+        await cache.clear_tables_cache(cafe_id)
+        return orm_json_response(
+            _TABLE_ADAPTER,
+            table,
+            status.HTTP_201_CREATED,
+        )
+    except NotFoundError as e:
+        logger.error('Ошибка валидации при создании стола: {}', e)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=build_error(str(e), status.HTTP_404_NOT_FOUND),
         )
+    except DomainValidationError as e:
+        logger.error('Ошибка валидации при создании стола: {}', e)
         raise HTTPException(
-            status_code=status_code,
-            detail=build_error(str(e), status_code),
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=build_error(str(e), status.HTTP_400_BAD_REQUEST),
         )
     except Exception as e:
-        logger.error(f'Неожиданная ошибка при создании стола: {str(e)}')
+        logger.error('Неожиданная ошибка при создании стола: {}', e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=build_error(
-                'Внутренняя ошибка сервера при создании стола',
-                status.HTTP_500_INTERNAL_SERVER_ERROR,
-            ),
+            detail=_ERROR_CREATE_FAILED,
         )
 
 
@@ -149,13 +216,8 @@ async def get_table_by_id(
     cafe_id: UUID,
     table_id: UUID,
     session: DbSession,
-    current_user: Annotated[
-        User,
-        Depends(
-            role_checker([UserRole.MANAGER, UserRole.ADMIN, UserRole.USER]),
-        ),
-    ],
-) -> TableInfo:
+    current_user: Annotated[User, AnyUserDep],
+) -> Response:
     """Получает информацию о столе по его идентификатору в указанном кафе.
 
     Args:
@@ -164,34 +226,32 @@ async def get_table_by_id(
         session: Асинхронная сессия базы данных
         current_user: Информация о текущем пользователе
     Returns:
-        TableInfo: Объект стола с полной информацией
+        Response: Стол с полной информацией в формате JSON
     Raises:
         HTTPException: 404 если стол не найден
         SQLAlchemyException: При ошибках работы с базой данных
 
     """
     try:
-        table = await table_repository.get_with_cafe(session, table_id)
-        if not table or table.cafe_id != cafe_id:
-            logger.warning(f'Стол {table_id} не найден в кафе {cafe_id}')
+        table = await table_repository.get_in_cafe(
+            session,
+            table_id,
+            cafe_id,
+        )
+        if not table:
+            logger.warning('Стол {} не найден в кафе {}', table_id, cafe_id)
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
-                detail=build_error(
-                    'Стол не найден',
-                    status.HTTP_404_NOT_FOUND,
-                ),
+                detail=_ERROR_NOT_FOUND,
             )
-        return table
+        return orm_json_response(_TABLE_ADAPTER, table)
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f'Ошибка при получении стола {table_id}: {str(e)}')
+        logger.error('Ошибка при получении стола {}: {}', table_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=build_error(
-                'Внутренняя ошибка сервера',
-                status.HTTP_500_INTERNAL_SERVER_ERROR,
-            ),
+            detail=_ERROR_INTERNAL,
         )
 
 
@@ -210,11 +270,9 @@ async def update_table(
     table_id: UUID,
     update_data: TableUpdate,
     session: DbSession,
-    current_user: Annotated[
-        User,
-        Depends(role_checker([UserRole.MANAGER, UserRole.ADMIN])),
-    ],
-) -> TableInfo:
+    current_user: Annotated[User, StaffDep],
+    cache: CacheServiceType = CacheServiceDep,
+) -> Response:
     """Обновляет информацию о столе по его идентификатору.
 
     Args:
@@ -222,9 +280,10 @@ async def update_table(
         table_id: UUID идентификатор стола
         update_data: Данные для обновления
         session: Асинхронная сессия базы данных
+        cache: Сервис кеширования
         current_user: Информация о текущем пользователе
     Returns:
-        TableInfo: Обновленный объект стола
+        Response: Обновленный стол в формате JSON
     Raises:
         HTTPException: 404 если стол не найден
         HTTPException: 404 если новое кафе не найдено
@@ -233,41 +292,38 @@ async def update_table(
 
     """
     try:
-        table = await table_repository.get_with_cafe(session, table_id)
-        if not table or table.cafe_id != cafe_id:
-            logger.warning(f'Стол {table_id} не найден для обновления')
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=build_error(
-                    'Стол не найден',
-                    status.HTTP_404_NOT_FOUND,
-                ),
-            )
-        return await table_repository.update_with_cafe_validation(
+        table = await table_repository.update_returning(
             session,
-            table,
-            update_data,
+            table_id,
             cafe_id,
+            update_data,
         )
-    except ValueError as e:
-        logger.error(f'Ошибка валидации при обновлении стола: {str(e)}')
-        status_code = (
-            status.HTTP_404_NOT_FOUND
-            if 'не найден' in str(e).lower()
-            else status.HTTP_400_BAD_REQUEST
+        if table is None:
+            logger.warning('Стол {} не найден для обновления', table_id)
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=_ERROR_NOT_FOUND,
+            )
+        # При переносе в другое кафе устаревают оба списка
+        await cache.clear_tables_cache(cafe_id, table.cafe_id)
+        return orm_json_response(_TABLE_ADAPTER, table)
+    except NotFoundError as e:
+        logger.error('Ошибка валидации при обновлении стола: {}', e)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=build_error(str(e), status.HTTP_404_NOT_FOUND),
         )
+    except DomainValidationError as e:
+        logger.error('Ошибка валидации при обновлении стола: {}', e)
         raise HTTPException(
-            status_code=status_code,
-            detail=build_error(str(e), status_code),
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=build_error(str(e), status.HTTP_400_BAD_REQUEST),
         )
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f'Неожиданная ошибка при обновлении стола: {str(e)}')
+        logger.error('Неожиданная ошибка при обновлении стола: {}', e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=build_error(
-                'Внутренняя ошибка сервера при обновлении стола',
-                status.HTTP_500_INTERNAL_SERVER_ERROR,
-            ),
+            detail=_ERROR_UPDATE_FAILED,
         )
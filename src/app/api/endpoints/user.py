@@ -1,28 +1,63 @@
-from typing import Annotated, List, Optional
+from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Security, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
 
 from app.core.auth import (
     get_current_user,
-    public_or_role_checker,
-    role_checker,
 )
 from app.core.db import DbSession
+from app.core.dependencies import (
+    AnyUserDep,
+    CacheServiceDep,
+    PublicOrStaffDep,
+    StaffDep,
+)
+from app.core.exceptions import DomainValidationError
 from app.models.user import User
 from app.repositories.user import user_repository
 from app.schemas.common import ErrorResponse
 from app.schemas.user import UserCreate, UserInfo, UserUpdate, UserUpdateMe
+from app.services.cache_service import CacheService as CacheServiceType
 from app.utils.enums import UserRole
-from app.utils.http import build_error
+from app.utils.http import build_error, orm_json_response
 from app.utils.logging_decorator import event_logger
 
 router = APIRouter(prefix='/users', tags=['Пользователи'])
 
+_USER_ADAPTER = TypeAdapter(UserInfo)
+_USER_LIST_ADAPTER = TypeAdapter(list[UserInfo])
+
+_ERROR_USER_ROLE_FORBIDDEN = build_error(
+    'Пользователям с ролью USER действие запрещено',
+    status.HTTP_403_FORBIDDEN,
+)
+_ERROR_CREATE_FAILED = build_error(
+    'Внутренняя ошибка сервера при создании пользователя',
+    status.HTTP_500_INTERNAL_SERVER_ERROR,
+)
+_ERROR_UPDATE_FAILED = build_error(
+    'Внутренняя ошибка сервера при обновлении пользователя',
+    status.HTTP_500_INTERNAL_SERVER_ERROR,
+)
+_ERROR_NOT_FOUND = build_error(
+    'Пользователь не найден',
+    status.HTTP_404_NOT_FOUND,
+)
+_ERROR_GET_FAILED = build_error(
+    'Внутренняя ошибка сервера при получении пользователя',
+    status.HTTP_500_INTERNAL_SERVER_ERROR,
+)
+_ERROR_STATUS_FORBIDDEN = build_error(
+    'Недостаточно прав для изменения статуса пользователя',
+    status.HTTP_403_FORBIDDEN,
+)
+
 
 @router.get(
     '/',
-    response_model=List[UserInfo],
+    response_model=list[UserInfo],
     responses={
         status.HTTP_401_UNAUTHORIZED: {'model': ErrorResponse},
         status.HTTP_403_FORBIDDEN: {'model': ErrorResponse},
@@ -31,24 +66,22 @@ router = APIRouter(prefix='/users', tags=['Пользователи'])
 )
 async def get_all_users(
     session: DbSession,
-    current_user: Annotated[
-        User,
-        Depends(role_checker([UserRole.MANAGER, UserRole.ADMIN])),
-    ],
+    current_user: Annotated[User, StaffDep],
     show_all: bool = Query(
         False,
         description='Показывать всех пользователей?',
     ),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
-) -> List[UserInfo]:
+) -> Response:
     """Получение списка пользователей."""
-    return await user_repository.get_multi(
+    db_users = await user_repository.get_multi(
         session,
         show_all=show_all,
         skip=skip,
         limit=limit,
     )
+    return orm_json_response(_USER_LIST_ADAPTER, db_users)
 
 
 @router.post(
@@ -65,10 +98,8 @@ async def get_all_users(
 async def create_user(
     user_data: UserCreate,
     session: DbSession,
-    current_user: Optional[User] = Security(
-        public_or_role_checker([UserRole.MANAGER, UserRole.ADMIN]),
-    ),
-) -> UserInfo:
+    current_user: User | None = PublicOrStaffDep,
+) -> Response:
     """Создание нового пользователя.
 
     Доступно:
@@ -81,15 +112,17 @@ async def create_user(
     if current_user is not None and current_user.role == UserRole.USER:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail=build_error(
-                'Пользователям с ролью USER действие запрещено',
-                status.HTTP_403_FORBIDDEN,
-            ),
+            detail=_ERROR_USER_ROLE_FORBIDDEN,
         )
 
     try:
-        return await user_repository.create(session, user_data)
-    except ValueError as e:
+        user = await user_repository.create(session, user_data)
+        return orm_json_response(
+            _USER_ADAPTER,
+            user,
+            status.HTTP_201_CREATED,
+        )
+    except DomainValidationError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=build_error(str(e), status.HTTP_400_BAD_REQUEST),
@@ -97,10 +130,7 @@ async def create_user(
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=build_error(
-                'Внутренняя ошибка сервера при создании пользователя',
-                status.HTTP_500_INTERNAL_SERVER_ERROR,
-            ),
+            detail=_ERROR_CREATE_FAILED,
         ) from e
 
 
@@ -112,19 +142,10 @@ async def create_user(
     },
 )
 async def get_me(
-    current_user: Annotated[
-        User,
-        Depends(
-            role_checker([
-                UserRole.USER,
-                UserRole.MANAGER,
-                UserRole.ADMIN,
-            ]),
-        ),
-    ],
-) -> UserInfo:
+    current_user: Annotated[User, AnyUserDep],
+) -> Response:
     """Эндпоинт для получения информации о собсвтвенном аккаунте."""
-    return current_user
+    return orm_json_response(_USER_ADAPTER, current_user)
 
 
 @router.patch(
@@ -141,15 +162,18 @@ async def update_me(
     update_data: UserUpdateMe,
     session: DbSession,
     current_user: User = Depends(get_current_user),
-) -> UserInfo:
+    cache: CacheServiceType = CacheServiceDep,
+) -> Response:
     """Обновление информации о текущем пользователе."""
     try:
-        return await user_repository.update(
+        user = await user_repository.update(
             session,
             current_user,
             update_data,
         )
-    except ValueError as e:
+        await cache.clear_current_user_cache(user.id)
+        return orm_json_response(_USER_ADAPTER, user)
+    except DomainValidationError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=build_error(str(e), status.HTTP_400_BAD_REQUEST),
@@ -157,10 +181,7 @@ async def update_me(
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=build_error(
-                'Внутренняя ошибка сервера при обновлении пользователя',
-                status.HTTP_500_INTERNAL_SERVER_ERROR,
-            ),
+            detail=_ERROR_UPDATE_FAILED,
         ) from e
 
 
@@ -177,32 +198,23 @@ async def update_me(
 async def get_user_by_id(
     user_id: UUID,
     session: DbSession,
-    current_user: Annotated[
-        User,
-        Depends(role_checker([UserRole.MANAGER, UserRole.ADMIN])),
-    ],
-) -> UserInfo:
+    current_user: Annotated[User, StaffDep],
+) -> Response:
     """Получение информации о пользователе по ID."""
     try:
         user = await user_repository.get(session, id=user_id)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
-                detail=build_error(
-                    'Пользователь не найден',
-                    status.HTTP_404_NOT_FOUND,
-                ),
+                detail=_ERROR_NOT_FOUND,
             )
-        return user
+        return orm_json_response(_USER_ADAPTER, user)
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=build_error(
-                'Внутренняя ошибка сервера при получении пользователя',
-                status.HTTP_500_INTERNAL_SERVER_ERROR,
-            ),
+            detail=_ERROR_GET_FAILED,
         ) from e
 
 
@@ -222,21 +234,16 @@ async def update_user(
     user_id: UUID,
     update_data: UserUpdate,
     session: DbSession,
-    current_user: Annotated[
-        User,
-        Depends(role_checker([UserRole.MANAGER, UserRole.ADMIN])),
-    ],
-) -> UserInfo:
+    current_user: Annotated[User, StaffDep],
+    cache: CacheServiceType = CacheServiceDep,
+) -> Response:
     """Обновление информации о пользователе по ID."""
     try:
         user = await user_repository.get(session, id=user_id)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
-                detail=build_error(
-                    'Пользователь не найден',
-                    status.HTTP_404_NOT_FOUND,
-                ),
+                detail=_ERROR_NOT_FOUND,
             )
 
         if (
@@ -245,14 +252,14 @@ async def update_user(
         ):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail=build_error(
-                    'Недостаточно прав для изменения статуса пользователя',
-                    status.HTTP_403_FORBIDDEN,
-                ),
+                detail=_ERROR_STATUS_FORBIDDEN,
             )
 
-        return await user_repository.update(session, user, update_data)
-    except ValueError as e:
+        user = await user_repository.update(session, user, update_data)
+        # Смена роли или блокировка должны сразу влиять на авторизацию
+        await cache.clear_current_user_cache(user.id)
+        return orm_json_response(_USER_ADAPTER, user)
+    except DomainValidationError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=build_error(str(e), status.HTTP_400_BAD_REQUEST),
@@ -262,8 +269,5 @@ async def update_user(
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=build_error(
-                'Внутренняя ошибка сервера при обновлении пользователя',
-                status.HTTP_500_INTERNAL_SERVER_ERROR,
-            ),
+            detail=_ERROR_UPDATE_FAILED,
         ) from e
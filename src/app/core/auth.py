@@ -1,43 +1,138 @@
+import asyncio
+import secrets
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Annotated, Awaitable, Callable, List, Optional
+from functools import lru_cache
+from typing import (
+    Annotated,
+    Awaitable,
+    Callable,
+    FrozenSet,
+    Iterable,
+    Optional,
+    TypedDict,
+)
 from uuid import UUID
 
+import bcrypt
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
-from passlib.context import CryptContext
-from sqlalchemy import select
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
 from app.core.config import settings
+from app.core.constants import (
+    BCRYPT_MAX_PASSWORD_BYTES,
+    CURRENT_USER_CACHE_TTL,
+    PASSWORD_HASH_WORKERS,
+    TOKEN_CACHE_SIZE,
+)
 from app.core.db import DbSession
 from app.core.logging import logger
 from app.models.user import User
+from app.services.cache_service import cache_service
 from app.utils.enums import UserRole
 
 # Для обязательной аутентификации
 security = HTTPBearer(auto_error=False)
 
-pwd_context = CryptContext(schemes=['bcrypt'], deprecated='auto')
+# Параметры токена задаются настройками и не меняются в рантайме
+_ACCESS_TOKEN_TTL = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+_SECRET_KEY = settings.SECRET_KEY
+_ALGORITHM = settings.ALGORITHM
+_ALGORITHMS = [_ALGORITHM]
+# Без sub и exp токен отклоняется самим jose с JWTClaimsError
+_DECODE_OPTIONS = {'require_sub': True, 'require_exp': True}
+# Ключ полезной нагрузки с UUID пользователя, разобранным из sub
+_USER_UUID_CLAIM = 'user_uuid'
+# Метка «middleware не разбирал токен»: None означает невалидный токен
+_NOT_DECODED = object()
 
+# bcrypt отпускает GIL, поэтому пул потоков по числу ядер позволяет
+# проверять пароли параллельно, не блокируя event loop
+_PASSWORD_EXECUTOR = ThreadPoolExecutor(
+    max_workers=PASSWORD_HASH_WORKERS,
+    thread_name_prefix='bcrypt',
+)
 
-def get_token_expires() -> timedelta:
-    """Возвращает время жизни токена."""
-    return timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+
+def _encode_password(password: str) -> bytes:
+    """Кодирует пароль для bcrypt, обрезая его до 72 байт, как passlib."""
+    return password.encode()[:BCRYPT_MAX_PASSWORD_BYTES]
+
+
+class _CachedUser(TypedDict):
+    """Колонки пользователя, которые хранятся в кеше (без пароля)."""
+
+    id: UUID
+    username: str
+    email: Optional[str]
+    phone: Optional[str]
+    tg_id: Optional[str]
+    role: UserRole
+    is_active: bool
+    is_superuser: bool
+    is_verified: bool
+    created_at: datetime
+    updated_at: datetime
+
+
+_CACHED_USER_ADAPTER = TypeAdapter(_CachedUser)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Проверка пароля."""
-    return pwd_context.verify(plain_password, hashed_password)
+    try:
+        return bcrypt.checkpw(
+            _encode_password(plain_password),
+            hashed_password.encode(),
+        )
+    except ValueError:
+        # Хеш не в формате bcrypt
+        return False
 
 
 def get_password_hash(password: str) -> str:
     """Хеширование пароля."""
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(
+        _encode_password(password),
+        bcrypt.gensalt(rounds=settings.PASSWORD_HASH_ROUNDS),
+    ).decode()
+
+
+async def verify_password_async(
+    plain_password: str,
+    hashed_password: str,
+) -> bool:
+    """Проверка пароля в пуле потоков bcrypt."""
+    return await asyncio.get_running_loop().run_in_executor(
+        _PASSWORD_EXECUTOR,
+        verify_password,
+        plain_password,
+        hashed_password,
+    )
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Хеширование пароля в пуле потоков bcrypt."""
+    return await asyncio.get_running_loop().run_in_executor(
+        _PASSWORD_EXECUTOR,
+        get_password_hash,
+        password,
+    )
+
+
+# Хеш для сверки, когда пользователь не найден: время ответа не зависит
+# от существования логина
+DUMMY_PASSWORD_HASH = get_password_hash(secrets.token_urlsafe(16))
 
 
 def create_access_token(user_id: UUID, username: str) -> str:
     """Создает JWT токен."""
-    expire = datetime.now(timezone.utc) + get_token_expires()
+    expire = datetime.now(timezone.utc) + _ACCESS_TOKEN_TTL
 
     to_encode = {
         'sub': str(user_id),
@@ -47,113 +142,155 @@ def create_access_token(user_id: UUID, username: str) -> str:
 
     return jwt.encode(
         to_encode,
-        settings.SECRET_KEY,
-        algorithm=settings.ALGORITHM,
+        _SECRET_KEY,
+        algorithm=_ALGORITHM,
     )
 
 
+@lru_cache(maxsize=TOKEN_CACHE_SIZE)
+def _decode_token(token: str) -> dict:
+    """Декодирует JWT токен, проверяя подпись.
+
+    JWTError не кешируется lru_cache, поэтому поток невалидных токенов
+    не вытесняет из кеша действующие. Вместе с полезной нагрузкой
+    кешируется разобранный UUID пользователя из sub.
+    """
+    payload = jwt.decode(
+        token,
+        _SECRET_KEY,
+        algorithms=_ALGORITHMS,
+        options=_DECODE_OPTIONS,
+    )
+    try:
+        payload[_USER_UUID_CLAIM] = UUID(payload['sub'])
+    except ValueError as e:
+        raise JWTError('sub не является UUID') from e
+    return payload
+
+
+def decode_access_token(token: str) -> Optional[dict]:
+    """Возвращает полезную нагрузку токена или None, если он невалиден.
+
+    Результат проверки подписи кешируется по строке токена, срок
+    действия проверяется при каждом обращении.
+    """
+    try:
+        payload = _decode_token(token)
+    except JWTError as e:
+        logger.warning('JWTError при обработке токена: {}', e)
+        return None
+    if payload['exp'] <= time.time():
+        return None
+    return payload
+
+
+def _get_token_payload(request: Request, token: str) -> Optional[dict]:
+    """Берет полезную нагрузку, разобранную auth_middleware.
+
+    Токен декодируется заново, только если middleware его не разбирал,
+    поэтому подпись проверяется не больше одного раза за запрос.
+    """
+    payload = getattr(request.state, 'token_payload', _NOT_DECODED)
+    if payload is _NOT_DECODED:
+        return decode_access_token(token)
+    return payload
+
+
+async def _get_active_user(
+    session: AsyncSession,
+    user_id: UUID,
+) -> Optional[User]:
+    """Получает активного пользователя по идентификатору из токена.
+
+    Колонки пользователя берутся из Redis, а при промахе читаются из БД
+    без связей cafe и booking, которые зависимостям авторизации не нужны.
+    """
+    cache_key = cache_service.current_user_key(user_id)
+    cached = await cache_service.get_raw(cache_key)
+    if cached is not None:
+        user = User(**_CACHED_USER_ADAPTER.validate_json(cached))
+        make_transient_to_detached(user)
+        # Привязываем к сессии запроса без SELECT, чтобы объект можно
+        # было обновлять, как загруженный из БД
+        return await session.merge(user, load=False)
+
+    # Поиск по первичному ключу сначала смотрит в identity map сессии
+    user = await session.get(User, user_id)
+    if user is None or not user.is_active:
+        return None
+    await cache_service.set_raw(
+        cache_key,
+        _CACHED_USER_ADAPTER.dump_json(
+            {key: getattr(user, key) for key in _CachedUser.__annotations__},
+        ),
+        ttl=CURRENT_USER_CACHE_TTL,
+    )
+    return user
+
+
 async def get_current_user_optional(
+    request: Request,
     credentials: Annotated[
         HTTPAuthorizationCredentials,
         Depends(security),
     ],
     session: DbSession,
-    request: Request = None,
 ) -> Optional[User]:
     """Получение текущего пользователя из JWT токена (опционально).
 
     Если токен отсутствует или невалиден, возвращает None.
     """
-    if request:
-        logger.info(f'Заголовки запроса: {dict(request.headers)}')
     if credentials is None:
-        logger.info('Отсутствует заголовок Authorization в headers')
+        logger.debug('Отсутствует заголовок Authorization в headers')
         return None
-    token = credentials.credentials
-    logger.info(f'Получен: {token}')
-
-    try:
-        payload = jwt.decode(
-            token,
-            settings.SECRET_KEY,
-            algorithms=[settings.ALGORITHM],
-        )
-        user_id: str = payload.get('sub')
-
-        if user_id is None:
-            return None
-
-        stmt = select(User).where(
-            User.id == UUID(user_id),
-            User.is_active.is_(True),
-        )
-        result = await session.execute(stmt)
-
-        return result.scalar_one_or_none()
-
-    except JWTError as e:
-        logger.warning(f'JWTError при обработке токена: {e}')
+    payload = _get_token_payload(request, credentials.credentials)
+    if payload is None:
         return None
+    return await _get_active_user(session, payload[_USER_UUID_CLAIM])
 
 
 async def get_current_user(
+    request: Request,
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
     session: DbSession,
-    request: Request = None,
 ) -> User:
     """Получение текущего пользователя из JWT токена."""
-    if request:
-        logger.info(f'Заголовки запроса: {request.headers}')
     if credentials is None:
-        logger.info('Отсутствует заголовок Authorization в headers')
+        logger.debug('Отсутствует заголовок Authorization в headers')
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail='Не авторизован',
         )
 
-    token = credentials.credentials
-    logger.info(f'Получен токен: {token}')
-
-    try:
-        payload = jwt.decode(
-            token,
-            settings.SECRET_KEY,
-            algorithms=[settings.ALGORITHM],
-        )
-        user_id: str = payload.get('sub')
-
-        if user_id is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail='Неверные учетные данные',
-            )
-
-        stmt = select(User).where(
-            User.id == UUID(user_id),
-            User.is_active.is_(True),
+    payload = _get_token_payload(request, credentials.credentials)
+    if payload is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail='Неверные учетные данные',
         )
-        result = await session.execute(stmt)
-        user = result.scalar_one_or_none()
-
-        if user is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail='Пользователь не найден или неактивен',
-            )
-
-        return user
 
-    except JWTError:
+    user = await _get_active_user(session, payload[_USER_UUID_CLAIM])
+    if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail='Неверные учетные данные',
+            detail='Пользователь не найден или неактивен',
         )
 
+    return user
+
 
 def public_or_role_checker(
-    allowed_roles: List[UserRole],
+    allowed_roles: Iterable[UserRole],
 ) -> Callable[..., Awaitable[Optional[User]]]:
     """Проверка роли или ее отсутсвия для публичных эндпоинтов."""
+    return _build_public_or_role_checker(frozenset(allowed_roles))
+
+
+@lru_cache(maxsize=None)
+def _build_public_or_role_checker(
+    allowed_roles: FrozenSet[UserRole],
+) -> Callable[..., Awaitable[Optional[User]]]:
+    """Создает зависимость проверки ролей для публичного эндпоинта."""
 
     async def checker(
         credentials: Optional[HTTPAuthorizationCredentials] = Depends(
@@ -174,8 +311,22 @@ def public_or_role_checker(
     return checker
 
 
-def role_checker(allowed_roles: List[UserRole]) -> User:
-    """Универсальная функция для проверки ролей пользователя."""
+def role_checker(
+    allowed_roles: Iterable[UserRole],
+) -> Callable[..., Awaitable[User]]:
+    """Универсальная функция для проверки ролей пользователя.
+
+    Для одинакового набора ролей возвращает одну и ту же зависимость,
+    поэтому FastAPI выполняет проверку один раз за запрос.
+    """
+    return _build_role_checker(frozenset(allowed_roles))
+
+
+@lru_cache(maxsize=None)
+def _build_role_checker(
+    allowed_roles: FrozenSet[UserRole],
+) -> Callable[..., Awaitable[User]]:
+    """Создает зависимость проверки ролей для набора ролей."""
 
     async def checker(
         current_user: User = Depends(get_current_user),
@@ -1,3 +1,4 @@
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 
@@ -39,6 +40,17 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str
     POSTGRES_PORT: int
     POSTGRES_HOST: str
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_TIMEOUT: int = 5
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = False
+    DB_POOL_USE_LIFO: bool = True
+    DB_KEEPALIVE_INTERVAL: int = 60
+    DB_COMMAND_TIMEOUT: int = 10
+    DB_STATEMENT_CACHE_SIZE: Optional[int] = None
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 256
+    DB_PGBOUNCER: bool = False
 
     REDIS_HOST: str
     REDIS_PORT: int
@@ -53,6 +65,7 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     ALGORITHM: str = 'HS256'
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    PASSWORD_HASH_ROUNDS: int = 12
 
     RABBITMQ_DEFAULT_USER: str
     RABBITMQ_DEFAULT_PASS: str
@@ -66,7 +79,11 @@ class Settings(BaseSettings):
     ADMIN_TG_ID: str
     ADMIN_PASSWORD: str
 
-    @property
+    # Префикс internal-location nginx для отдачи медиа через
+    # X-Accel-Redirect; если не задан, файлы отдаёт приложение
+    MEDIA_ACCEL_REDIRECT_PREFIX: Optional[str] = None
+
+    @cached_property
     def db_url(self) -> URL:
         """Создает ссылку на подключение к Postgres."""
         return URL.create(
@@ -78,7 +95,7 @@ class Settings(BaseSettings):
             database=self.POSTGRES_DB,
         )
 
-    @property
+    @cached_property
     def rabbit_url(self) -> str:
         """Создает ссылку на подключение к RabbitMQ."""
         return (
@@ -88,7 +105,7 @@ class Settings(BaseSettings):
             f'{self.RABBITMQ_DEFAULT_VHOST}'
         )
 
-    @property
+    @cached_property
     def redis_url(self) -> str:
         """URL для подключения к Redis."""
         if self.REDIS_PASSWORD:
@@ -1,3 +1,4 @@
+import os
 from datetime import datetime
 
 # Настройки требований к паролям
@@ -8,6 +9,34 @@ PASSWORD_REQUIRES_DIGITS = True
 PASSWORD_REQUIRES_SPECIAL_CHARS = True
 PASSWORD_FORBIDS_OTHER_SYMBOLS = True
 ALLOWED_SPECIAL_CHARS = '!№;%:?*()_+-=:;<>,.~`'
+# bcrypt учитывает только первые 72 байта пароля
+BCRYPT_MAX_PASSWORD_BYTES = 72
+# Потоки для bcrypt: хеширование не занимает общий пул to_thread
+PASSWORD_HASH_WORKERS = os.cpu_count() or 1
+
+# Размер кеша декодированных JWT токенов
+TOKEN_CACHE_SIZE = 1024
+
+# Размер пачки ключей при удалении из Redis по шаблону
+DELETE_BATCH_SIZE = 500
+
+# Локальный кеш процесса перед Redis
+LOCAL_CACHE_MAXSIZE = 1024
+LOCAL_CACHE_TTL = 5  # секунд
+
+# Время жизни результата проверок healthcheck
+HEALTHCHECK_CACHE_TTL = 1.0  # секунд
+
+# Время жизни кеша списка слотов: расписание меняется редко, но
+# изменения должны быстро доходить до формы бронирования
+SLOTS_CACHE_TTL = 10  # секунд
+
+# Время жизни кеша пользователя, найденного по токену; смена роли или
+# блокировка через API сбрасывают его сразу
+CURRENT_USER_CACHE_TTL = 60  # секунд
+
+# Cache-Control для ответов с ETag
+JSON_CACHE_CONTROL = 'private, max-age=5'
 
 # Настройки логгера
 MS_IN_SECOND = 1000
@@ -32,16 +61,19 @@ INTERCEPTED_LOGGERS = (
     'sqlalchemy',
     'celery',
 )
-NOISE_PATHS = {'/docs', '/openapi.json', '/health', '/livez', '/readyz'}
+NOISE_PATHS = frozenset(
+    {'/docs', '/openapi.json', '/health', '/livez', '/readyz'},
+)
 HTTP_LOG_TEMPLATE = (
     '{method} {path} -> {status} ({ms:.1f} ms)\n    ip={ip}\n    ua={ua}\n'
 )
 
 # Настройки медиа
-ALLOWED_IMAGE_EXTENSIONS = {'jpg', 'jpeg', 'png'}
+ALLOWED_IMAGE_EXTENSIONS = frozenset({'jpg', 'jpeg', 'png'})
 MAX_IMAGE_FILE_SIZE = 5 * 1024 * 1024  # 5MB в байтах
 JPEG_QUALITY = 85
 MEDIA_DIR = 'media'  # Директория для хранения медиа файлов
+IMAGE_POOL_WORKERS = os.cpu_count() or 1  # Процессы для обработки
 
 # Разрешённый формат телефонного номера
 PHONE_PATTERN = r'^\+[1-9][0-9]{7,14}$'
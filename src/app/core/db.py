@@ -1,8 +1,10 @@
+import asyncio
 import uuid
 from datetime import datetime
-from typing import Annotated, AsyncIterator
+from typing import Annotated, Any, AsyncIterator
 
 from fastapi import Depends
+from loguru import logger
 from sqlalchemy import UUID, Boolean, DateTime, func, text
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
@@ -17,6 +19,7 @@ from sqlalchemy.orm import (
 )
 
 from app.core.config import settings
+from app.utils.ids import uuid7
 
 
 class Base(DeclarativeBase):
@@ -29,6 +32,9 @@ class Base(DeclarativeBase):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
+        # UUIDv7 на стороне приложения сохраняет локальность вставок
+        # в индекс первичного ключа; серверный default — для ручных вставок
+        default=uuid7,
         server_default=text('gen_random_uuid()'),
     )
     is_active: Mapped[bool] = mapped_column(
@@ -49,9 +55,45 @@ class Base(DeclarativeBase):
     )
 
 
-engine = create_async_engine(settings.db_url)
+def _get_connect_args() -> dict[str, Any]:
+    """Параметры asyncpg для коротких OLTP-запросов."""
+    connect_args: dict[str, Any] = {
+        'command_timeout': settings.DB_COMMAND_TIMEOUT,
+    }
+    if settings.DB_PGBOUNCER:
+        # PgBouncer в режиме transaction не передает произвольные
+        # стартовые параметры и не сохраняет prepared statements
+        # между транзакциями
+        connect_args['statement_cache_size'] = 0
+        connect_args['prepared_statement_cache_size'] = 0
+        connect_args['prepared_statement_name_func'] = lambda: (
+            f'__asyncpg_{uuid.uuid4()}__'
+        )
+        return connect_args
+    # JIT только замедляет короткие запросы приложения
+    connect_args['server_settings'] = {'jit': 'off'}
+    # Подготовленные выражения SQLAlchemy на соединение: повторный
+    # запрос той же формы пропускает разбор и планирование
+    connect_args['prepared_statement_cache_size'] = (
+        settings.DB_PREPARED_STATEMENT_CACHE_SIZE
+    )
+    if settings.DB_STATEMENT_CACHE_SIZE is not None:
+        connect_args['statement_cache_size'] = settings.DB_STATEMENT_CACHE_SIZE
+    return connect_args
+
+
+engine = create_async_engine(
+    settings.db_url,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    pool_use_lifo=settings.DB_POOL_USE_LIFO,
+    connect_args=_get_connect_args(),
+)
 
-SessionFactory = async_sessionmaker(engine)
+SessionFactory = async_sessionmaker(engine, expire_on_commit=False)
 
 
 async def get_async_session() -> AsyncIterator[AsyncSession]:
@@ -61,3 +103,18 @@ async def get_async_session() -> AsyncIterator[AsyncSession]:
 
 
 DbSession = Annotated[AsyncSession, Depends(get_async_session)]
+
+
+async def keep_pool_alive() -> None:
+    """Периодически проверяет соединение вместо pre-ping на каждом запросе.
+
+    При LIFO-пуле проверяется верхнее, самое часто используемое
+    соединение, поэтому оно не простаивает до разрыва.
+    """
+    while True:
+        await asyncio.sleep(settings.DB_KEEPALIVE_INTERVAL)
+        try:
+            async with engine.connect() as connection:
+                await connection.execute(text('SELECT 1'))
+        except Exception as e:
+            logger.warning('Проверка соединения с БД не удалась: {}', e)
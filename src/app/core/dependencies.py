@@ -1,6 +1,8 @@
-from fastapi import Depends
+from fastapi import Depends, Security
 
+from app.core.auth import public_or_role_checker, role_checker
 from app.services.cache_service import CacheService, cache_service
+from app.utils.enums import UserRole
 
 
 async def get_cache_service() -> CacheService:
@@ -9,3 +11,12 @@ async def get_cache_service() -> CacheService:
 
 
 CacheServiceDep = Depends(get_cache_service)
+
+AnyUserDep = Depends(
+    role_checker((UserRole.MANAGER, UserRole.ADMIN, UserRole.USER)),
+)
+StaffDep = Depends(role_checker((UserRole.MANAGER, UserRole.ADMIN)))
+AdminDep = Depends(role_checker((UserRole.ADMIN,)))
+PublicOrStaffDep = Security(
+    public_or_role_checker((UserRole.MANAGER, UserRole.ADMIN)),
+)
@@ -1,13 +1,38 @@
 from typing import Any
 
-from fastapi import Request, status
+from fastapi import Request, Response, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from loguru import logger
+from pydantic_core import to_json
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
+from app.core.exceptions import DomainValidationError, NotFoundError
+
+# Тело ответа 500 одинаково для всех запросов и сериализуется один раз
+_INTERNAL_ERROR_BODY = to_json(
+    {
+        'code': status.HTTP_500_INTERNAL_SERVER_ERROR,
+        'detail': 'Внутренняя ошибка сервера',
+    },
+)
+
+
+def _json_response(status_code: int, content: Any) -> Response:
+    """Сериализует тело ошибки через pydantic-core без json.dumps."""
+    if not isinstance(content, bytes):
+        content = to_json(content)
+    return Response(
+        content=content,
+        status_code=status_code,
+        media_type='application/json',
+    )
+
 
 def _format_error(code: int, detail: Any) -> dict[str, Any]:
     """Форматирует сообщение об ошибке в единый вид."""
+    # Чаще всего detail уже строка, приводить её к str не нужно
+    if isinstance(detail, str):
+        return {'code': code, 'detail': detail}
     if isinstance(detail, dict):
         detail_code = detail.get('code', code)
         detail_str = detail.get('detail') or detail.get('message')
@@ -15,29 +40,73 @@ def _format_error(code: int, detail: Any) -> dict[str, Any]:
             return {'code': detail_code, 'detail': str(detail_str)}
         return {'code': detail_code, 'detail': str(detail)}
     if isinstance(detail, list):
-        detail = '; '.join(str(item) for item in detail)
+        return {'code': code, 'detail': '; '.join(map(str, detail))}
     return {'code': code, 'detail': str(detail) if detail else ''}
 
 
 async def validation_exception_handler(
     request: Request,
     exc: RequestValidationError,
-) -> JSONResponse:
+) -> Response:
     """Перехватывает ошибки валидации и возвращает понятные сообщения."""
-    messages = [
-        error['msg'].replace('Value error, ', '') for error in exc.errors()
-    ]
-    message = '; '.join(messages) if messages else 'Ошибка валидации данных'
-    return JSONResponse(
-        status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
-        content=_format_error(status.HTTP_422_UNPROCESSABLE_CONTENT, message),
+    errors = exc.errors()
+    message = (
+        '; '.join(
+            error['msg'].replace('Value error, ', '') for error in errors
+        )
+        if errors
+        else 'Ошибка валидации данных'
+    )
+    return _json_response(
+        status.HTTP_422_UNPROCESSABLE_CONTENT,
+        _format_error(status.HTTP_422_UNPROCESSABLE_CONTENT, message),
     )
 
 
 async def http_exception_handler(
     request: Request,
     exc: StarletteHTTPException,
-) -> JSONResponse:
+) -> Response:
     """Унифицирует формат ответа для HTTP исключений."""
     content = _format_error(exc.status_code, exc.detail)
-    return JSONResponse(status_code=exc.status_code, content=content)
+    return _json_response(exc.status_code, content)
+
+
+async def domain_validation_error_handler(
+    request: Request,
+    exc: DomainValidationError,
+) -> Response:
+    """Преобразует ошибки валидации бизнес-логики в ответ 400."""
+    logger.warning('{} {}: {}', request.method, request.url.path, exc)
+    return _json_response(
+        status.HTTP_400_BAD_REQUEST,
+        _format_error(status.HTTP_400_BAD_REQUEST, str(exc)),
+    )
+
+
+async def not_found_error_handler(
+    request: Request,
+    exc: NotFoundError,
+) -> Response:
+    """Преобразует ошибки поиска связанных объектов в ответ 404."""
+    logger.warning('{} {}: {}', request.method, request.url.path, exc)
+    return _json_response(
+        status.HTTP_404_NOT_FOUND,
+        _format_error(status.HTTP_404_NOT_FOUND, str(exc)),
+    )
+
+
+async def unhandled_exception_handler(
+    request: Request,
+    exc: Exception,
+) -> Response:
+    """Возвращает единый ответ 500 для непредвиденных ошибок."""
+    logger.opt(exception=exc).error(
+        'Необработанная ошибка {} {}',
+        request.method,
+        request.url.path,
+    )
+    return _json_response(
+        status.HTTP_500_INTERNAL_SERVER_ERROR,
+        _INTERNAL_ERROR_BODY,
+    )
@@ -0,0 +1,6 @@
+class NotFoundError(LookupError):
+    """Запрошенный или связанный объект не найден (ответ 404)."""
+
+
+class DomainValidationError(ValueError):
+    """Данные нарушают правила бизнес-логики (ответ 400)."""
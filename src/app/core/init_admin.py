@@ -1,7 +1,8 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.auth import get_password_hash
+from app.core.auth import get_password_hash, verify_password
 from app.core.config import settings
+from app.models.user import User
 from app.repositories.user import user_repository
 from app.schemas.user import UserCreate
 from app.utils.enums import UserRole
@@ -27,19 +28,27 @@ async def upsert_admin_if_not_exist(session: AsyncSession) -> None:
         existing_user.email = admin_user.email
         existing_user.phone = admin_user.phone
         existing_user.tg_id = admin_user.tg_id
-        existing_user.hashed_password = get_password_hash(admin_user.password)
+        # bcrypt дорогой: перехешируем, только если пароль сменился
+        if not verify_password(
+            admin_user.password,
+            existing_user.hashed_password,
+        ):
+            existing_user.hashed_password = get_password_hash(
+                admin_user.password,
+            )
         existing_user.role = UserRole.ADMIN
         existing_user.is_active = True
         await session.commit()
 
     else:
-        # Если пользователь не найден, создаём нового с ролью администратора
-        new_user = UserCreate(
-            username=settings.ADMIN_USERNAME,
-            email=settings.ADMIN_EMAIL,
-            phone=settings.ADMIN_PHONE,
-            tg_id=settings.ADMIN_TG_ID,
-            password=settings.ADMIN_PASSWORD,
-            role=UserRole.ADMIN,
+        # Если пользователь не найден, создаём нового с ролью администратора.
+        # UserCreate не содержит роли, поэтому модель собирается здесь же;
+        # уникальность уже проверена поиском выше
+        session.add(
+            User(
+                **admin_user.model_dump(exclude={'password'}),
+                hashed_password=get_password_hash(admin_user.password),
+                role=UserRole.ADMIN,
+            ),
         )
-        await user_repository.create(session, obj_in=new_user)
+        await session.commit()
@@ -20,16 +20,18 @@ from app.core.constants import (
 
 _STD_INTERCEPT_CONFIGURED = False
 
+# Стандартные уровни logging совпадают по имени с уровнями loguru
+_STDLIB_LEVELS = {
+    name: name for name in ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
+}
+
 
 class InterceptHandler(logging.Handler):
     """Перехват stdlib логов (uvicorn и sqlalchemy) в loguru."""
 
     def emit(self, record: logging.LogRecord) -> None:
         """Передаёт запись стандартного логгера в Loguru."""
-        try:
-            lvl = logger.level(record.levelname).name
-        except Exception:
-            lvl = record.levelno
+        lvl = _STDLIB_LEVELS.get(record.levelname, record.levelno)
         logger.opt(
             depth=LOG_DEPTH,
             exception=False,
@@ -84,7 +86,8 @@ def configure_logging() -> None:
         sys.stdout,
         level=settings.LOG_LEVEL,
         format=LOG_FORMAT,
-        colorize=True,
+        # В Docker и systemd stdout не терминал: ANSI-коды там не нужны
+        colorize=sys.stdout.isatty(),
         enqueue=True,
         backtrace=False,
         diagnose=False,
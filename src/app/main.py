@@ -1,3 +1,5 @@
+import asyncio
+import os
 from contextlib import asynccontextmanager
 from typing import AsyncIterator
 
@@ -6,25 +8,37 @@ from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.api.endpoints import routers
-from app.core.db import SessionFactory
+from app.core.constants import MEDIA_DIR
+from app.core.db import SessionFactory, keep_pool_alive
 from app.core.exception_handler import (
+    domain_validation_error_handler,
     http_exception_handler,
+    not_found_error_handler,
+    unhandled_exception_handler,
     validation_exception_handler,
 )
+from app.core.exceptions import DomainValidationError, NotFoundError
 from app.core.init_admin import upsert_admin_if_not_exist
 from app.core.logging import configure_logging
+from app.middleware.auth import auth_middleware
 from app.middleware.http_logging import logging_middleware
 from app.services.cache_service import cache_service
+from app.services.image_pool import image_pool
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator:
     """Запускает логгер при запуске приложения."""
     configure_logging()
+    os.makedirs(MEDIA_DIR, exist_ok=True)
     await cache_service.connect()
+    image_pool.start()
     async with SessionFactory() as session:
         await upsert_admin_if_not_exist(session)
+    keepalive_task = asyncio.create_task(keep_pool_alive())
     yield
+    keepalive_task.cancel()
+    image_pool.shutdown()
     await cache_service.disconnect()
 
 
@@ -38,7 +52,14 @@ app = FastAPI(
 
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
 app.add_exception_handler(StarletteHTTPException, http_exception_handler)
+app.add_exception_handler(
+    DomainValidationError,
+    domain_validation_error_handler,
+)
+app.add_exception_handler(NotFoundError, not_found_error_handler)
+app.add_exception_handler(Exception, unhandled_exception_handler)
 
+app.middleware('http')(auth_middleware)
 app.middleware('http')(logging_middleware)
 
 
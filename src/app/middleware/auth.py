@@ -0,0 +1,32 @@
+from typing import Callable
+
+from fastapi import Request, Response
+
+from app.core.auth import decode_access_token
+
+_BEARER_PREFIX = 'Bearer '
+_BEARER_PREFIX_LOWER = _BEARER_PREFIX.lower()
+_BEARER_PREFIX_LEN = len(_BEARER_PREFIX)
+
+
+async def auth_middleware(
+    request: Request,
+    call_next: Callable,
+) -> Response:
+    """Middleware для однократного разбора JWT токена.
+
+    Декодирует Bearer-токен из заголовка Authorization и сохраняет
+    полезную нагрузку (None для невалидного токена) в
+    request.state.token_payload. Её читают логирование и зависимости
+    авторизации, поэтому подпись проверяется один раз за запрос.
+    """
+    auth = request.headers.get('authorization')
+    # Регистр проверяем только у префикса, не копируя весь заголовок
+    if auth and (
+        auth.startswith(_BEARER_PREFIX)
+        or auth[:_BEARER_PREFIX_LEN].lower() == _BEARER_PREFIX_LOWER
+    ):
+        request.state.token_payload = decode_access_token(
+            auth[_BEARER_PREFIX_LEN:].strip(),
+        )
+    return await call_next(request)
@@ -1,43 +1,36 @@
-import base64
-import json
 import time
 import uuid
 from typing import Callable
 
 from fastapi import Request, Response
 from loguru import logger
+from starlette.datastructures import Headers
 
 from app.core.constants import HTTP_LOG_TEMPLATE, MS_IN_SECOND, NOISE_PATHS
 
 
-def _get_request_id(request: Request) -> str:
+def _get_request_id(headers: Headers) -> str:
     """Возвращает X-Request-ID из заголовков или создаёт новый UUID."""
-    return request.headers.get('X-Request-ID', str(uuid.uuid4()))
+    return headers.get('x-request-id') or str(uuid.uuid4())
 
 
 def _get_user_data(request: Request) -> tuple[str, str]:
-    """Извлекает username и user_id или возвращает ('-', 'SYSTEM')."""
-    auth = request.headers.get('authorization') or request.headers.get(
-        'Authorization',
-    )
-    if auth and auth.lower().startswith('bearer '):
-        try:
-            payload_b64 = auth.split()[1].split('.')[1]
-            payload_b64 += '=' * (-len(payload_b64) % 4)
-            payload = json.loads(
-                base64.urlsafe_b64decode(payload_b64).decode(),
-            )
-            uid = payload.get('user_id') or payload.get('sub') or '-'
-            uname = payload.get('username') or payload.get('sub') or 'SYSTEM'
-            return str(uid), str(uname)
-        except Exception:
-            pass
-    return '-', 'SYSTEM'
-
-
-def _get_client_ip(request: Request) -> str:
+    """Извлекает user_id и username или возвращает ('-', 'SYSTEM').
+
+    Берёт полезную нагрузку, проверенную auth_middleware; данные из
+    невалидного токена в лог не попадают.
+    """
+    payload = getattr(request.state, 'token_payload', None)
+    if payload is None:
+        return '-', 'SYSTEM'
+    # sub обязателен и проверен при декодировании токена
+    uid = payload['sub']
+    return uid, payload.get('username') or uid
+
+
+def _get_client_ip(request: Request, headers: Headers) -> str:
     """Возвращает IP-адрес клиента."""
-    xff = request.headers.get('x-forwarded-for')
+    xff = headers.get('x-forwarded-for')
     if xff:
         return xff.split(',')[0].strip()
     return request.client.host if request.client else '-'
@@ -68,11 +61,10 @@ async def logging_middleware(
     Не выводит пути (из NOISE_PATHS), кроме ошибок.
     """
     start = time.perf_counter()
-    request_id = _get_request_id(request)
+    headers = request.headers
+    request_id = _get_request_id(headers)
     path = request.url.path
     method = request.method
-    client_ip = _get_client_ip(request)
-    ua = request.headers.get('user-agent', '-')
 
     status = 500
     response: Response | None = None
@@ -81,16 +73,19 @@ async def logging_middleware(
         status = response.status_code
     except Exception:
         logger.opt(exception=True).error(
-            f'Необработанное исключение: {method} {path}',
+            'Необработанное исключение: {} {}',
+            method,
+            path,
         )
         raise
     finally:
-        user_id, username = _get_user_data(request)
         ms = (time.perf_counter() - start) * MS_IN_SECOND
         level = _choose_level(status)
         should_log = (level == 'ERROR') or (path not in NOISE_PATHS)
 
+        # Контекст пользователя и клиента собираем, только если пишем лог
         if should_log:
+            user_id, username = _get_user_data(request)
             with logger.contextualize(
                 request_id=request_id,
                 user_id=user_id,
@@ -103,8 +98,8 @@ async def logging_middleware(
                     path=path,
                     status=status,
                     ms=ms,
-                    ip=client_ip,
-                    ua=ua,
+                    ip=_get_client_ip(request, headers),
+                    ua=headers.get('user-agent', '-'),
                 )
 
         if response is not None:
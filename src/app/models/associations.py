@@ -14,9 +14,12 @@ class CafeManager(Base):
         ForeignKey('cafe.id', ondelete='CASCADE'),
         primary_key=True,
     )
+    # Первичный ключ начинается с cafe_id; поиск кафе менеджера идёт по
+    # user_id и без своего индекса сканировал бы таблицу
     user_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey('user.id', ondelete='CASCADE'),
         primary_key=True,
+        index=True,
     )
 
 
@@ -31,6 +34,7 @@ class DishCafe(Base):
     cafe_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey('cafe.id', ondelete='CASCADE'),
         primary_key=True,
+        index=True,
     )
 
 
@@ -45,4 +49,5 @@ class ActionCafe(Base):
     cafe_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey('cafe.id', ondelete='CASCADE'),
         primary_key=True,
+        index=True,
     )
@@ -2,7 +2,7 @@ import uuid
 from datetime import date
 from typing import TYPE_CHECKING, List
 
-from sqlalchemy import Date, ForeignKey, Integer, Text
+from sqlalchemy import Date, ForeignKey, Index, Integer, Text, text
 from sqlalchemy.dialects.postgresql import ENUM
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -61,3 +61,14 @@ class Booking(Base):
         viewonly=True,
         lazy='selectin',
     )
+
+    __table_args__ = (
+        # Списки и проверки читают только активные бронирования:
+        # частичный индекс не хранит отменённые и удалённые строки
+        Index(
+            'ix_booking_active_cafe_date',
+            'cafe_id',
+            'booking_date',
+            postgresql_where=text('is_active'),
+        ),
+    )
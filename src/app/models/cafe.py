@@ -38,30 +38,32 @@ class Cafe(Base):
         nullable=True,
     )
 
+    # Связи подгружаются только опциями запроса в репозиториях, неявная
+    # загрузка с SQL выбрасывает исключение
     managers: Mapped[List['User']] = relationship(
         secondary='cafemanager',
         back_populates='cafe',
-        lazy='selectin',
+        lazy='raise_on_sql',
     )
     tables: Mapped[List['Table']] = relationship(
         back_populates='cafe',
-        lazy='selectin',
+        lazy='raise_on_sql',
     )
     slots: Mapped[List['Slot']] = relationship(
         back_populates='cafe',
-        lazy='selectin',
+        lazy='raise_on_sql',
     )
     dishes: Mapped[List['Dish']] = relationship(
         back_populates='cafes',
         secondary='dishcafe',
-        lazy='selectin',
+        lazy='raise_on_sql',
     )
     actions: Mapped[List['Action']] = relationship(
         back_populates='cafes',
         secondary='actioncafe',
-        lazy='selectin',
+        lazy='raise_on_sql',
     )
     booking: Mapped[List['Booking']] = relationship(
         back_populates='cafe',
-        lazy='selectin',
+        lazy='raise_on_sql',
     )
@@ -31,5 +31,5 @@ class Dish(Base):
     cafes: Mapped[List['Cafe']] = relationship(
         secondary='dishcafe',
         back_populates='dishes',
-        lazy='selectin',
+        lazy='raise_on_sql',
     )
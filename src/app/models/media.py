@@ -1,10 +1,12 @@
-from uuid import UUID, uuid4
+from typing import Optional
+from uuid import UUID
 
-from sqlalchemy import String
+from sqlalchemy import LargeBinary, String
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.db import Base
+from app.utils.ids import uuid7
 
 
 class Media(Base):
@@ -15,7 +17,7 @@ class Media(Base):
     id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
         primary_key=True,
-        default=uuid4,
+        default=uuid7,
         nullable=False,
     )
     filename: Mapped[str] = mapped_column(
@@ -34,3 +36,11 @@ class Media(Base):
         String(500),
         nullable=False,
     )
+    # SHA-256 исходного файла: повторная загрузка того же изображения
+    # возвращает уже сохранённую запись
+    content_sha256: Mapped[Optional[bytes]] = mapped_column(
+        LargeBinary(32),
+        unique=True,
+        index=True,
+        nullable=True,
+    )
@@ -30,7 +30,7 @@ class Slot(Base):
     description: Mapped[str] = mapped_column(Text, nullable=False)
     cafe: Mapped['Cafe'] = relationship(
         back_populates='slots',
-        lazy='selectin',
+        lazy='raise_on_sql',
     )
 
     __table_args__ = (
@@ -26,7 +26,7 @@ class Table(Base):
 
     cafe: Mapped['Cafe'] = relationship(
         back_populates='tables',
-        lazy='selectin',
+        lazy='raise_on_sql',
     )
 
     __table_args__ = (
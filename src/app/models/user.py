@@ -47,11 +47,11 @@ class User(SQLAlchemyBaseUserTableUUID, Base):
         secondary='cafemanager',
         back_populates='managers',
         single_parent=True,
-        lazy='selectin',
+        lazy='raise_on_sql',
     )
     booking: Mapped[List['Booking']] = relationship(
         back_populates='user',
-        lazy='selectin',
+        lazy='raise_on_sql',
     )
 
     __table_args__ = (
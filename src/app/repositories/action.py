@@ -5,6 +5,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.exceptions import NotFoundError
 from app.models import Action, Cafe, Media
 from app.repositories.base import CRUDBase
 from app.schemas.action import ActionCreate, ActionUpdate
@@ -50,7 +51,7 @@ class ActionRepository(CRUDBase[Action, ActionCreate, ActionUpdate]):
             many=True,
             offset=skip,
             limit=limit,
-            options=[selectinload(Action.cafes)],
+            options=[selectinload(Action.cafes).raiseload('*')],
         )
 
     async def create_with_cafes(
@@ -115,7 +116,7 @@ class ActionRepository(CRUDBase[Action, ActionCreate, ActionUpdate]):
         cafes_result = await session.execute(cafes_stmt)
         cafes = cafes_result.scalars().all()
         if len(cafes) != len(set(cafes_ids)):
-            raise ValueError('Некоторые кафе не найдены или отключены')
+            raise NotFoundError('Некоторые кафе не найдены или отключены')
         return cafes
 
     async def _ensure_photo_exists(
@@ -128,7 +129,7 @@ class ActionRepository(CRUDBase[Action, ActionCreate, ActionUpdate]):
             return
         photo = await session.get(Media, photo_id)
         if photo is None:
-            raise ValueError('Указанное изображение не найдено')
+            raise NotFoundError('Указанное изображение не найдено')
 
 
 action_repository = ActionRepository()
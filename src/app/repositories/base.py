@@ -1,10 +1,9 @@
 from typing import Any, Generic, Iterable, Optional, Sequence, Type, TypeVar
 
-from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import inspect, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Load
+from sqlalchemy.orm import Load, load_only
 
 from app.core.db import Base
 from app.models.user import User
@@ -20,6 +19,15 @@ class CRUDBase(Generic[ModelT, CreateSchemaT, UpdateSchemaT]):
     def __init__(self, model: Type[ModelT]) -> None:
         """Инициализация класса."""
         self.model = model
+        mapper = inspect(model)
+        # Имена колонок таблицы: обновление не сериализует объект целиком
+        self._columns = frozenset(mapper.columns.keys())
+        # Атрибуты модели для фильтров собираются один раз, а не
+        # через hasattr/getattr на каждый запрос
+        self._fields = {
+            key: getattr(model, key)
+            for key in (*self._columns, *mapper.relationships.keys())
+        }
 
     async def get(
         self,
@@ -30,6 +38,7 @@ class CRUDBase(Generic[ModelT, CreateSchemaT, UpdateSchemaT]):
         limit: Optional[int] = None,
         offset: Optional[int] = None,
         options: Iterable[Load] = (),
+        fields: Sequence[str] = (),
         **filters: Any,
     ) -> list[ModelT] | ModelT:
         """Универсальная выборка по равенствам полям модели.
@@ -43,13 +52,15 @@ class CRUDBase(Generic[ModelT, CreateSchemaT, UpdateSchemaT]):
             many: True — вернуть список, False — вернуть первый или None.
             order_by, limit, offset: необязательные параметры выдачи.
             options: ORM-опции загрузки (selectinload и т.п.).
+            fields: имена колонок модели, которые нужно выбрать;
+            по умолчанию выбираются все.
             **filters: равенства по полям модели (field=value).
 
         Исключения:
             ValueError — если передан фильтр по несуществующему полю модели.
         """
         self._validate_filters(filters)
-        conditions = [getattr(self.model, k) == v for k, v in filters.items()]
+        conditions = [self._fields[k] == v for k, v in filters.items()]
         if predicates:
             conditions.extend(predicates)
 
@@ -60,6 +71,11 @@ class CRUDBase(Generic[ModelT, CreateSchemaT, UpdateSchemaT]):
             stmt = stmt.offset(offset)
         if limit:
             stmt = stmt.limit(limit)
+        if fields:
+            self._validate_filters(dict.fromkeys(fields))
+            stmt = stmt.options(
+                load_only(*(self._fields[f] for f in fields)),
+            )
         if options:
             stmt = stmt.options(*options)
 
@@ -96,15 +112,16 @@ class CRUDBase(Generic[ModelT, CreateSchemaT, UpdateSchemaT]):
         session: AsyncSession,
     ) -> ModelT:
         """Обновление записи в БД."""
-        obj_data = jsonable_encoder(db_obj)
         update_data = obj_in.dict(exclude_unset=True)
 
-        for field in obj_data:
-            if field in update_data:
-                setattr(db_obj, field, update_data[field])
+        for field in self._columns.intersection(update_data):
+            setattr(db_obj, field, update_data[field])
         session.add(db_obj)
         await session.commit()
-        await session.refresh(db_obj)
+        # Перечитываем только колонки, вычисленные сервером (updated_at)
+        expired = inspect(db_obj).expired_attributes
+        if expired:
+            await session.refresh(db_obj, expired)
         return db_obj
 
     async def delete(self, db_obj: ModelT, session: AsyncSession) -> ModelT:
@@ -115,7 +132,7 @@ class CRUDBase(Generic[ModelT, CreateSchemaT, UpdateSchemaT]):
 
     def _validate_filters(self, filters: dict[str, Any]) -> None:
         """Валидация фильтров, примененных к get()."""
-        unknown = [k for k in filters if not hasattr(self.model, k)]
+        unknown = [k for k in filters if k not in self._fields]
         if unknown:
             raise ValueError(
                 'Некорректные поля фильтра для '
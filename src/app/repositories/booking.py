@@ -1,17 +1,43 @@
 from datetime import date
-from typing import List, Optional
+from itertools import product
+from typing import Iterable, List, Optional
 from uuid import UUID
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, func, literal, select, tuple_, union_all
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
+from app.core.exceptions import DomainValidationError
 from app.models import Booking, Cafe, ReservationUnit, Slot, Table
 from app.repositories.base import CRUDBase
 from app.schemas.booking import BookingCreate, BookingUpdate
 from app.services.availability_service import AvailabilityService
 from app.utils.enums import BookingStatus
 
+# Метки строк в общем запросе проверки кафе, столов и слотов
+_CAFE_ROW = 'cafe'
+_TABLE_ROW = 'table'
+_SLOT_ROW = 'slot'
+
+# Колонки для BookingShortInfo в списке бронирований
+_SHORT_FIELDS = (
+    'id',
+    'cafe_id',
+    'booking_date',
+    'status',
+    'guest_number',
+    'is_active',
+)
+
+# Связи для BookingInfo и уведомлений: письма уходят менеджерам кафе
+_WITH_RELATIONS = (
+    selectinload(Booking.user),
+    selectinload(Booking.cafe).selectinload(Cafe.managers),
+    selectinload(Booking.tables),
+    selectinload(Booking.slots),
+)
+
 
 class BookingRepository(CRUDBase[Booking, BookingCreate, BookingUpdate]):
     """Репозиторий для операций с бронированиями."""
@@ -29,12 +55,20 @@ class BookingRepository(CRUDBase[Booking, BookingCreate, BookingUpdate]):
         return await self.get(
             session,
             id=booking_id,
-            options=[
-                selectinload(Booking.user),
-                selectinload(Booking.cafe),
-                selectinload(Booking.tables),
-                selectinload(Booking.slots),
-            ],
+            options=_WITH_RELATIONS,
+        )
+
+    async def _reload_with_relations(
+        self,
+        session: AsyncSession,
+        booking_id: UUID,
+    ) -> Booking:
+        """Перечитывает сохранённое бронирование вместе со связями."""
+        return await session.scalar(
+            select(Booking)
+            .where(Booking.id == booking_id)
+            .options(*_WITH_RELATIONS)
+            .execution_options(populate_existing=True),
         )
 
     async def get_multi_with_relations(
@@ -47,7 +81,11 @@ class BookingRepository(CRUDBase[Booking, BookingCreate, BookingUpdate]):
         cafe_id: Optional[UUID] = None,
         user_id: Optional[UUID] = None,
     ) -> List[Booking]:
-        """Получает список бронирований со всеми связями."""
+        """Получает список бронирований для краткой схемы.
+
+        Выбираются только колонки BookingShortInfo и кафе с полями
+        CafeShortInfo: пользователь, столы и слоты в списке не нужны.
+        """
         conditions = []
         if not show_all:
             conditions.append(Booking.is_active.is_(True))
@@ -61,11 +99,19 @@ class BookingRepository(CRUDBase[Booking, BookingCreate, BookingUpdate]):
             many=True,
             offset=skip,
             limit=limit,
+            fields=_SHORT_FIELDS,
             options=[
-                selectinload(Booking.user),
-                selectinload(Booking.cafe),
-                selectinload(Booking.tables),
-                selectinload(Booking.slots),
+                selectinload(Booking.cafe)
+                .load_only(
+                    Cafe.id,
+                    Cafe.name,
+                    Cafe.address,
+                    Cafe.phone,
+                    Cafe.description,
+                    Cafe.photo_id,
+                )
+                .raiseload('*'),
+                raiseload('*'),
             ],
         )
 
@@ -76,63 +122,35 @@ class BookingRepository(CRUDBase[Booking, BookingCreate, BookingUpdate]):
         user_id: UUID,
     ) -> Booking:
         """Создает бронирование с полной валидацией."""
-        cafe_stmt = select(Cafe).where(Cafe.id == obj_in.cafe_id)
-        cafe_result = await session.execute(cafe_stmt)
-        cafe = cafe_result.scalar_one_or_none()
-        if not cafe:
-            raise ValueError('Кафе не найдено')
         if not await AvailabilityService.validate_booking_date(
             obj_in.booking_date,
         ):
-            raise ValueError('Нельзя бронировать на прошедшие даты')
-        await self._validate_relations(
+            raise DomainValidationError('Нельзя бронировать на прошедшие даты')
+        total_seats = await self._validate_relations(
             session,
             obj_in.cafe_id,
             obj_in.tables_id,
             obj_in.slots_id,
         )
-        tables_stmt = select(Table).where(Table.id.in_(obj_in.tables_id))
-        tables_result = await session.execute(tables_stmt)
-        tables = tables_result.scalars().all()
-        slots_stmt = select(Slot).where(Slot.id.in_(obj_in.slots_id))
-        slots_result = await session.execute(slots_stmt)
-        slots = slots_result.scalars().all()
-        if not await AvailabilityService.validate_tables_capacity(
-            session,
-            obj_in.tables_id,
-            obj_in.guest_number,
-        ):
-            total_seats = sum(table.seat_number for table in tables)
-            raise ValueError(
+        if total_seats < obj_in.guest_number:
+            raise DomainValidationError(
                 'Недостаточно мест: требуется '
                 f'{obj_in.guest_number}, доступно {total_seats}',
             )
-        if not await AvailabilityService.check_tables_availability(
-            session,
-            obj_in.cafe_id,
-            obj_in.tables_id,
-            obj_in.slots_id,
-            obj_in.booking_date,
-        ):
-            raise ValueError('Выбранные столы и слоты уже заняты на эту дату')
         create_data = obj_in.model_dump(exclude={'tables_id', 'slots_id'})
         create_data['user_id'] = user_id
         db_obj = self.model(**create_data)
         session.add(db_obj)
         await session.flush()
-        for table in tables:
-            for slot in slots:
-                reservation_unit = ReservationUnit(
-                    booking_id=db_obj.id,
-                    cafe_id=obj_in.cafe_id,
-                    table_id=table.id,
-                    slot_id=slot.id,
-                    booking_date=obj_in.booking_date,
-                )
-                session.add(reservation_unit)
+        await self._insert_units(
+            session,
+            booking_id=db_obj.id,
+            cafe_id=obj_in.cafe_id,
+            booking_date=obj_in.booking_date,
+            pairs=product(obj_in.tables_id, obj_in.slots_id),
+        )
         await session.commit()
-        await session.refresh(db_obj)
-        return db_obj
+        return await self._reload_with_relations(session, db_obj.id)
 
     async def update_with_validation(
         self,
@@ -142,9 +160,13 @@ class BookingRepository(CRUDBase[Booking, BookingCreate, BookingUpdate]):
     ) -> Booking:
         """Обновляет бронирование с валидацией."""
         if db_obj.booking_date < date.today():
-            raise ValueError('Нельзя изменять прошедшие бронирования')
+            raise DomainValidationError(
+                'Нельзя изменять прошедшие бронирования',
+            )
         if db_obj.status == BookingStatus.DONE:
-            raise ValueError('Нельзя изменять завершенные бронирования')
+            raise DomainValidationError(
+                'Нельзя изменять завершенные бронирования',
+            )
         update_data = obj_in.model_dump(
             exclude_unset=True,
             exclude={'tables_id', 'slots_id'},
@@ -153,42 +175,109 @@ class BookingRepository(CRUDBase[Booking, BookingCreate, BookingUpdate]):
             if not await AvailabilityService.validate_booking_date(
                 update_data['booking_date'],
             ):
-                raise ValueError('Нельзя бронировать на прошедшие даты')
-        for field, value in update_data.items():
-            setattr(db_obj, field, value)
-        if obj_in.tables_id is not None or obj_in.slots_id is not None:
-            delete_units_stmt = delete(ReservationUnit).where(
-                ReservationUnit.booking_id == db_obj.id,
-            )
-            await session.execute(delete_units_stmt)
-            target_cafe_id = obj_in.cafe_id or db_obj.cafe_id
-            target_booking_date = obj_in.booking_date or db_obj.booking_date
-            target_tables_ids = obj_in.tables_id or [
-                table.id for table in db_obj.tables
-            ]
-            target_slots_ids = obj_in.slots_id or [
-                slot.id for slot in db_obj.slots
-            ]
+                raise DomainValidationError(
+                    'Нельзя бронировать на прошедшие даты',
+                )
+        target_cafe_id = obj_in.cafe_id or db_obj.cafe_id
+        target_booking_date = obj_in.booking_date or db_obj.booking_date
+        moved = (
+            target_cafe_id != db_obj.cafe_id
+            or target_booking_date != db_obj.booking_date
+        )
+        if (
+            moved
+            or obj_in.tables_id is not None
+            or obj_in.slots_id is not None
+        ):
+            current_tables_ids = [table.id for table in db_obj.tables]
+            current_slots_ids = [slot.id for slot in db_obj.slots]
+            target_tables_ids = obj_in.tables_id or current_tables_ids
+            target_slots_ids = obj_in.slots_id or current_slots_ids
             await self._validate_relations(
                 session,
                 target_cafe_id,
                 target_tables_ids,
                 target_slots_ids,
             )
-            for table_id in target_tables_ids:
-                for slot_id in target_slots_ids:
-                    reservation_unit = ReservationUnit(
-                        booking_id=db_obj.id,
-                        cafe_id=target_cafe_id,
-                        table_id=table_id,
-                        slot_id=slot_id,
-                        booking_date=target_booking_date,
+            target_pairs = set(product(target_tables_ids, target_slots_ids))
+            if moved:
+                # Все атомы переезжают в другое кафе или на другую дату
+                await session.execute(
+                    delete(ReservationUnit).where(
+                        ReservationUnit.booking_id == db_obj.id,
+                    ),
+                )
+                new_pairs = target_pairs
+            else:
+                # Меняем только разницу между текущими и новыми парами
+                current_pairs = set(
+                    product(current_tables_ids, current_slots_ids),
+                )
+                removed_pairs = current_pairs - target_pairs
+                if removed_pairs:
+                    await session.execute(
+                        delete(ReservationUnit).where(
+                            ReservationUnit.booking_id == db_obj.id,
+                            tuple_(
+                                ReservationUnit.table_id,
+                                ReservationUnit.slot_id,
+                            ).in_(removed_pairs),
+                        ),
                     )
-                    session.add(reservation_unit)
+                new_pairs = target_pairs - current_pairs
+            await self._insert_units(
+                session,
+                booking_id=db_obj.id,
+                cafe_id=target_cafe_id,
+                booking_date=target_booking_date,
+                pairs=new_pairs,
+            )
+        for field, value in update_data.items():
+            setattr(db_obj, field, value)
         session.add(db_obj)
         await session.commit()
-        await session.refresh(db_obj)
-        return db_obj
+        return await self._reload_with_relations(session, db_obj.id)
+
+    async def _insert_units(
+        self,
+        session: AsyncSession,
+        *,
+        booking_id: UUID,
+        cafe_id: UUID,
+        booking_date: date,
+        pairs: Iterable[tuple[UUID, UUID]],
+    ) -> None:
+        """Вставляет атомы резервации (стол, слот) одним INSERT.
+
+        Занятость проверяет уникальное ограничение uq_reservation_atom:
+        конфликтующие пары пропускаются, и если вставлены не все,
+        транзакция откатывается. Так проверка и запись атомарны и не
+        требуют отдельного SELECT. Повторы пар в запросе схлопываются
+        заранее, иначе они считались бы конфликтом.
+        """
+        rows = [
+            {
+                'booking_id': booking_id,
+                'cafe_id': cafe_id,
+                'table_id': table_id,
+                'slot_id': slot_id,
+                'booking_date': booking_date,
+            }
+            for table_id, slot_id in set(pairs)
+        ]
+        if not rows:
+            return
+        inserted = await session.scalars(
+            insert(ReservationUnit)
+            .values(rows)
+            .on_conflict_do_nothing(constraint='uq_reservation_atom')
+            .returning(ReservationUnit.id),
+        )
+        if len(inserted.all()) != len(rows):
+            await session.rollback()
+            raise DomainValidationError(
+                'Выбранные столы и слоты уже заняты на эту дату',
+            )
 
     async def _validate_relations(
         self,
@@ -196,37 +285,55 @@ class BookingRepository(CRUDBase[Booking, BookingCreate, BookingUpdate]):
         cafe_id: UUID,
         tables_ids: List[UUID],
         slots_ids: List[UUID],
-    ) -> None:
-        """Проверяет наличие и активность таблиц и слотов для кафе."""
+    ) -> int:
+        """Проверяет наличие кафе и активность его столов и слотов.
+
+        Возвращает суммарное количество мест выбранных столов.
+        """
         if not tables_ids:
-            raise ValueError('Необходимо указать хотя бы один стол')
+            raise DomainValidationError('Необходимо указать хотя бы один стол')
         if not slots_ids:
-            raise ValueError('Необходимо указать хотя бы один временной слот')
+            raise DomainValidationError(
+                'Необходимо указать хотя бы один временной слот',
+            )
 
-        tables_stmt = select(Table.id).where(
-            Table.id.in_(tables_ids),
-            Table.cafe_id == cafe_id,
-            Table.is_active.is_(True),
+        # Кафе, столы и слоты считаются одним UNION ALL за один round-trip:
+        # по строке-агрегату на каждый вид вместо самих идентификаторов
+        stmt = union_all(
+            select(literal(_CAFE_ROW), func.count(), literal(0)).where(
+                Cafe.id == cafe_id,
+            ),
+            select(
+                literal(_TABLE_ROW),
+                func.count(),
+                func.coalesce(func.sum(Table.seat_number), 0),
+            ).where(
+                Table.id.in_(tables_ids),
+                Table.cafe_id == cafe_id,
+                Table.is_active.is_(True),
+            ),
+            select(literal(_SLOT_ROW), func.count(), literal(0)).where(
+                Slot.id.in_(slots_ids),
+                Slot.cafe_id == cafe_id,
+                Slot.is_active.is_(True),
+            ),
         )
-        tables_result = await session.execute(tables_stmt)
-        db_tables = {row for row in tables_result.scalars().all()}
-        if len(db_tables) != len(set(tables_ids)):
-            raise ValueError(
+        result = await session.execute(stmt)
+        counts = {kind: (found, seats) for kind, found, seats in result}
+
+        if not counts[_CAFE_ROW][0]:
+            raise DomainValidationError('Кафе не найдено')
+        tables_found, total_seats = counts[_TABLE_ROW]
+        if tables_found != len(set(tables_ids)):
+            raise DomainValidationError(
                 'Некоторые столы недоступны или относятся к другому кафе',
             )
-
-        slots_stmt = select(Slot.id).where(
-            Slot.id.in_(slots_ids),
-            Slot.cafe_id == cafe_id,
-            Slot.is_active.is_(True),
-        )
-        slots_result = await session.execute(slots_stmt)
-        db_slots = {row for row in slots_result.scalars().all()}
-        if len(db_slots) != len(set(slots_ids)):
-            raise ValueError(
+        if counts[_SLOT_ROW][0] != len(set(slots_ids)):
+            raise DomainValidationError(
                 'Некоторые временные слоты недоступны или '
                 'относятся к другому кафе',
             )
+        return total_seats
 
 
 booking_repository = BookingRepository()
@@ -1,10 +1,11 @@
 from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.exceptions import DomainValidationError
 from app.models import Cafe, Media, User
 from app.repositories.base import CRUDBase
 from app.schemas.cafe import CafeCreate, CafeUpdate
@@ -46,6 +47,7 @@ class CafeRepository(CRUDBase[Cafe, CafeCreate, CafeUpdate]):
             session,
             *conditions,
             many=True,
+            order_by=(Cafe.id,),
             offset=skip,
             limit=limit,
             options=[selectinload(Cafe.managers)],
@@ -73,17 +75,21 @@ class CafeRepository(CRUDBase[Cafe, CafeCreate, CafeUpdate]):
         db_obj = self.model(**create_data)
         db_obj.managers.extend(managers)
         session.add(db_obj)
+        # Серверные значения колонок приходят в RETURNING при вставке, а
+        # refresh сбросил бы собранный в памяти список менеджеров
         await session.commit()
-        await session.refresh(db_obj)
         return db_obj
 
-    async def update_with_managers(
+    async def update_returning(
         self,
         session: AsyncSession,
-        db_obj: Cafe,
+        cafe_id: UUID,
         obj_in: CafeUpdate,
-    ) -> Cafe:
-        """Обновляет кафе и его связи с менеджерами."""
+    ) -> Optional[Cafe]:
+        """Обновляет кафе одним UPDATE ... RETURNING и его менеджеров.
+
+        Возвращает None, если кафе не найдено.
+        """
         update_data = obj_in.model_dump(
             exclude_unset=True,
             exclude={'managers_id'},
@@ -91,10 +97,10 @@ class CafeRepository(CRUDBase[Cafe, CafeCreate, CafeUpdate]):
 
         await self._ensure_unique_fields(
             session,
-            name=update_data.get('name', db_obj.name),
-            address=update_data.get('address', db_obj.address),
-            phone=update_data.get('phone', db_obj.phone),
-            exclude_id=db_obj.id,
+            name=update_data.get('name'),
+            address=update_data.get('address'),
+            phone=update_data.get('phone'),
+            exclude_id=cafe_id,
         )
 
         if 'photo_id' in update_data:
@@ -103,18 +109,40 @@ class CafeRepository(CRUDBase[Cafe, CafeCreate, CafeUpdate]):
                 update_data.get('photo_id'),
             )
 
-        for field, value in update_data.items():
-            setattr(db_obj, field, value)
+        managers_loader = selectinload(Cafe.managers)
+        if obj_in.managers_id is not None:
+            # Замена менеджеров сбрасывает обратную связь User.cafe у
+            # прежних, поэтому её текущее значение тоже нужно загрузить
+            managers_loader = managers_loader.selectinload(User.cafe)
+
+        if update_data:
+            stmt = (
+                update(Cafe)
+                .where(Cafe.id == cafe_id)
+                .values(**update_data)
+                .returning(Cafe)
+                .options(managers_loader)
+                .execution_options(populate_existing=True)
+            )
+            db_obj = await session.scalar(stmt)
+        else:
+            # Меняются только менеджеры: FOR NO KEY UPDATE держит строку
+            # кафе до коммита, не блокируя вставки бронирований по FK
+            db_obj = await session.scalar(
+                select(Cafe)
+                .where(Cafe.id == cafe_id)
+                .options(managers_loader)
+                .with_for_update(key_share=True),
+            )
+        if db_obj is None:
+            return None
+
         if obj_in.managers_id is not None:
-            db_obj.managers.clear()
-            managers = await self._collect_managers(
+            db_obj.managers = await self._collect_managers(
                 session,
                 obj_in.managers_id,
             )
-            db_obj.managers.extend(managers)
-        session.add(db_obj)
         await session.commit()
-        await session.refresh(db_obj)
         return db_obj
 
     async def _ensure_unique_fields(
@@ -138,7 +166,9 @@ class CafeRepository(CRUDBase[Cafe, CafeCreate, CafeUpdate]):
             )
             result = await session.execute(stmt)
             if result.scalars().first():
-                raise ValueError('Кафе с таким названием уже существует')
+                raise DomainValidationError(
+                    'Кафе с таким названием уже существует',
+                )
 
         if address:
             stmt = select(Cafe.id).where(
@@ -147,7 +177,9 @@ class CafeRepository(CRUDBase[Cafe, CafeCreate, CafeUpdate]):
             )
             result = await session.execute(stmt)
             if result.scalars().first():
-                raise ValueError('Кафе с таким адресом уже существует')
+                raise DomainValidationError(
+                    'Кафе с таким адресом уже существует',
+                )
 
         if phone:
             stmt = select(Cafe.id).where(
@@ -156,7 +188,9 @@ class CafeRepository(CRUDBase[Cafe, CafeCreate, CafeUpdate]):
             )
             result = await session.execute(stmt)
             if result.scalars().first():
-                raise ValueError('Кафе с таким телефоном уже существует')
+                raise DomainValidationError(
+                    'Кафе с таким телефоном уже существует',
+                )
 
     async def _ensure_photo_exists(
         self,
@@ -169,7 +203,7 @@ class CafeRepository(CRUDBase[Cafe, CafeCreate, CafeUpdate]):
 
         photo = await session.get(Media, photo_id)
         if photo is None:
-            raise ValueError('Указанное изображение не найдено')
+            raise DomainValidationError('Указанное изображение не найдено')
 
     async def _collect_managers(
         self,
@@ -180,12 +214,18 @@ class CafeRepository(CRUDBase[Cafe, CafeCreate, CafeUpdate]):
         if not managers_ids:
             return []
 
-        managers_stmt = select(User).where(User.id.in_(managers_ids))
+        # Привязка к кафе выставляет менеджеру User.cafe, для этого нужно
+        # знать прежнее значение
+        managers_stmt = (
+            select(User)
+            .where(User.id.in_(managers_ids))
+            .options(selectinload(User.cafe))
+        )
         managers_result = await session.execute(managers_stmt)
         managers = managers_result.scalars().all()
 
         if len(managers) != len(managers_ids):
-            raise ValueError('Некоторые менеджеры не найдены')
+            raise DomainValidationError('Некоторые менеджеры не найдены')
 
         invalid_roles = [
             manager.id
@@ -193,7 +233,7 @@ class CafeRepository(CRUDBase[Cafe, CafeCreate, CafeUpdate]):
             if manager.role not in {UserRole.MANAGER, UserRole.ADMIN}
         ]
         if invalid_roles:
-            raise ValueError(
+            raise DomainValidationError(
                 (
                     'Некоторые пользователи не имеют роли менеджера/админа: '
                     f'{
@@ -1,10 +1,11 @@
 from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.exceptions import NotFoundError
 from app.models import Cafe, Dish, Media
 from app.repositories.base import CRUDBase
 from app.schemas.dish import DishCreate, DishUpdate
@@ -48,6 +49,7 @@ class DishRepository(CRUDBase[Dish, DishCreate, DishUpdate]):
             session,
             *conditions,
             many=True,
+            order_by=(Dish.id,),
             offset=skip,
             limit=limit,
             options=[selectinload(Dish.cafes)],
@@ -68,17 +70,21 @@ class DishRepository(CRUDBase[Dish, DishCreate, DishUpdate]):
         db_obj = self.model(**create_data)
         db_obj.cafes.extend(cafes)
         session.add(db_obj)
+        # Серверные значения колонок приходят в RETURNING при вставке, а
+        # refresh сбросил бы собранный в памяти список кафе
         await session.commit()
-        await session.refresh(db_obj)
         return db_obj
 
-    async def update_with_cafes(
+    async def update_returning(
         self,
         session: AsyncSession,
-        db_obj: Dish,
+        dish_id: UUID,
         obj_in: DishUpdate,
-    ) -> Dish:
-        """Обновляет блюдо и его связи с кафе."""
+    ) -> Optional[Dish]:
+        """Обновляет блюдо одним UPDATE ... RETURNING и его связи с кафе.
+
+        Возвращает None, если блюдо не найдено.
+        """
         update_data = obj_in.model_dump(
             exclude_unset=True,
             exclude={'cafes_id'},
@@ -90,16 +96,28 @@ class DishRepository(CRUDBase[Dish, DishCreate, DishUpdate]):
                 update_data.get('photo_id'),
             )
 
-        for field, value in update_data.items():
-            setattr(db_obj, field, value)
+        if update_data:
+            stmt = (
+                update(Dish)
+                .where(Dish.id == dish_id)
+                .values(**update_data)
+                .returning(Dish)
+                .options(selectinload(Dish.cafes))
+                .execution_options(populate_existing=True)
+            )
+            db_obj = await session.scalar(stmt)
+        else:
+            db_obj = await self.get_with_cafes(session, dish_id)
+        if db_obj is None:
+            return None
+
         if obj_in.cafes_id is not None:
-            db_obj.cafes.clear()
-            if obj_in.cafes_id:
-                cafes = await self._fetch_cafes(session, obj_in.cafes_id)
-                db_obj.cafes.extend(cafes)
-        session.add(db_obj)
+            db_obj.cafes = (
+                await self._fetch_cafes(session, obj_in.cafes_id)
+                if obj_in.cafes_id
+                else []
+            )
         await session.commit()
-        await session.refresh(db_obj)
         return db_obj
 
     async def _fetch_cafes(
@@ -115,7 +133,7 @@ class DishRepository(CRUDBase[Dish, DishCreate, DishUpdate]):
         cafes_result = await session.execute(cafes_stmt)
         cafes = cafes_result.scalars().all()
         if len(cafes) != len(set(cafes_ids)):
-            raise ValueError('Некоторые кафе не найдены или отключены')
+            raise NotFoundError('Некоторые кафе не найдены или отключены')
         return cafes
 
     async def _ensure_photo_exists(
@@ -128,7 +146,7 @@ class DishRepository(CRUDBase[Dish, DishCreate, DishUpdate]):
             return
         photo = await session.get(Media, photo_id)
         if photo is None:
-            raise ValueError('Указанное изображение не найдено')
+            raise NotFoundError('Указанное изображение не найдено')
 
 
 dish_repository = DishRepository()
@@ -2,10 +2,12 @@ from datetime import time
 from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import load_only, selectinload
 
+from app.core.exceptions import DomainValidationError, NotFoundError
 from app.models import Cafe, Slot
 from app.repositories.base import CRUDBase
 from app.schemas.slot import SlotCreate, SlotUpdate
@@ -18,15 +20,17 @@ class SlotRepository(CRUDBase[Slot, SlotCreate, SlotUpdate]):
         """Инициализация репозитория слотов."""
         super().__init__(Slot)
 
-    async def get_with_cafe(
+    async def get_in_cafe(
         self,
         session: AsyncSession,
         slot_id: UUID,
+        cafe_id: UUID,
     ) -> Optional[Slot]:
-        """Получает слот с информацией о кафе."""
+        """Получает слот указанного кафе с информацией о кафе."""
         return await self.get(
             session,
             id=slot_id,
+            cafe_id=cafe_id,
             options=[selectinload(Slot.cafe)],
         )
 
@@ -39,7 +43,10 @@ class SlotRepository(CRUDBase[Slot, SlotCreate, SlotUpdate]):
         limit: int = 100,
         show_all: bool = False,
     ) -> List[Slot]:
-        """Получает список слотов для конкретного кафе."""
+        """Получает список слотов для конкретного кафе.
+
+        Загружает только колонки SlotShortInfo, без связи с кафе.
+        """
         conditions = [Slot.cafe_id == cafe_id]
         if not show_all:
             conditions.append(Slot.is_active.is_(True))
@@ -48,9 +55,17 @@ class SlotRepository(CRUDBase[Slot, SlotCreate, SlotUpdate]):
             session,
             *conditions,
             many=True,
+            order_by=(Slot.start_time, Slot.id),
             offset=skip,
             limit=limit,
-            options=[selectinload(Slot.cafe)],
+            options=[
+                load_only(
+                    Slot.id,
+                    Slot.start_time,
+                    Slot.end_time,
+                    Slot.description,
+                ),
+            ],
         )
 
     async def create_for_cafe(
@@ -75,42 +90,55 @@ class SlotRepository(CRUDBase[Slot, SlotCreate, SlotUpdate]):
         await session.refresh(db_obj)
         return db_obj
 
-    async def update_with_cafe_validation(
+    async def update_returning(
         self,
         session: AsyncSession,
-        db_obj: Slot,
+        slot_id: UUID,
+        cafe_id: UUID,
         obj_in: SlotUpdate,
-        current_cafe_id: UUID,
-    ) -> Slot:
-        """Обновляет слот с валидацией кафе и временного интервала."""
-        update_data = obj_in.model_dump(exclude_unset=True)
-        target_cafe_id = obj_in.cafe_id or current_cafe_id
+    ) -> Optional[Slot]:
+        """Обновляет слот кафе одним UPDATE ... RETURNING.
 
-        if obj_in.cafe_id and obj_in.cafe_id != current_cafe_id:
+        Корректность интервала проверяет ограничение ck_slot_interval.
+        Возвращает None, если слот в этом кафе не найден.
+        """
+        update_data = obj_in.model_dump(exclude_unset=True)
+        if obj_in.cafe_id and obj_in.cafe_id != cafe_id:
             await self._ensure_cafe_exists(session, obj_in.cafe_id)
-
-        start_time = obj_in.start_time or db_obj.start_time
-        end_time = obj_in.end_time or db_obj.end_time
-        await self._ensure_valid_interval(start_time, end_time)
-
-        if (
-            target_cafe_id != current_cafe_id
-            or obj_in.start_time is not None
-            or obj_in.end_time is not None
-        ):
-            await self._ensure_no_overlap(
-                session,
-                cafe_id=target_cafe_id,
-                start_time=start_time,
-                end_time=end_time,
-                exclude_id=db_obj.id,
-            )
-
-        for field, value in update_data.items():
-            setattr(db_obj, field, value)
-        session.add(db_obj)
+        if not update_data:
+            return await self.get_in_cafe(session, slot_id, cafe_id)
+
+        stmt = (
+            update(Slot)
+            .where(Slot.id == slot_id, Slot.cafe_id == cafe_id)
+            .values(**update_data)
+            .returning(Slot)
+            .options(selectinload(Slot.cafe))
+            .execution_options(populate_existing=True)
+        )
+        try:
+            db_obj = await session.scalar(stmt)
+            if db_obj is None:
+                return None
+            if update_data.keys() & {'cafe_id', 'start_time', 'end_time'}:
+                await self._ensure_no_overlap(
+                    session,
+                    cafe_id=db_obj.cafe_id,
+                    start_time=db_obj.start_time,
+                    end_time=db_obj.end_time,
+                    exclude_id=db_obj.id,
+                )
+        except IntegrityError as e:
+            await session.rollback()
+            if 'ck_slot_interval' in str(e.orig):
+                raise DomainValidationError(
+                    'Время начала должно быть меньше времени окончания',
+                ) from e
+            raise
+        except DomainValidationError:
+            await session.rollback()
+            raise
         await session.commit()
-        await session.refresh(db_obj)
         return db_obj
 
     async def _ensure_cafe_exists(
@@ -121,7 +149,7 @@ class SlotRepository(CRUDBase[Slot, SlotCreate, SlotUpdate]):
         """Возвращает кафе или выбрасывает ошибку, если оно не найдено."""
         cafe = await session.get(Cafe, cafe_id)
         if cafe is None:
-            raise ValueError('Кафе не найдено')
+            raise NotFoundError('Кафе не найдено')
         return cafe
 
     async def _ensure_valid_interval(
@@ -131,9 +159,11 @@ class SlotRepository(CRUDBase[Slot, SlotCreate, SlotUpdate]):
     ) -> None:
         """Проверяет корректность временного интервала."""
         if start_time is None or end_time is None:
-            raise ValueError('Не указано время начала или окончания слота')
+            raise DomainValidationError(
+                'Не указано время начала или окончания слота',
+            )
         if start_time >= end_time:
-            raise ValueError(
+            raise DomainValidationError(
                 'Время начала должно быть меньше времени окончания',
             )
 
@@ -156,7 +186,7 @@ class SlotRepository(CRUDBase[Slot, SlotCreate, SlotUpdate]):
             stmt = stmt.where(Slot.id != exclude_id)
         result = await session.execute(stmt)
         if result.scalars().first():
-            raise ValueError(
+            raise DomainValidationError(
                 'Временной слот пересекается с существующим'
                 'интервалом в этом кафе',
             )
@@ -1,9 +1,12 @@
 from typing import List, Optional
 from uuid import UUID
 
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import load_only, selectinload
 
+from app.core.exceptions import DomainValidationError, NotFoundError
 from app.models import Cafe, Table
 from app.repositories.base import CRUDBase
 from app.schemas.table import TableCreate, TableUpdate
@@ -16,15 +19,17 @@ class TableRepository(CRUDBase[Table, TableCreate, TableUpdate]):
         """Инициализация репозитория столов."""
         super().__init__(Table)
 
-    async def get_with_cafe(
+    async def get_in_cafe(
         self,
         session: AsyncSession,
         table_id: UUID,
+        cafe_id: UUID,
     ) -> Optional[Table]:
-        """Получает стол с информацией о кафе."""
+        """Получает стол указанного кафе с информацией о кафе."""
         return await self.get(
             session,
             id=table_id,
+            cafe_id=cafe_id,
             options=[selectinload(Table.cafe)],
         )
 
@@ -37,7 +42,10 @@ class TableRepository(CRUDBase[Table, TableCreate, TableUpdate]):
         limit: int = 100,
         show_all: bool = False,
     ) -> List[Table]:
-        """Получает список столов для конкретного кафе."""
+        """Получает список столов для конкретного кафе.
+
+        Загружает только колонки TableShortInfo, без связи с кафе.
+        """
         conditions = [Table.cafe_id == cafe_id]
         if not show_all:
             conditions.append(Table.is_active.is_(True))
@@ -45,9 +53,12 @@ class TableRepository(CRUDBase[Table, TableCreate, TableUpdate]):
             session,
             *conditions,
             many=True,
+            order_by=(Table.seat_number, Table.id),
             offset=skip,
             limit=limit,
-            options=[selectinload(Table.cafe)],
+            options=[
+                load_only(Table.id, Table.description, Table.seat_number),
+            ],
         )
 
     async def create_for_cafe(
@@ -65,24 +76,43 @@ class TableRepository(CRUDBase[Table, TableCreate, TableUpdate]):
         await session.refresh(db_obj)
         return db_obj
 
-    async def update_with_cafe_validation(
+    async def update_returning(
         self,
         session: AsyncSession,
-        db_obj: Table,
+        table_id: UUID,
+        cafe_id: UUID,
         obj_in: TableUpdate,
-        current_cafe_id: UUID,
-    ) -> Table:
-        """Обновляет стол с валидацией кафе и уникальности мест."""
-        update_data = obj_in.model_dump(exclude_unset=True)
+    ) -> Optional[Table]:
+        """Обновляет стол кафе одним UPDATE ... RETURNING.
 
-        if obj_in.cafe_id and obj_in.cafe_id != current_cafe_id:
+        Возвращает None, если стол в этом кафе не найден.
+        """
+        update_data = obj_in.model_dump(exclude_unset=True)
+        if obj_in.cafe_id and obj_in.cafe_id != cafe_id:
             await self._ensure_cafe_exists(session, obj_in.cafe_id)
+        if not update_data:
+            return await self.get_in_cafe(session, table_id, cafe_id)
 
-        for field, value in update_data.items():
-            setattr(db_obj, field, value)
-        session.add(db_obj)
+        stmt = (
+            update(Table)
+            .where(Table.id == table_id, Table.cafe_id == cafe_id)
+            .values(**update_data)
+            .returning(Table)
+            .options(selectinload(Table.cafe))
+            .execution_options(populate_existing=True)
+        )
+        try:
+            db_obj = await session.scalar(stmt)
+        except IntegrityError as e:
+            await session.rollback()
+            if 'uq_table_number_per_cafe' in str(e.orig):
+                raise DomainValidationError(
+                    'Стол с таким количеством мест уже существует',
+                ) from e
+            raise
+        if db_obj is None:
+            return None
         await session.commit()
-        await session.refresh(db_obj)
         return db_obj
 
     async def _ensure_cafe_exists(
@@ -93,7 +123,7 @@ class TableRepository(CRUDBase[Table, TableCreate, TableUpdate]):
         """Возвращает кафе или выбрасывает ошибку, если оно не найдено."""
         cafe = await session.get(Cafe, cafe_id)
         if cafe is None:
-            raise ValueError('Кафе не найдено')
+            raise NotFoundError('Кафе не найдено')
         return cafe
 
 
@@ -1,19 +1,17 @@
 from typing import List, Optional, Union
 from uuid import UUID
 
-from passlib.context import CryptContext
 from sqlalchemy import or_, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.auth import get_password_hash
+from app.core.auth import get_password_hash_async
+from app.core.exceptions import DomainValidationError
 from app.models.user import User
 from app.repositories.base import CRUDBase
 from app.schemas.user import UserCreate, UserUpdate, UserUpdateMe
 from app.utils.enums import UserRole
 
-pwd_context = CryptContext(schemes=['bcrypt'], deprecated='auto')
-
 
 class UserRepository(CRUDBase[User, UserCreate, UserUpdate]):
     """Репозиторий для операций с пользователями."""
@@ -29,23 +27,28 @@ class UserRepository(CRUDBase[User, UserCreate, UserUpdate]):
     ) -> User:
         """Создание пользователя с хешированием пароля."""
         try:
-            create_data = obj_in.model_dump(exclude={'password'})
-            create_data['hashed_password'] = get_password_hash(obj_in.password)
-
             # Проверяем уникальность username, email, phone, tg_id
+            # до хеширования, чтобы не тратить bcrypt на отказ
             existing_user = await self.get_by_credentials(session, obj_in)
             if existing_user:
-                raise ValueError(
+                raise DomainValidationError(
                     'Пользователь с такими данными уже существует',
                 )
 
+            create_data = obj_in.model_dump(exclude={'password'})
+            create_data['hashed_password'] = await get_password_hash_async(
+                obj_in.password,
+            )
+
             db_obj = self.model(**create_data)
             session.add(db_obj)
             await session.commit()
             await session.refresh(db_obj)
         except IntegrityError:
             await session.rollback()
-            raise ValueError('Пользователь с такими данными уже существует')
+            raise DomainValidationError(
+                'Пользователь с такими данными уже существует',
+            )
 
         return db_obj
 
@@ -85,9 +88,14 @@ class UserRepository(CRUDBase[User, UserCreate, UserUpdate]):
     ) -> User:
         """Обновление пользователя."""
         update_data = obj_in.model_dump(exclude_unset=True)
+        if not update_data:
+            # Пустой PATCH: проверки и UPDATE с коммитом не нужны
+            return db_obj
 
         if isinstance(obj_in, UserUpdateMe) and 'role' in update_data:
-            raise ValueError('Нельзя изменять роль через этот эндпоинт')
+            raise DomainValidationError(
+                'Нельзя изменять роль через этот эндпоинт',
+            )
 
         conflicting_user = await self.get_by_credentials(
             session,
@@ -96,12 +104,12 @@ class UserRepository(CRUDBase[User, UserCreate, UserUpdate]):
         )
 
         if conflicting_user:
-            raise ValueError(
+            raise DomainValidationError(
                 'Другой пользователь с такими данными уже существует',
             )
 
         if 'password' in update_data:
-            update_data['hashed_password'] = get_password_hash(
+            update_data['hashed_password'] = await get_password_hash_async(
                 update_data.pop('password'),
             )
 
@@ -121,7 +129,9 @@ class UserRepository(CRUDBase[User, UserCreate, UserUpdate]):
             new_phone = update_data.get('phone', db_obj.phone)
             new_email = update_data.get('email', db_obj.email)
             if not new_phone and not new_email:
-                raise ValueError('Пользователь должен иметь email или телефон')
+                raise DomainValidationError(
+                    'Пользователь должен иметь email или телефон',
+                )
 
         for field, value in update_data.items():
             setattr(db_obj, field, value)
@@ -228,5 +228,5 @@ class UserInfo(UserShortInfo):
                 return 2
             return 0
         except Exception as e:
-            logger.error(f'Ошибка конвертации роли: {e}')
+            logger.error('Ошибка конвертации роли: {}', e)
             return 0
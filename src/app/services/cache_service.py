@@ -1,11 +1,118 @@
-import json
+import asyncio
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Hashable, Optional, TypeVar
+from uuid import UUID
 
 from loguru import logger
+from pydantic_core import from_json, to_json
 from redis.asyncio import Redis
 
 from app.core.config import settings
+from app.core.constants import (
+    DELETE_BATCH_SIZE,
+    LOCAL_CACHE_MAXSIZE,
+    LOCAL_CACHE_TTL,
+)
+
+T = TypeVar('T')
+
+ACTIONS_CACHE_TAG = 'actions'
+BOOKINGS_CACHE_TAG = 'bookings'
+SLOTS_CACHE_TAG = 'slots'
+TABLES_CACHE_TAG = 'tables'
+
+
+class LocalTTLCache:
+    """Небольшой LRU-кеш в памяти процесса с ограниченным временем жизни.
+
+    Используется перед Redis для самых частых ключей. Кеш локален для
+    воркера, поэтому после изменений данные в других воркерах могут
+    устаревать не дольше ttl секунд.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = LOCAL_CACHE_MAXSIZE,
+        ttl: float = LOCAL_CACHE_TTL,
+    ) -> None:
+        """Инициализация кеша."""
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Возвращает значение, если оно есть и не устарело."""
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Сохраняет значение, вытесняя самые старые записи."""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Очищает кеш."""
+        self._data.clear()
+
+
+class RequestCoalescer:
+    """Объединяет одновременные загрузки одного и того же ключа.
+
+    Первый запрос выполняет загрузку, остальные ждут его результат,
+    поэтому при промахе кеша в Redis и БД уходит один запрос на ключ.
+    """
+
+    def __init__(self) -> None:
+        """Инициализация реестра выполняющихся загрузок."""
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+
+    async def run(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[T]],
+    ) -> T:
+        """Возвращает результат loader, разделяя его между запросами."""
+        future = self._inflight.get(key)
+        if future is not None:
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # Отменён первый запрос, а не текущий: грузим сами
+                current = asyncio.current_task()
+                if not future.cancelled() or (
+                    current is not None and current.cancelling()
+                ):
+                    raise
+                return await loader()
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Ошибку получают ожидающие, без них не логируем её повторно
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
 
 
 class CacheService:
@@ -15,6 +122,8 @@ class CacheService:
         """."""
         self.redis: Optional[Redis] = None
         self.ttl = settings.REDIS_CACHE_TTL
+        # Готовый JSON акций по id в памяти воркера, перед обращением к Redis
+        self.local_actions = LocalTTLCache()
 
     async def connect(self) -> None:
         """Установка подключения к Redis."""
@@ -27,7 +136,7 @@ class CacheService:
             await self.redis.ping()
             logger.info('Успешное подключение к Redis')
         except Exception as e:
-            logger.error(f'Ошибка подключения к Redis: {str(e)}')
+            logger.error('Ошибка подключения к Redis: {}', e)
             self.redis = None
 
     async def disconnect(self) -> None:
@@ -43,10 +152,10 @@ class CacheService:
         try:
             data = await self.redis.get(key)
             if data:
-                return json.loads(data)
+                return from_json(data)
             return None
         except Exception as e:
-            logger.error(f'Ошибка получения из кеша: {str(e)}')
+            logger.error('Ошибка получения из кеша: {}', e)
             return None
 
     async def set(
@@ -59,12 +168,71 @@ class CacheService:
         if not self.redis:
             return False
         try:
-            serialized_value = json.dumps(value, default=str)
+            serialized_value = to_json(value, fallback=str)
             expire_time = ttl or self.ttl
             await self.redis.setex(key, expire_time, serialized_value)
             return True
         except Exception as e:
-            logger.error(f'Ошибка сохранения в кеш: {str(e)}')
+            logger.error('Ошибка сохранения в кеш: {}', e)
+            return False
+
+    async def get_raw(self, key: str) -> Optional[str]:
+        """Получение сериализованного значения по ключу без декодирования."""
+        if not self.redis:
+            return None
+        try:
+            return await self.redis.get(key)
+        except Exception as e:
+            logger.error('Ошибка получения из кеша: {}', e)
+            return None
+
+    async def set_raw(
+        self,
+        key: str,
+        value: str | bytes,
+        ttl: Optional[int] = None,
+        tag: Optional[str] = None,
+    ) -> bool:
+        """Сохранение уже сериализованного значения в кеш.
+
+        Если указан тег, ключ добавляется в его индекс, чтобы потом
+        инвалидировать все ключи тега без сканирования keyspace.
+        """
+        if not self.redis:
+            return False
+        try:
+            expire_time = ttl or self.ttl
+            if tag is None:
+                await self.redis.setex(key, expire_time, value)
+                return True
+            index_key = self._tag_index_key(tag)
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.setex(key, expire_time, value)
+                pipe.sadd(index_key, key)
+                pipe.expire(index_key, expire_time)
+                await pipe.execute()
+            return True
+        except Exception as e:
+            logger.error('Ошибка сохранения в кеш: {}', e)
+            return False
+
+    async def pipeline_set(
+        self,
+        mapping: dict[str, str | bytes],
+        ttl: Optional[int] = None,
+    ) -> bool:
+        """Сохранение нескольких сериализованных значений за один запрос."""
+        if not self.redis or not mapping:
+            return False
+        try:
+            expire_time = ttl or self.ttl
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key, value in mapping.items():
+                    pipe.setex(key, expire_time, value)
+                await pipe.execute()
+            return True
+        except Exception as e:
+            logger.error('Ошибка сохранения в кеш: {}', e)
             return False
 
     async def delete(self, key: str) -> bool:
@@ -75,7 +243,7 @@ class CacheService:
             await self.redis.delete(key)
             return True
         except Exception as e:
-            logger.error(f'Ошибка удаления из кеша: {str(e)}')
+            logger.error('Ошибка удаления из кеша: {}', e)
             return False
 
     async def delete_pattern(self, pattern: str) -> bool:
@@ -83,26 +251,85 @@ class CacheService:
         if not self.redis:
             return False
         try:
-            keys = []
-            async for key in self.redis.scan_iter(match=pattern):
-                keys.append(key)
-            if keys:
-                await self.redis.delete(*keys)
+            deleted = 0
+            batch = []
+            async for key in self.redis.scan_iter(
+                match=pattern,
+                count=DELETE_BATCH_SIZE,
+            ):
+                batch.append(key)
+                if len(batch) >= DELETE_BATCH_SIZE:
+                    await self.redis.unlink(*batch)
+                    deleted += len(batch)
+                    batch = []
+            if batch:
+                await self.redis.unlink(*batch)
+                deleted += len(batch)
+            if deleted:
                 logger.info(
-                    f'Удалено ключей по шаблону {pattern}: {len(keys)}',
+                    'Удалено ключей по шаблону {}: {}',
+                    pattern,
+                    deleted,
                 )
             return True
         except Exception as e:
-            logger.error(f'Ошибка удаления по шаблону: {str(e)}')
+            logger.error('Ошибка удаления по шаблону: {}', e)
             return False
 
+    async def invalidate_tag(self, tag: str) -> bool:
+        """Удаление всех ключей, сохранённых с указанным тегом."""
+        if not self.redis:
+            return False
+        try:
+            index_key = self._tag_index_key(tag)
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.smembers(index_key)
+                pipe.delete(index_key)
+                keys, _ = await pipe.execute()
+            if keys:
+                await self.redis.delete(*keys)
+                logger.info('Удалено ключей по тегу {}: {}', tag, len(keys))
+            return True
+        except Exception as e:
+            logger.error('Ошибка удаления по тегу: {}', e)
+            return False
+
+    @staticmethod
+    def _tag_index_key(tag: str) -> str:
+        """Ключ множества, в котором хранятся ключи тега."""
+        return f'{tag}:index'
+
     async def clear_dishes_cache(self) -> None:
         """Очистка кеша блюд."""
         await self.delete_pattern('dishes:*')
 
     async def clear_actions_cache(self) -> None:
-        """Очистка кеша акций."""
-        await self.delete_pattern('actions:*')
+        """Очистка кеша акций в Redis и в памяти воркера."""
+        await self.invalidate_tag(ACTIONS_CACHE_TAG)
+        self.local_actions.clear()
+
+    async def clear_bookings_cache(self) -> None:
+        """Очистка кеша бронирований."""
+        await self.invalidate_tag(BOOKINGS_CACHE_TAG)
+
+    @staticmethod
+    def current_user_key(user_id: UUID | str) -> str:
+        """Ключ кеша пользователя, найденного по токену."""
+        return f'users:auth:{user_id}'
+
+    async def clear_current_user_cache(self, user_id: UUID) -> None:
+        """Очистка кеша пользователя, найденного по токену."""
+        await self.delete(self.current_user_key(user_id))
+
+    async def clear_slots_cache(self, *cafe_ids: UUID) -> None:
+        """Очистка кеша временных слотов указанных кафе."""
+        for cafe_id in set(cafe_ids):
+            await self.invalidate_tag(f'{SLOTS_CACHE_TAG}:{cafe_id}')
+
+    async def clear_tables_cache(self, *cafe_ids: UUID) -> None:
+        """Очистка кеша столов указанных кафе."""
+        for cafe_id in set(cafe_ids):
+            await self.invalidate_tag(f'{TABLES_CACHE_TAG}:{cafe_id}')
 
     async def get_with_debug(
         self,
@@ -111,7 +338,7 @@ class CacheService:
     ) -> Optional[Any]:
         """Версия get с расширенным дебагом."""
         if not self.redis:
-            logger.warning(f'Redis не подключен при запросе {key}')
+            logger.warning('Redis не подключен при запросе {}', key)
             return None
         try:
             start_time: datetime = datetime.now()
@@ -121,20 +348,23 @@ class CacheService:
             ).total_seconds() * 1000
             if data:
                 logger.debug(
-                    f'Кеш попадание: {key} | '
-                    f'размер: {len(data)} байт | '
-                    f'время: {request_time:.2f}мс | '
-                    f'контекст: {debug_context}',
+                    'Кеш попадание: {} | размер: {} байт | '
+                    'время: {:.2f}мс | контекст: {}',
+                    key,
+                    len(data),
+                    request_time,
+                    debug_context,
                 )
-                return json.loads(data)
+                return from_json(data)
             logger.debug(
-                f'Кеш промах: {key} | '
-                f'время: {request_time:.2f}мс | '
-                f'контекст: {debug_context}',
+                'Кеш промах: {} | время: {:.2f}мс | контекст: {}',
+                key,
+                request_time,
+                debug_context,
             )
             return None
         except Exception as e:
-            logger.error(f'Ошибка получения из кеша {key}: {str(e)}')
+            logger.error('Ошибка получения из кеша {}: {}', key, e)
             return None
 
     async def set_with_debug(
@@ -146,10 +376,10 @@ class CacheService:
     ) -> bool:
         """Версия set с расширенным дебагом."""
         if not self.redis:
-            logger.warning(f'Redis не подключен при сохранении {key}')
+            logger.warning('Redis не подключен при сохранении {}', key)
             return False
         try:
-            serialized_value: str = json.dumps(value, default=str)
+            serialized_value: bytes = to_json(value, fallback=str)
             expire_time: int = ttl or self.ttl
             start_time: datetime = datetime.now()
             result = await self.redis.setex(key, expire_time, serialized_value)
@@ -158,17 +388,19 @@ class CacheService:
             ).total_seconds() * 1000
             if result:
                 logger.debug(
-                    f'Успешно сохранено в кеш: {key} | '
-                    f'размер: {len(serialized_value)} байт | '
-                    f'TTL: {expire_time}сек | '
-                    f'время: {request_time:.2f}мс | '
-                    f'контекст: {debug_context}',
+                    'Успешно сохранено в кеш: {} | размер: {} байт | '
+                    'TTL: {}сек | время: {:.2f}мс | контекст: {}',
+                    key,
+                    len(serialized_value),
+                    expire_time,
+                    request_time,
+                    debug_context,
                 )
             else:
-                logger.warning(f'Не удалось сохранить в кеш: {key}')
+                logger.warning('Не удалось сохранить в кеш: {}', key)
             return bool(result)
         except Exception as e:
-            logger.error(f'Ошибка сохранения в кеш {key}: {str(e)}')
+            logger.error('Ошибка сохранения в кеш {}: {}', key, e)
             return False
 
 
@@ -0,0 +1,57 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+import anyio
+from PIL import Image
+from loguru import logger
+
+from app.core.constants import IMAGE_POOL_WORKERS
+
+T = TypeVar('T')
+
+
+def _init_worker() -> None:
+    """Загружает плагины Pillow один раз при старте процесса."""
+    Image.init()
+
+
+class ImagePool:
+    """Пул процессов для обработки изображений в обход GIL."""
+
+    def __init__(self, max_workers: int = IMAGE_POOL_WORKERS) -> None:
+        """."""
+        self.max_workers = max_workers
+        self.executor: Optional[ProcessPoolExecutor] = None
+        # Ограничивает очередь задач, чтобы не копить загрузки в памяти
+        self.semaphore = asyncio.Semaphore(max_workers)
+
+    def start(self) -> None:
+        """Запуск пула процессов."""
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context('forkserver'),
+            initializer=_init_worker,
+        )
+        logger.info(
+            'Пул обработки изображений: {} процессов',
+            self.max_workers,
+        )
+
+    def shutdown(self) -> None:
+        """Остановка пула процессов."""
+        if self.executor:
+            self.executor.shutdown(cancel_futures=True)
+            self.executor = None
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """Выполняет функцию в пуле или в потоке, если пул не запущен."""
+        async with self.semaphore:
+            if self.executor is None:
+                return await anyio.to_thread.run_sync(func, *args)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, func, *args)
+
+
+image_pool = ImagePool()
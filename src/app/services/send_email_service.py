@@ -4,8 +4,8 @@ from uuid import UUID
 
 from loguru import logger
 
-from app.core.db import DbSession
-from app.repositories.booking import booking_repository
+from app.core.exceptions import DomainValidationError
+from app.models import Booking, User
 from app.services.notification import send_notification_task
 
 
@@ -31,34 +31,29 @@ class NotificationService:
 
     @staticmethod
     async def send_booking_created_notification(
-        session: DbSession,
-        booking_id: UUID,
-        current_user_id: UUID,
+        booking: Booking,
+        current_user: User,
     ) -> None:
-        """Отправляет уведомление о создании бронирования."""
+        """Отправляет уведомление о создании бронирования.
+
+        Бронирование передается с уже загруженными связями (пользователь,
+        кафе с менеджерами, столы и слоты), дополнительных запросов нет.
+        """
+        booking_id = booking.id
         try:
-            booking = await booking_repository.get_with_relations(
-                session,
-                booking_id,
-            )
-            if not booking:
-                logger.warning(
-                    f'Бронирование {booking_id} не найдено для '
-                    'уведомления о создании',
-                )
-                return
             user_email = booking.user.email
             manager_emails = [
                 manager.email
                 for manager in booking.cafe.managers
-                if manager.email and manager.id != current_user_id
+                if manager.email and manager.id != current_user.id
             ]
             emails = [user_email] + manager_emails
             emails = [email for email in emails if email]
             if not emails:
                 logger.warning(
-                    f'Нет email для отправки уведомления о создании '
-                    f'бронирования {booking_id}',
+                    'Нет email для отправки уведомления о создании '
+                    'бронирования {}',
+                    booking_id,
                 )
                 return
             subject = 'Новое бронирование'
@@ -92,46 +87,41 @@ class NotificationService:
                 subject=subject,
             )
             logger.info(
-                f'Уведомление о создании бронирования {booking_id} '
-                'поставлено в очередь',
+                'Уведомление о создании бронирования {} поставлено в очередь',
+                booking_id,
             )
         except Exception as e:
             logger.error(
-                f'Ошибка отправки уведомления о создании бронирования '
-                f'{booking_id}: {str(e)}',
+                'Ошибка отправки уведомления о создании бронирования {}: {}',
+                booking_id,
+                e,
             )
             raise
 
     @staticmethod
     async def send_booking_updated_notification(
-        session: DbSession,
-        booking_id: UUID,
-        current_user_id: UUID,
+        booking: Booking,
+        current_user: User,
     ) -> None:
-        """Отправляет уведомление об изменении бронирования."""
+        """Отправляет уведомление об изменении бронирования.
+
+        Бронирование передается с уже загруженными связями.
+        """
+        booking_id = booking.id
         try:
-            booking = await booking_repository.get_with_relations(
-                session,
-                booking_id,
-            )
-            if not booking:
-                logger.warning(
-                    f'Бронирование {booking_id} не найдено для '
-                    'уведомления об изменении',
-                )
-                return
             user_email = booking.user.email
             manager_emails = [
                 manager.email
                 for manager in booking.cafe.managers
-                if manager.email and manager.id != current_user_id
+                if manager.email and manager.id != current_user.id
             ]
             emails = [user_email] + manager_emails
             emails = [email for email in emails if email]
             if not emails:
                 logger.warning(
-                    f'Нет email для отправки уведомления об изменении '
-                    f'бронирования {booking_id}',
+                    'Нет email для отправки уведомления об изменении '
+                    'бронирования {}',
+                    booking_id,
                 )
                 return
             subject = 'Изменение бронирования'
@@ -165,37 +155,30 @@ class NotificationService:
                 subject=subject,
             )
             logger.info(
-                f'Уведомление об изменении бронирования {booking_id} '
+                'Уведомление об изменении бронирования {} '
                 'поставлено в очередь',
+                booking_id,
             )
         except Exception as e:
             logger.error(
-                f'Ошибка отправки уведомления об изменении бронирования '
-                f'{booking_id}: {str(e)}',
+                'Ошибка отправки уведомления об изменении бронирования {}: {}',
+                booking_id,
+                e,
             )
             raise
 
     @staticmethod
     async def send_booking_reminder(
-        session: DbSession,
-        booking_id: UUID,
+        booking: Booking,
         reminder_minutes: int = 60,
     ) -> None:
-        """Отправляет напоминание о бронировании."""
+        """Отправляет напоминание о бронировании с загруженными связями."""
+        booking_id = booking.id
         try:
-            booking = await booking_repository.get_with_relations(
-                session,
-                booking_id,
-            )
-            if not booking:
-                logger.warning(
-                    f'Бронирование {booking_id} не найдено для напоминания',
-                )
-                return
             if not booking.user.email:
                 logger.warning(
-                    f'У пользователя бронирования {booking_id} нет email '
-                    'для напоминания',
+                    'У пользователя бронирования {} нет email для напоминания',
+                    booking_id,
                 )
                 return
             subject = (
@@ -228,7 +211,7 @@ class NotificationService:
                     f'для бронирования {booking_id}'
                 )
                 logger.error(error_msg)
-                raise ValueError(error_msg)
+                raise DomainValidationError(error_msg)
             send_notification_task(
                 emails=[booking.user.email],
                 text=text,
@@ -236,14 +219,16 @@ class NotificationService:
                 eta=reminder_time,
             )
             logger.info(
-                f'Напоминание о бронировании {booking_id} запланировано '
-                f'на {reminder_time}',
+                'Напоминание о бронировании {} запланировано на {}',
+                booking_id,
+                reminder_time,
             )
-        except ValueError:
+        except DomainValidationError:
             raise
         except Exception as e:
             logger.error(
-                f'Ошибка отправки напоминания о бронировании {booking_id}: '
-                f'{str(e)}',
+                'Ошибка отправки напоминания о бронировании {}: {}',
+                booking_id,
+                e,
             )
             raise
@@ -1,6 +1,64 @@
-from typing import Any
+import hashlib
+from typing import Any, Optional
+
+from fastapi import Request, Response, status
+from pydantic import TypeAdapter
+
+from app.core.constants import JSON_CACHE_CONTROL
 
 
 def build_error(detail: Any, code: int) -> dict[str, Any]:
     """Формирует унифицированный ответ об ошибке для API."""
     return {'code': code, 'detail': str(detail) if detail is not None else ''}
+
+
+def orm_json_response(
+    adapter: TypeAdapter[Any],
+    data: Any,
+    status_code: int = status.HTTP_200_OK,
+) -> Response:
+    """Сериализует ORM-объекты через TypeAdapter сразу в JSON-ответ.
+
+    Минует jsonable_encoder и json.dumps, которые FastAPI применяет
+    к возвращаемым моделям.
+    """
+    return Response(
+        content=adapter.dump_json(
+            adapter.validate_python(data, from_attributes=True),
+        ),
+        status_code=status_code,
+        media_type='application/json',
+    )
+
+
+def _etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    """Проверяет, совпадает ли ETag с заголовком If-None-Match."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    return any(
+        tag.strip().removeprefix('W/') == etag
+        for tag in if_none_match.split(',')
+    )
+
+
+def json_response_with_etag(
+    request: Request,
+    content: str | bytes,
+) -> Response:
+    """Возвращает готовый JSON с ETag или 304, если клиент его уже имеет."""
+    if isinstance(content, str):
+        content = content.encode()
+    etag = f'"{hashlib.blake2b(content, digest_size=8).hexdigest()}"'
+    headers = {'ETag': etag, 'Cache-Control': JSON_CACHE_CONTROL}
+    if _etag_matches(etag, request.headers.get('if-none-match')):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers=headers,
+        )
+    return Response(
+        content=content,
+        media_type='application/json',
+        headers=headers,
+    )
@@ -0,0 +1,22 @@
+import os
+import time
+from uuid import UUID
+
+_UUID7_VERSION = 0x7 << 76
+_UUID7_VERSION_MASK = ~(0xF << 76)
+_UUID7_VARIANT = 0x2 << 62
+_UUID7_VARIANT_MASK = ~(0x3 << 62)
+
+
+def uuid7() -> UUID:
+    """Генерирует упорядоченный по времени UUIDv7 (RFC 9562).
+
+    Старшие 48 бит — миллисекунды Unix-времени, поэтому новые ключи
+    попадают в правый лист B-tree индекса, а не в случайную страницу.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(
+        os.urandom(10),
+    )
+    value = value & _UUID7_VERSION_MASK | _UUID7_VERSION
+    value = value & _UUID7_VARIANT_MASK | _UUID7_VARIANT
+    return UUID(int=value)
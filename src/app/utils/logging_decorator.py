@@ -1,23 +1,22 @@
-import json
 from functools import wraps
 from typing import Any, Callable
 
 from loguru import logger
 
 
-def _serialize(obj: Any, only_set: bool = True) -> dict | None:
-    """Сериализует объект Pydantic в словарь для логирования."""
-    if hasattr(obj, 'model_dump'):
-        try:
-            return obj.model_dump(
-                mode='json',
-                exclude_none=True,
-                exclude_unset=only_set,
-            )
-        except Exception as e:
-            logger.debug(
-                f'Ошибка сериализации модели {e}',
-            )
+def _serialize(obj: Any, only_set: bool = True) -> str | None:
+    """Сериализует объект Pydantic в JSON-строку для логирования."""
+    try:
+        return obj.model_dump_json(
+            indent=4,
+            exclude_none=True,
+            exclude_unset=only_set,
+        )
+    except Exception as e:
+        logger.debug(
+            'Ошибка сериализации модели {}',
+            e,
+        )
     return None
 
 
@@ -46,33 +45,26 @@ def event_logger(
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            parameters = next(
-                (
-                    data
-                    for data in (
-                        _serialize(v, only_set) for v in kwargs.values()
-                    )
-                    if data is not None
-                ),
+            payload = next(
+                (v for v in kwargs.values() if hasattr(v, 'model_dump')),
                 None,
             )
             try:
                 result = await func(*args, **kwargs)
-                if parameters is not None:
-                    formatted_params = json.dumps(
-                        parameters,
-                        ensure_ascii=False,
-                        indent=4,
-                    )
-                    logger.info(
-                        f'{event_type} запись в таблице "{table_name}", '
-                        f'с параметрами:\n{formatted_params}',
+                if payload is not None:
+                    # Модель сериализуется, только если INFO не отсечён;
+                    # запись в sinks уходит в фоновый поток (enqueue=True)
+                    logger.opt(lazy=True).info(
+                        '{} запись в таблице "{}", с параметрами:\n{}',
+                        lambda: event_type,
+                        lambda: table_name,
+                        lambda: _serialize(payload, only_set),
                     )
                 return result
             except Exception:
                 logger.error(
-                    f'Произошла ошибка при выполнении операции с '
-                    f'таблицей "{table_name}"',
+                    'Произошла ошибка при выполнении операции с таблицей "{}"',
+                    table_name,
                 )
                 raise
 